@@ -0,0 +1 @@
+"""Benchmarks for the Warframe Stats integration."""
@@ -0,0 +1,131 @@
+"""Check config entries sharing a worldstate coordinator keep their own options.
+
+Sets up two entries following the same platform and language of an
+in-process stand-in, so they share one worldstate coordinator and socket,
+with different Reward Watchlists, Frame Intervals and Record WebSocket
+Frames. Every entry must get a Watchlist sensor matching its own items,
+and unloading one must leave the other untouched:
+
+    python -m benchmarks.entries
+
+Exits non-zero when a check fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import shutil
+import sys
+import tempfile
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.warframe.const import (
+    CONF_FRAME_INTERVAL,
+    CONF_RECORD_FRAMES,
+    CONF_WATCHLIST,
+    CONF_WORLDSTATES,
+    DOMAIN,
+)
+from custom_components.warframe.watchlist import _rewards
+
+from . import fixtures, harness, standin
+
+
+def _watched_rewards():
+    """Return two rewards of the stand-in worldstate to watch."""
+    rewards = []
+    for _, reward, _ in _rewards(fixtures.load(fixtures.WORLDSTATE_FIXTURE)):
+        if reward and reward not in rewards:
+            rewards.append(reward)
+    if len(rewards) < 2:
+        raise RuntimeError("The worldstate fixture has fewer than two rewards")
+    return rewards[:2]
+
+
+def _watchlist_state(hass, entry):
+    """Return the state of the Watchlist sensor of an entry."""
+    entity_registry = er.async_get(hass)
+    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if entity.unique_id.startswith("sensor.warframe_worldstate_watchlist"):
+            return hass.states.get(entity.entity_id)
+    return None
+
+
+async def _async_run(args):
+    first, second = _watched_rewards()
+    runner, base_url = await standin.async_start(standin.parse_args(["--port", "0"]))
+    config_dir = tempfile.mkdtemp()
+    hass = await harness.async_start_hass(config_dir)
+    failures = []
+
+    def check(name, passed):
+        print(f"{'ok' if passed else 'FAIL'}  {name}")
+        if not passed:
+            failures.append(name)
+
+    try:
+        entries = [
+            await harness.async_add_entry(
+                hass,
+                harness.standin_data(
+                    base_url, {CONF_WORLDSTATES: True, CONF_WATCHLIST: [first], CONF_FRAME_INTERVAL: 10}
+                ),
+            ),
+            await harness.async_add_entry(
+                hass,
+                harness.standin_data(
+                    base_url,
+                    {
+                        CONF_WORLDSTATES: True,
+                        CONF_WATCHLIST: [second],
+                        CONF_FRAME_INTERVAL: args.frame_interval,
+                        CONF_RECORD_FRAMES: True,
+                    },
+                ),
+            ),
+        ]
+        check("both entries set up", all(entry.state is ConfigEntryState.LOADED for entry in entries))
+        coordinators = [hass.data[DOMAIN][entry.entry_id]["coordinator"][1] for entry in entries]
+        coordinator = coordinators[0]
+        check("the entries share the worldstate coordinator", coordinators[0] is coordinators[1])
+
+        states = [_watchlist_state(hass, entry) for entry in entries]
+        check("every entry has a Watchlist sensor", all(state is not None for state in states))
+        if all(state is not None for state in states):
+            check("the first entry matches its own watchlist", states[0].attributes.get("items") == [first])
+            check("the second entry matches its own watchlist", states[1].attributes.get("items") == [second])
+        check("frames are processed at the shortest interval", coordinator.frame_interval == args.frame_interval)
+        check("frames are recorded for the second entry", coordinator._recorder is not None)
+
+        await hass.config_entries.async_unload(entries[1].entry_id)
+        await hass.async_block_till_done()
+        check("the first entry keeps its watchlist", list(coordinator.watchlists) == [entries[0].entry_id])
+        check("the first entry keeps its interval", coordinator.frame_interval == 10)
+        check("frames are no longer recorded", coordinator._recorder is None)
+        await hass.config_entries.async_unload(entries[0].entry_id)
+        await hass.async_block_till_done()
+    finally:
+        await hass.async_stop(force=True)
+        await runner.cleanup()
+        shutil.rmtree(config_dir, ignore_errors=True)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--frame-interval", type=float, default=0.5, help="Frame Interval of the second entry (default 0.5)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if asyncio.run(_async_run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""Recorded payloads used by the Warframe Stats benchmarks.
+
+Fixtures are stored gzipped in ``benchmarks/fixtures``. They can be recorded
+from the live APIs or synthesized offline with the same shape:
+
+    python -m benchmarks.fixtures record --account-id <id> --account-id <id>
+    python -m benchmarks.fixtures synthesize
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+from pathlib import Path
+import random
+import urllib.request
+
+from custom_components.warframe.const import (
+    ITEM_SETS_TO_INCLUDE,
+    URL_BASE,
+    URL_RAW_BASE,
+    URL_RAW_PROFILE_ENDPOINT,
+    URL_RAW_PROFILE_QUERY_PARAMS,
+    URL_STATIC_DATA_LOOKUP,
+    URL_STATIC_DATA_LOOKUP_QUERY_PARAMS,
+    URL_WORLD_STATE_ENDPOINT,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+WORLDSTATE_FIXTURE = "worldstate_pc.json.gz"
+CATALOG_FIXTURE = "items_search.json.gz"
+PROFILE_LARGE_FIXTURE = "profile_large.json.gz"
+PROFILE_SMALL_FIXTURE = "profile_small.json.gz"
+
+
+def load_raw(name):
+    """Return the undecoded bytes of a fixture."""
+    with gzip.open(FIXTURES_DIR / name, "rb") as fixture:
+        return fixture.read()
+
+
+def load(name):
+    """Return a decoded fixture."""
+    return json.loads(load_raw(name))
+
+
+def _save(name, data):
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    # mtime=0 keeps re-generated fixtures byte for byte identical
+    with gzip.GzipFile(FIXTURES_DIR / name, "wb", mtime=0) as fixture:
+        fixture.write(json.dumps(data, separators=(",", ":")).encode())
+
+
+def _fetch(url):
+    with urllib.request.urlopen(url, timeout=120) as response:
+        return json.loads(response.read())
+
+
+def record(account_ids):
+    """Record every fixture from the live APIs."""
+    _save(WORLDSTATE_FIXTURE, _fetch(f"{URL_BASE}{URL_WORLD_STATE_ENDPOINT}"))
+    _save(CATALOG_FIXTURE, _fetch(
+        f"{URL_BASE}{URL_STATIC_DATA_LOOKUP}{','.join(ITEM_SETS_TO_INCLUDE)}{URL_STATIC_DATA_LOOKUP_QUERY_PARAMS}"
+    ))
+    profiles = [
+        _fetch(f"{URL_RAW_BASE}{URL_RAW_PROFILE_ENDPOINT}{URL_RAW_PROFILE_QUERY_PARAMS}{account_id}")
+        for account_id in account_ids
+    ]
+    profiles.sort(key=lambda profile: len(json.dumps(profile)))
+    _save(PROFILE_SMALL_FIXTURE, profiles[0])
+    _save(PROFILE_LARGE_FIXTURE, profiles[-1])
+
+
+class _Synthesizer:
+    """Deterministic payloads shaped like the warframestat.us responses."""
+
+    SYLLABLES = ["ka", "ra", "zu", "mi", "tor", "vel", "qua", "nyx", "ash", "lo", "bra", "sen", "dek", "ul", "fen", "gor"]
+    FACTIONS = ["Grineer", "Corpus", "Infested", "Orokin", "Murmur"]
+    MISSION_TYPES = ["Exterminate", "Capture", "Defense", "Survival", "Mobile Defense", "Interception", "Spy", "Rescue", "Sabotage", "Disruption"]
+    TIERS = ["Lith", "Meso", "Neo", "Axi", "Requiem", "Omnia"]
+    CATEGORY_COUNTS = {
+        "Warframes": 110,
+        "Primary": 420,
+        "Secondary": 320,
+        "Melee": 430,
+        "Arch-Gun": 30,
+        "Arch-Melee": 15,
+        "Archwing": 8,
+        "Sentinels": 20,
+        "Pets": 60,
+        "Enemy": 900,
+        "Node": 650,
+    }
+
+    def __init__(self, seed=30):
+        self.random = random.Random(seed)
+
+    def word(self, syllables=3):
+        return "".join(self.random.choice(self.SYLLABLES) for _ in range(syllables)).capitalize()
+
+    def sentence(self, words):
+        return " ".join(self.word(self.random.randint(1, 3)).lower() for _ in range(words)).capitalize() + "."
+
+    def date(self):
+        return f"20{self.random.randint(13, 25)}-{self.random.randint(1, 12):02d}-{self.random.randint(1, 28):02d}"
+
+    def unique_name(self, category, name):
+        match category:
+            case "Warframes":
+                return f"/Lotus/Powersuits/{name}/{name}"
+            case "Primary":
+                return f"/Lotus/Weapons/Tenno/LongGuns/{name}/{name}Weapon"
+            case "Secondary":
+                return f"/Lotus/Weapons/Tenno/Pistols/{name}/{name}Pistol"
+            case "Melee":
+                return f"/Lotus/Weapons/Tenno/Melee/{name}/{name}Blade"
+            case "Arch-Gun":
+                return f"/Lotus/Weapons/Tenno/Archwing/Primary/{name}/{name}Gun"
+            case "Arch-Melee":
+                return f"/Lotus/Weapons/Tenno/Archwing/Melee/{name}/{name}Melee"
+            case "Archwing":
+                return f"/Lotus/Powersuits/Archwing/{name}/{name}Archwing"
+            case "Sentinels":
+                return f"/Lotus/Types/Sentinels/SentinelPowersuits/{name}Powersuit"
+            case "Pets":
+                return f"/Lotus/Types/Game/KubrowPet/{name}KubrowPetPowerSuit"
+            case "Enemy":
+                return f"/Lotus/Types/Enemies/{self.random.choice(self.FACTIONS)}/{name}Avatar"
+        return f"SolNode{name}"
+
+    def catalog(self):
+        items = []
+        for category, count in self.CATEGORY_COUNTS.items():
+            for index in range(count):
+                name = self.word() if category != "Node" else str(index)
+                is_prime = category not in ("Enemy", "Node") and self.random.random() < 0.25
+                display_name = f"{name} Prime" if is_prime else name
+                unique_name = self.unique_name(category, name + ("Prime" if is_prime else ""))
+                item = {
+                    "uniqueName": unique_name,
+                    "name": display_name if category != "Node" else f"{self.word(2)} ({self.word(2)})",
+                    "description": self.sentence(self.random.randint(8, 30)),
+                    "category": category,
+                    "type": "Pet" if category == "Pets" and self.random.random() < 0.7 else category.rstrip("s"),
+                    "tradable": self.random.random() < 0.5,
+                    "imageName": f"{name.lower()}.png",
+                    "masteryReq": self.random.randint(0, 16),
+                }
+                if category == "Node":
+                    item["systemName"] = self.word(2)
+                    item["faction"] = self.random.choice(self.FACTIONS)
+                    item["missionType"] = self.random.choice(self.MISSION_TYPES)
+                elif category != "Enemy":
+                    item["isPrime"] = is_prime
+                    item["releaseDate"] = self.date()
+                    item["patchlogs"] = [
+                        {"name": f"Hotfix {self.random.randint(20, 39)}.{self.random.randint(0, 9)}", "date": self.date(), "changes": self.sentence(20)}
+                        for _ in range(self.random.randint(0, 4))
+                    ]
+                if category in ("Warframes", "Archwing"):
+                    item["abilities"] = [
+                        {
+                            "uniqueName": f"/Lotus/Powersuits/{name}/{ability}Ability",
+                            "name": ability,
+                            "description": self.sentence(15),
+                        }
+                        for ability in (self.word(2) for _ in range(4))
+                    ]
+                    item["components"] = [
+                        {"uniqueName": f"{unique_name}{part}", "name": part, "itemCount": 1, "drops": []}
+                        for part in ("Blueprint", "Chassis", "Neuroptics", "Systems")
+                    ]
+                items.append(item)
+        return items
+
+    def worldstate(self, catalog):
+        weapons = [item for item in catalog if item["category"] in ("Primary", "Secondary", "Melee")]
+        nodes = [item["name"] for item in catalog if item["category"] == "Node"]
+
+        def activation(index):
+            return {
+                "id": f"{index:024x}",
+                "activation": "2025-08-11T00:00:00.000Z",
+                "expiry": "2025-08-12T00:00:00.000Z",
+            }
+
+        return {
+            "timestamp": "2025-08-11T12:00:00.000Z",
+            "news": [
+                activation(index) | {"message": self.sentence(8), "date": f"2025-0{self.random.randint(1, 8)}-{self.random.randint(10, 28)}T00:00:00.000Z", "update": index % 5 == 0, "link": "https://www.warframe.com/"}
+                for index in range(30)
+            ],
+            "events": [
+                activation(index) | {"description": self.sentence(3), "node": self.random.choice(nodes), "rewards": [{"items": [self.word()], "credits": 0}]}
+                for index in range(3)
+            ],
+            "alerts": [
+                activation(index) | {"mission": {"node": self.random.choice(nodes), "type": self.random.choice(self.MISSION_TYPES), "faction": self.random.choice(self.FACTIONS), "reward": {"itemString": self.word(), "credits": 10000}}}
+                for index in range(4)
+            ],
+            "sortie": activation(0) | {
+                "boss": self.word(),
+                "faction": self.random.choice(self.FACTIONS),
+                "variants": [
+                    {"node": self.random.choice(nodes), "missionType": self.random.choice(self.MISSION_TYPES), "modifier": self.sentence(3), "modifierDescription": self.sentence(12)}
+                    for _ in range(3)
+                ],
+            },
+            "archonHunt": activation(1) | {
+                "boss": f"Archon {self.word(2)}",
+                "missions": [{"node": self.random.choice(nodes), "type": self.random.choice(self.MISSION_TYPES)} for _ in range(3)],
+            },
+            "syndicateMissions": [
+                activation(index) | {
+                    "syndicate": syndicate,
+                    "nodes": [],
+                    "jobs": [
+                        {
+                            "id": f"{syndicate}{job}",
+                            "type": self.sentence(2),
+                            "enemyLevels": [5 * job, 5 * job + 10],
+                            "standingStages": [1000 * job] * 4,
+                            "rewardPool": [self.word() for _ in range(8)] + ["Theorem Infection"],
+                        }
+                        for job in range(1, 8)
+                    ],
+                }
+                for index, syndicate in enumerate(["Ostrons", "Solaris United", "Entrati", "The Holdfasts", "Cephalon Simaris", "Arbiters of Hexis"])
+            ],
+            "fissures": [
+                activation(index) | {
+                    "node": self.random.choice(nodes),
+                    "missionType": self.random.choice(self.MISSION_TYPES),
+                    "enemy": self.random.choice(self.FACTIONS),
+                    "tier": self.random.choice(self.TIERS),
+                    "tierNum": self.random.randint(1, 6),
+                    "expired": False,
+                    "isStorm": index % 7 == 0,
+                    "isHard": index % 3 == 0 and index % 7 != 0,
+                }
+                for index in range(45)
+            ],
+            "invasions": [
+                activation(index) | {
+                    "node": self.random.choice(nodes),
+                    "desc": self.sentence(3),
+                    "rewardTypes": [self.word().lower()],
+                    "attacker": {"reward": {"itemString": self.word()}, "faction": "Grineer"},
+                    "defender": {"reward": {"itemString": self.word()}, "faction": "Corpus"},
+                    "completion": self.random.random() * 100,
+                    "completed": index % 6 == 0,
+                }
+                for index in range(12)
+            ],
+            "voidTrader": activation(2) | {
+                "character": "Baro'Ki Teel",
+                "location": "Larunda Relay (Mercury)",
+                "active": True,
+                "inventory": [
+                    {"uniqueName": item["uniqueName"], "item": item["name"], "ducats": self.random.randint(100, 700), "credits": self.random.randint(50000, 500000)}
+                    for item in self.random.sample(weapons, 40)
+                ],
+            },
+            "vaultTrader": activation(3) | {
+                "character": "Varzia",
+                "active": True,
+                "inventory": [
+                    {"uniqueName": item["uniqueName"], "item": item["name"].replace(" ", ""), "ducats": self.random.randint(1, 5), "credits": None}
+                    for item in self.random.sample(weapons, 30)
+                ],
+            },
+            "constructionProgress": {"id": "construction", "fomorianProgress": "42.10", "razorbackProgress": "13.37", "unknownProgress": "0.00"},
+            "steelPath": {"currentReward": {"name": "Umbra Forma Blueprint", "cost": 150}, "activation": "2025-08-11T00:00:00.000Z", "expiry": "2025-08-18T00:00:00.000Z"},
+            "deepArchimedea": activation(4) | {"missions": [{"mission": self.random.choice(self.MISSION_TYPES), "deviation": {}, "riskVariables": []} for _ in range(3)]},
+            "temporalArchimedea": activation(5) | {"missions": [{"mission": self.random.choice(self.MISSION_TYPES), "deviation": {}, "riskVariables": []} for _ in range(3)]},
+            "earthCycle": activation(6) | {"state": "day", "isDay": True},
+            "cetusCycle": activation(7) | {"state": "night", "isDay": False},
+            "vallisCycle": activation(8) | {"state": "cold", "isWarm": False},
+            "cambionCycle": activation(9) | {"state": "fass", "active": "fass"},
+            "zarimanCycle": activation(10) | {"state": "grineer", "isCorpus": False},
+            "duviriCycle": activation(11) | {"state": "joy", "choices": []},
+            "nightwave": activation(12) | {"activeChallenges": [{"id": str(index), "title": self.word(), "desc": self.sentence(10), "reputation": 1000} for index in range(12)]},
+            "arbitration": activation(13) | {"node": self.random.choice(nodes), "type": self.random.choice(self.MISSION_TYPES)},
+            "dailyDeals": [activation(14) | {"item": self.word(), "originalPrice": 300, "salePrice": 150, "total": 200, "sold": 10}],
+            "flashSales": [activation(15 + index) | {"item": self.word(), "premiumOverride": 0} for index in range(40)],
+            "simaris": {"target": self.word(), "isTargetActive": True},
+            "conclaveChallenges": [activation(60 + index) | {"description": self.sentence(6), "mode": "Any"} for index in range(15)],
+        }
+
+    def profile(self, catalog, name, fraction):
+        def sample(category):
+            items = [item for item in catalog if item["category"] in category]
+            return self.random.sample(items, max(1, int(len(items) * fraction)))
+
+        warframes = sample(("Warframes",))
+        return {
+            "Results": [{"DisplayName": f"{name}\ue000", "PlayerLevel": self.random.randint(1, 40), "AccountId": {"$oid": f"{self.random.getrandbits(96):024x}"}}],
+            "Stats": {
+                "Income": self.random.randint(10**6, 10**9),
+                "Deaths": self.random.randint(0, 5000),
+                "TimePlayedSec": self.random.random() * 10**7,
+                "MissionsCompleted": self.random.randint(0, 10**4),
+                "Abilities": [
+                    {"type": ability["uniqueName"], "used": self.random.randint(1, 10**5)}
+                    for warframe in warframes for ability in warframe.get("abilities", [])
+                ],
+                "Enemies": [
+                    {"type": enemy["uniqueName"], "kills": self.random.randint(0, 10**5), "deaths": self.random.choice([0, 0, 0, 1, 2]), "headshots": self.random.randint(0, 10**4), "executions": self.random.randint(0, 100), "assists": self.random.randint(0, 1000)}
+                    for enemy in sample(("Enemy",))
+                ],
+                "Scans": [
+                    {"type": enemy["uniqueName"], "scans": self.random.randint(1, 50)}
+                    for enemy in sample(("Enemy",))
+                ],
+                "Missions": [
+                    {"type": node["uniqueName"] + ("_HM" if self.random.random() < 0.3 else ""), "highScore": self.random.randint(0, 100)}
+                    for node in sample(("Node",))
+                ],
+                "Weapons": [
+                    {"type": item["uniqueName"], "equipTime": self.random.random() * 10**5, "xp": self.random.randint(0, 10**6), "fired": self.random.randint(0, 10**5), "hits": self.random.randint(0, 10**5), "kills": self.random.randint(0, 10**4), "headshots": self.random.randint(0, 10**3), "assists": 0}
+                    for item in warframes + sample(("Primary", "Secondary", "Melee", "Arch-Gun", "Arch-Melee", "Archwing", "Sentinels", "Pets"))
+                ],
+            },
+        }
+
+
+def synthesize():
+    """Write deterministic fixtures with the shape of the live APIs."""
+    synthesizer = _Synthesizer()
+    catalog = synthesizer.catalog()
+    _save(CATALOG_FIXTURE, catalog)
+    _save(WORLDSTATE_FIXTURE, synthesizer.worldstate(catalog))
+    _save(PROFILE_LARGE_FIXTURE, synthesizer.profile(catalog, "LargeTenno", 0.8))
+    _save(PROFILE_SMALL_FIXTURE, synthesizer.profile(catalog, "SmallTenno", 0.05))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record_parser = subparsers.add_parser("record", help="Record the fixtures from the live APIs")
+    record_parser.add_argument("--account-id", action="append", required=True, help="Account ID of a profile to record (at least a large and a small one)")
+    subparsers.add_parser("synthesize", help="Write synthetic fixtures without network access")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.account_id)
+    else:
+        synthesize()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Helpers shared by the benchmark and replay scripts."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+from types import MappingProxyType, SimpleNamespace
+
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.core import HomeAssistant
+from homeassistant import config_entries, loader
+from homeassistant.helpers import (
+    area_registry,
+    category_registry,
+    device_registry,
+    entity_registry,
+    floor_registry,
+    issue_registry,
+    label_registry,
+)
+from homeassistant.util import slugify
+
+from custom_components.warframe import sensor
+from custom_components.warframe.const import (
+    CONF_API_URL,
+    CONF_CONTENT_URL,
+    CONF_WEBSOCKET_URL,
+    DOMAIN,
+)
+from custom_components.warframe.coordinator import (
+    WarframeProfileDataUpdateCoordinator,
+    WarframeStaticDataUpdateCoordinator,
+    WarframeWorldstateDataUpdateCoordinator,
+)
+
+
+def summary(samples):
+    """Return the summary of nanosecond samples in microseconds."""
+    samples_us = [sample / 1000 for sample in samples]
+    return {
+        "repeat": len(samples_us),
+        "mean_us": statistics.fmean(samples_us),
+        "median_us": statistics.median(samples_us),
+        "min_us": min(samples_us),
+        "stdev_us": statistics.stdev(samples_us) if len(samples_us) > 1 else 0.0,
+    }
+
+
+def metadata():
+    """Return the metadata stored next to every result file."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "homeassistant": HA_VERSION,
+    }
+
+
+def compare(base, results, threshold):
+    """Print the median of every result against a base run and return the regressions."""
+    regressions = []
+    print(f"{'benchmark':70} {'base us':>12} {'new us':>12} {'ratio':>8}")
+    for name, result in results.items():
+        base_result = base.get("results", {}).get(name)
+        if base_result is None:
+            print(f"{name:70} {'-':>12} {result['median_us']:12.1f} {'new':>8}")
+            continue
+        ratio = result["median_us"] / base_result["median_us"] if base_result["median_us"] else float("inf")
+        flag = " *" if ratio > 1 + threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:70} {base_result['median_us']:12.1f} {result['median_us']:12.1f} {ratio:8.2f}{flag}")
+    return regressions
+
+
+async def async_start_hass(config_dir):
+    """Start a bare Home Assistant that can set up config entries.
+
+    Only the registries the sensor platform needs are loaded, the
+    integration is found through a ``custom_components`` link in
+    ``config_dir``.
+    """
+    os.symlink(Path(sensor.__file__).parents[1], Path(config_dir) / "custom_components")
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    for registry in (
+        area_registry,
+        category_registry,
+        device_registry,
+        entity_registry,
+        floor_registry,
+        issue_registry,
+        label_registry,
+    ):
+        await registry.async_load(hass)
+    await hass.async_start()
+    return hass
+
+
+def standin_data(base_url, data):
+    """Return entry data pointing every URL at a stand-in."""
+    return dict(data) | {
+        CONF_API_URL: base_url,
+        CONF_CONTENT_URL: base_url,
+        CONF_WEBSOCKET_URL: f"{base_url.replace('http', 'ws', 1)}socket",
+    }
+
+
+async def async_add_entry(hass, data):
+    """Add and set up a Warframe Stats config entry."""
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Warframe Stats",
+        data=data,
+        source=config_entries.SOURCE_USER,
+        options={},
+        unique_id=None,
+        discovery_keys=MappingProxyType({}),
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return entry
+
+
+def create_coordinators(hass, data):
+    """Return a stand-in entry and the three coordinators, without any network access."""
+    entry = SimpleNamespace(entry_id="benchmark", data=data)
+    static_data = WarframeStaticDataUpdateCoordinator(hass, entry)
+    worldstate = WarframeWorldstateDataUpdateCoordinator(hass, entry)
+    profile = WarframeProfileDataUpdateCoordinator(hass, entry, static_data)
+    return entry, static_data, worldstate, profile
+
+
+async def async_create_sensors(hass, entry, static_data, worldstate, profile):
+    """Create every sensor of the entry, ready to be updated outside of a platform."""
+    if entity_registry.DATA_REGISTRY not in hass.data:
+        # The platform looks up the unique ids other entries already use
+        await entity_registry.async_load(hass)
+    coordinators = [static_data, worldstate, profile]
+    hass.data[DOMAIN] = {
+        entry.entry_id: dict(entry.data) | {
+            "coordinator": coordinators,
+            # The entry owns every coordinator it was given
+            "owner": [coordinator is not None for coordinator in coordinators],
+        }
+    }
+    # Sensors are updated without an entity platform
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+    entities = []
+    await sensor.async_setup_entry(hass, entry, entities.extend)
+    for entity in entities:
+        entity.hass = hass
+        # The entity registry normally slugifies the suggested entity id
+        entity.entity_id = "sensor." + slugify(entity.entity_id.split(".", 1)[1])
+        if isinstance(entity, sensor.LastUpdateSensor):
+            # Keep the news sensor from scheduling catalog refreshes
+            entity.staticDataCoordinator = SimpleNamespace(catalog_version=0)
+    return entities
+
+
+def sensor_name(entity):
+    """Return a stable benchmark name for a sensor."""
+    if isinstance(entity, sensor.ProfileSensor):
+        name = f"sensor.{type(entity).__name__}[{entity.account_id}]"
+    else:
+        name = f"sensor.{type(entity).__name__}"
+    if isinstance(entity, sensor.MostUsedSensor):
+        name = f"{name}[{entity.type}]"
+    elif isinstance(entity, sensor.WorldSensor):
+        name = f"{name}[{entity.world_key}]"
+    elif isinstance(entity, sensor.FissureSensor):
+        name = f"{name}[{entity.fissure_type}]"
+    elif isinstance(entity, sensor.LeaderboardSensor):
+        name = f"{name}[{entity.leaderboard}]"
+    elif isinstance(entity, sensor.CatalogSensor):
+        name = f"{name}[{entity.stat}]"
+    elif isinstance(entity, sensor.MetricSensor):
+        name = f"{name}[{entity.coordinator.metrics.name}][{entity.metric}]"
+    return name
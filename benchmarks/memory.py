@@ -0,0 +1,236 @@
+"""Memory budget checks for the Warframe Stats integration.
+
+Measures the memory the integration keeps alive with tracemalloc, loading
+the recorded fixtures from an in-process stand-in (see ``benchmarks.standin``):
+
+* ``memory.static_lookup`` - the static item lookup (``name_lookup``), without
+  the two cases below
+* ``memory.catalog_index`` - the catalog search index
+* ``memory.catalog_join`` - the join from trader items to the catalog
+* ``memory.worldstate`` - one worldstate packet
+* ``memory.profiles`` - ``--profiles`` tracked profiles and the leaderboards
+* ``memory.refresh_growth`` - growth over ``--cycles`` refreshes of every coordinator
+* ``memory.reload_growth`` - growth over ``--reloads`` reloads of the config entry
+
+The reloads also check that the open WebSockets, asyncio tasks and event bus
+listeners stay flat, and that unloading the entry leaves none of them (or
+the entry's ``hass.data``) behind.
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --reloads 100 --output memory.json
+
+Every case has a budget in KiB and the script exits with 1 when one is
+exceeded, so a change that doubles a footprint fails before it reaches users.
+The budgets were measured against the synthesized fixtures on Python 3.12
+with about 50% headroom, update them together with the fixtures.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import sys
+import tempfile
+import tracemalloc
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.helpers.entity_platform import DATA_ENTITY_PLATFORM
+
+from custom_components.warframe.catalog import WarframeCatalogJoin
+from custom_components.warframe.const import (
+    CONF_LEADERBOARDS,
+    CONF_PROFILES,
+    CONF_WORLDSTATES,
+    DOMAIN,
+)
+from custom_components.warframe.search import WarframeCatalogIndex
+from custom_components.warframe.session import async_get_session
+from custom_components.warframe.websocket import DATA_WORLDSTATE_SOCKETS
+
+from . import fixtures, harness, standin
+
+BUDGETS_KIB = {
+    "memory.static_lookup": 2432,
+    "memory.catalog_index": 800,
+    "memory.catalog_join": 320,
+    "memory.worldstate": 320,
+    "memory.profiles": 14336,
+    "memory.refresh_growth": 256,
+    "memory.reload_growth": 512,
+}
+# Cycles and reloads left out of the growth, caches fill up during these
+WARMUP = 3
+
+
+def _counts(hass):
+    """Return the resources an entry holds that must not pile up on reloads."""
+    sockets = hass.data.get(DATA_WORLDSTATE_SOCKETS, {}).values()
+    # The in-process stand-in serves its connections from tasks of its own
+    tasks = [
+        task for task in asyncio.all_tasks()
+        if not getattr(task.get_coro(), "__qualname__", "").startswith("RequestHandler.")
+    ]
+    return {
+        "sockets": sum(worldstate_socket.connected for worldstate_socket in sockets),
+        "tasks": len(tasks),
+        "listeners": sum(hass.bus.async_listeners().values()),
+    }
+
+
+def _traced():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+async def _async_retained(func):
+    """Return the bytes still allocated after awaiting ``func``."""
+    before = _traced()
+    await func()
+    return _traced() - before
+
+
+async def _async_growth(hass, func, repeat):
+    """Return the bytes allocated between the end of the warm up and the last call.
+
+    The counts of ``_counts`` at the end of the warm up and after the last
+    call are returned with it.
+    """
+    sizes = []
+    counts = []
+    for _ in range(WARMUP + repeat):
+        await func()
+        # Write out delayed saves now, the registries cache their JSON on the
+        # first save which would otherwise land in a random cycle
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        sizes.append(_traced())
+        counts.append(_counts(hass))
+    return sizes[-1] - sizes[WARMUP - 1], counts[WARMUP - 1], counts[-1]
+
+
+async def _async_run(args):
+    runner, base_url = await standin.async_start(
+        standin.parse_args(["--port", "0", "--frame-interval", str(args.frame_interval)])
+    )
+    hass = await harness.async_start_hass(tempfile.mkdtemp())
+    # The session is shared by every case, keep it out of the first one
+    async_get_session(hass)
+    account_ids = [f"memory{index}" for index in range(args.profiles)]
+    data = harness.standin_data(
+        base_url, {CONF_WORLDSTATES: True, CONF_PROFILES: account_ids, CONF_LEADERBOARDS: True}
+    )
+    results = {}
+    leaks = {}
+
+    tracemalloc.start()
+    try:
+        entry, static_data, worldstate, profile = harness.create_coordinators(hass, data)
+        results["memory.static_lookup"] = await _async_retained(static_data.async_refresh)
+        # Built again from the lookup to be measured apart from it
+        for name, build in (
+            ("memory.catalog_index", WarframeCatalogIndex),
+            ("memory.catalog_join", WarframeCatalogJoin),
+        ):
+            before = _traced()
+            built = build(static_data.name_lookup)
+            results[name] = _traced() - before
+            results["memory.static_lookup"] -= results[name]
+            del built
+        world_state_data = fixtures.load(fixtures.WORLDSTATE_FIXTURE)
+        frame = json.dumps(
+            {"event": "ws:update", "packet": {"language": "en", "platform": "pc", "data": world_state_data}}
+        )
+        del world_state_data
+
+        async def handle_frame(worldstate=worldstate, frame=frame):
+            worldstate._handle_frame(frame)
+
+        results["memory.worldstate"] = await _async_retained(handle_frame)
+        results["memory.profiles"] = await _async_retained(profile.async_refresh)
+        del entry, static_data, worldstate, profile, frame, handle_frame
+
+        entry = await harness.async_add_entry(hass, data)
+
+        async def refresh():
+            for coordinator in hass.data[DOMAIN][entry.entry_id]["coordinator"]:
+                await coordinator.async_refresh()
+            await hass.async_block_till_done()
+
+        results["memory.refresh_growth"], _, _ = await _async_growth(hass, refresh, args.cycles)
+
+        async def reload():
+            await hass.config_entries.async_reload(entry.entry_id)
+            await hass.async_block_till_done()
+            # Home Assistant keeps the emptied entity platform of every unload
+            # (it is reset, never destroyed), leave it out of the growth
+            platforms = hass.data[DATA_ENTITY_PLATFORM][DOMAIN]
+            platforms[:] = [platform for platform in platforms if platform.entities]
+            # Restored snapshots are revalidated in the background, refresh
+            # so every reload ends with the same data whatever the timing
+            await refresh()
+
+        results["memory.reload_growth"], before, after = await _async_growth(hass, reload, args.reloads)
+        for name, count in before.items():
+            leaks[f"reload.{name}"] = {"before": count, "after": after[name]}
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        unloaded = _counts(hass)
+        leaks["unload.sockets"] = {"before": 0, "after": unloaded["sockets"]}
+        leaks["unload.entry_data"] = {"before": 0, "after": int(entry.entry_id in hass.data.get(DOMAIN, {}))}
+    finally:
+        tracemalloc.stop()
+        await hass.async_stop(force=True)
+        await runner.cleanup()
+
+    return {
+        name: {"kib": round(size / 1024, 1), "budget_kib": BUDGETS_KIB[name]}
+        for name, size in results.items()
+    }, leaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=10, help="Number of tracked profiles (default 10)")
+    parser.add_argument("--cycles", type=int, default=10, help="Refresh cycles checked for growth (default 10)")
+    parser.add_argument("--reloads", type=int, default=10, help="Entry reloads checked for growth (default 10)")
+    parser.add_argument("--frame-interval", type=float, default=0.5, help="Seconds between stand-in frames (default 0.5)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results, leaks = asyncio.run(_async_run(args))
+
+    over_budget = []
+    print(f"{'case':30} {'KiB':>10} {'budget KiB':>12}")
+    for name, result in results.items():
+        flag = " *" if result["kib"] > result["budget_kib"] else ""
+        if flag:
+            over_budget.append(name)
+        print(f"{name:30} {result['kib']:10.1f} {result['budget_kib']:12}{flag}")
+
+    print(f"\n{'count':30} {'before':>10} {'after':>12}")
+    for name, leak in leaks.items():
+        flag = " *" if leak["after"] > leak["before"] else ""
+        if flag:
+            over_budget.append(name)
+        print(f"{name:30} {leak['before']:10} {leak['after']:12}{flag}")
+
+    if args.output:
+        output = {
+            "meta": harness.metadata() | {"profiles": args.profiles, "cycles": args.cycles, "reloads": args.reloads},
+            "results": results,
+            "counts": leaks,
+        }
+        with open(args.output, "w") as output_file:
+            json.dump(output, output_file, indent=2)
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
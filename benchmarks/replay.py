@@ -0,0 +1,139 @@
+"""Replay a worldstate frame recording through the worldstate coordinator.
+
+Recordings are written by the integration when "Record WebSocket Frames" is
+enabled (``warframe_frames_<time>.jsonl.gz`` in the config directory). Every
+frame goes through the same handler as a live frame, and the sensors are
+updated on the coordinator interval of the recording's clock:
+
+    python -m benchmarks.replay warframe_frames_20250101_000000.jsonl.gz --speed 60
+    python -m benchmarks.replay recording.jsonl.gz --speed 0 --output after.json --compare before.json
+
+``--speed 0`` replays as fast as possible. The results hold the wall and CPU
+time per frame and per sensor update, so runs can be compared across versions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.warframe.const import CONF_WORLDSTATES
+from custom_components.warframe.recorder import read_recording
+
+from . import harness
+
+
+async def _async_replay(path, speed, trace_memory):
+    hass = HomeAssistant(tempfile.mkdtemp())
+    entry, static_data, worldstate, profile = harness.create_coordinators(hass, {CONF_WORLDSTATES: True})
+    # Updates are driven by the recording's clock instead of a timer
+    update_interval = worldstate.update_interval.total_seconds()
+    worldstate.update_interval = None
+
+    frame_wall = []
+    frame_cpu = []
+    update_wall = []
+    update_cpu = []
+    first_time = None
+    last_update = None
+    replay_start = time.monotonic()
+    if trace_memory:
+        tracemalloc.start()
+
+    for frame_time, raw in read_recording(path):
+        if first_time is None:
+            first_time = frame_time
+        if speed:
+            delay = replay_start + (frame_time - first_time) / speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        wall = time.perf_counter_ns()
+        cpu = time.process_time_ns()
+        worldstate._handle_frame(raw)
+        frame_cpu.append(time.process_time_ns() - cpu)
+        frame_wall.append(time.perf_counter_ns() - wall)
+
+        if worldstate.world_state_data is None:
+            continue
+        if last_update is None:
+            # Create the sensors from the first English packet
+            worldstate.data = worldstate.world_state_data
+            for entity in await harness.async_create_sensors(hass, entry, static_data, worldstate, None):
+                if entity.coordinator is worldstate:
+                    worldstate.async_add_listener(entity._handle_coordinator_update)
+            last_update = frame_time
+        elif frame_time - last_update >= update_interval:
+            wall = time.perf_counter_ns()
+            cpu = time.process_time_ns()
+            worldstate.async_set_updated_data(worldstate.world_state_data)
+            update_cpu.append(time.process_time_ns() - cpu)
+            update_wall.append(time.perf_counter_ns() - wall)
+            last_update = frame_time
+
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    replay_duration = time.monotonic() - replay_start
+    await hass.async_stop(force=True)
+
+    if not frame_wall:
+        raise SystemExit(f"{path} does not contain any frames")
+
+    results = {
+        "replay.frame_wall": harness.summary(frame_wall),
+        "replay.frame_cpu": harness.summary(frame_cpu),
+    }
+    if update_wall:
+        results["replay.update_wall"] = harness.summary(update_wall)
+        results["replay.update_cpu"] = harness.summary(update_cpu)
+    return {
+        "frames": len(frame_wall),
+        "updates": len(update_wall),
+        "recorded_seconds": frame_time - first_time,
+        "replay_seconds": replay_duration,
+        "peak_memory_bytes": peak_memory,
+    }, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", help="Recording written by the integration")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed, 1 is real time and 0 as fast as possible (default 1)")
+    parser.add_argument("--tracemalloc", action="store_true", help="Report the peak traced memory (slows the replay down)")
+    parser.add_argument("--output", help="Write the results as JSON to this file instead of stdout")
+    parser.add_argument("--compare", help="Results of an earlier replay to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Slowdown ratio reported as a regression (default 0.1)")
+    args = parser.parse_args()
+
+    replay, results = asyncio.run(_async_replay(args.recording, args.speed, args.tracemalloc))
+    output = {
+        "meta": harness.metadata() | {"recording": args.recording, "speed": args.speed},
+        "replay": replay,
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(output, output_file, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as base_file:
+            regressions = harness.compare(json.load(base_file), results, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Offline benchmarks for the Warframe Stats integration.
+
+Times decoding, the static lookup build, partial lookups, catalog searches,
+the trader join and the update of every sensor against the recorded fixtures, and writes machine readable
+results that can be compared across commits:
+
+    python -m benchmarks.run --output before.json
+    python -m benchmarks.run --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import sys
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.warframe.catalog import WarframeCatalogJoin, WarframeCatalogStats
+from custom_components.warframe.const import (
+    CONF_CATALOG_SENSORS,
+    CONF_LEADERBOARDS,
+    CONF_PROFILE_SENSORS,
+    CONF_PROFILES,
+    CONF_WORLDSTATES,
+)
+from custom_components.warframe.coordinator import (
+    _build_item_lookup,
+    _get_partial_lookup,
+)
+from custom_components.warframe.search import WarframeCatalogIndex, tokenize
+
+from . import fixtures, harness
+
+ACCOUNT_LARGE = "large"
+ACCOUNT_SMALL = "small"
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _time(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - start)
+    return harness.summary(samples)
+
+
+async def _async_time(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        await func()
+        samples.append(time.perf_counter_ns() - start)
+    return harness.summary(samples)
+
+
+def _renamed_entry(entry, copy):
+    """Return a copy of a lookup entry whose words no search of the original matches."""
+    if not copy:
+        return entry
+    return dict(
+        entry,
+        **{
+            key: _WORD.sub(lambda match: f"q{copy}{match.group()}", entry[key])
+            for key in ("value", "description")
+            if isinstance(entry.get(key), str)
+        },
+    )
+
+
+async def _async_run(repeat):
+    results = {}
+    raw = {
+        name: fixtures.load_raw(name)
+        for name in (
+            fixtures.WORLDSTATE_FIXTURE,
+            fixtures.CATALOG_FIXTURE,
+            fixtures.PROFILE_LARGE_FIXTURE,
+            fixtures.PROFILE_SMALL_FIXTURE,
+        )
+    }
+    world_state_data = json.loads(raw[fixtures.WORLDSTATE_FIXTURE])
+    catalog = json.loads(raw[fixtures.CATALOG_FIXTURE])
+    profiles = {
+        ACCOUNT_LARGE: json.loads(raw[fixtures.PROFILE_LARGE_FIXTURE]),
+        ACCOUNT_SMALL: json.loads(raw[fixtures.PROFILE_SMALL_FIXTURE]),
+    }
+    frame = json.dumps(
+        {"event": "ws:update", "packet": {"language": "en", "platform": "pc", "data": world_state_data}}
+    )
+
+    # Decoding
+    results["decode.worldstate_rest"] = _time(lambda: json.loads(raw[fixtures.WORLDSTATE_FIXTURE]), repeat)
+    results["decode.worldstate_frame"] = _time(lambda: json.loads(frame), repeat)
+    results["decode.catalog"] = _time(lambda: json.loads(raw[fixtures.CATALOG_FIXTURE]), max(1, repeat // 10))
+    results["decode.profile_large"] = _time(lambda: json.loads(raw[fixtures.PROFILE_LARGE_FIXTURE]), repeat)
+    results["decode.profile_small"] = _time(lambda: json.loads(raw[fixtures.PROFILE_SMALL_FIXTURE]), repeat)
+
+    hass = HomeAssistant(tempfile.mkdtemp())
+    entry, static_data, worldstate, profile = harness.create_coordinators(
+        hass,
+        {
+            CONF_WORLDSTATES: True,
+            CONF_PROFILES: [ACCOUNT_LARGE, ACCOUNT_SMALL],
+            CONF_PROFILE_SENSORS: True,
+            CONF_LEADERBOARDS: True,
+            CONF_CATALOG_SENSORS: True,
+        },
+    )
+
+    # Static lookup
+    def build_lookup():
+        static_data._new_lookup = {}
+        _build_item_lookup(catalog, static_data._new_lookup, WarframeCatalogStats())
+
+    results["lookup.build"] = _time(build_lookup, max(1, repeat // 10))
+
+    async def standardise_lookup():
+        static_data.name_lookup = {}
+        await static_data._standardise_lookup()
+
+    # Only the lookup swap, the stats, join and search index are timed below
+    async def skip_catalog_indexes():
+        pass
+
+    update_catalog_indexes = static_data._async_update_catalog_indexes
+    static_data._async_update_catalog_indexes = skip_catalog_indexes
+    results["lookup.standardise"] = await _async_time(standardise_lookup, max(1, repeat // 10))
+    static_data._async_update_catalog_indexes = update_catalog_indexes
+    await standardise_lookup()
+    results["lookup.standardise_unchanged"] = await _async_time(static_data._standardise_lookup, max(1, repeat // 10))
+
+    profile_types = [
+        item.get("type")
+        for profile_data in profiles.values()
+        for key in ("Abilities", "Enemies", "Scans", "Missions", "Weapons")
+        for item in profile_data.get("Stats", {}).get(key, [])
+    ]
+    hit = profiles[ACCOUNT_LARGE]["Stats"]["Weapons"][0]["type"]
+    prefix = hit.rsplit("/", 1)[0] + "/Unknown"
+    miss = "/Lotus/Upgrades/Skins/Unknown/Unknown"
+    lookup = static_data.name_lookup
+    results["lookup.partial_hit"] = _time(lambda: _get_partial_lookup(hit, lookup), repeat)
+    results["lookup.partial_prefix"] = _time(lambda: _get_partial_lookup(prefix, lookup), max(1, repeat // 10))
+    results["lookup.partial_miss"] = _time(lambda: _get_partial_lookup(miss, lookup), max(1, repeat // 10))
+
+    def resolve_all():
+        for item_type in profile_types:
+            static_data.resolve(item_type)
+
+    static_data._resolve_cache_version = -1
+    results["lookup.resolve_cold"] = _time(resolve_all, 1)
+    results["lookup.resolve_warm"] = _time(resolve_all, repeat)
+
+    # Catalog search, also over a catalog ten times as large whose copies
+    # use other words, so the matches stay the same. The latency follows the
+    # entries of the rarest word (or prefix) searched for, not the catalog size
+    entries = list(lookup.values())
+    name = next(entry["value"] for entry in entries if entry.get("type") == "warframe")
+    words = [word for entry in entries for word in tokenize(entry.get("description"))]
+    common = max(set(words), key=words.count)
+    searches = {
+        "name": name,
+        "multi_term": f"{common} {tokenize(name)[0]}",
+        "prefix": f"{tokenize(name)[0][:3]}*",
+        "category": common,
+    }
+    results["catalog.index_build"] = _time(lambda: WarframeCatalogIndex(lookup), max(1, repeat // 10))
+    large_lookup = {
+        f"{key}/{copy}": _renamed_entry(entry, copy) for copy in range(10) for key, entry in lookup.items()
+    }
+    for suffix, index in (("", WarframeCatalogIndex(lookup)), ("_x10", WarframeCatalogIndex(large_lookup))):
+        for case, text in searches.items():
+            categories = ["primary", "secondary", "melee"] if case == "category" else None
+            results[f"search.{case}{suffix}"] = _time(lambda: index.search(text, categories, limit=20), repeat)
+
+    # Trader join, cold is the first packet after a catalog change
+    trader_items = [
+        item
+        for trader in ("voidTrader", "vaultTrader")
+        for item in (world_state_data.get(trader) or {}).get("inventory") or []
+    ]
+
+    def join_all(join):
+        for item in trader_items:
+            join.resolve(item.get("uniqueName"), item.get("item"))
+
+    results["catalog.join_build"] = _time(lambda: WarframeCatalogJoin(lookup), max(1, repeat // 10))
+    results["join.resolve_cold"] = _time(lambda: join_all(WarframeCatalogJoin(lookup)), max(1, repeat // 10))
+    join = WarframeCatalogJoin(lookup)
+    results["join.resolve_warm"] = _time(lambda: join_all(join), repeat)
+
+    # Sensors
+    worldstate.data = world_state_data
+    profile.data = profiles
+    for account_id, profile_data in profiles.items():
+        profile.leaderboard.update_account(account_id, profile_data, static_data.resolve)
+    entities = await harness.async_create_sensors(hass, entry, static_data, worldstate, profile)
+    for entity in entities:
+        results[harness.sensor_name(entity)] = _time(entity._handle_coordinator_update, repeat)
+
+    await hass.async_stop(force=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="Samples per benchmark (default 50)")
+    parser.add_argument("--output", help="Write the results as JSON to this file instead of stdout")
+    parser.add_argument("--compare", help="Results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Slowdown ratio reported as a regression (default 0.1)")
+    args = parser.parse_args()
+
+    results = asyncio.run(_async_run(args.repeat))
+    output = {
+        "meta": harness.metadata() | {
+            "fixtures": {
+                name: hashlib.sha256(fixtures.load_raw(name)).hexdigest()[:12]
+                for name in sorted(path.name for path in fixtures.FIXTURES_DIR.glob("*.json.gz"))
+            },
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(output, output_file, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as base_file:
+            regressions = harness.compare(json.load(base_file), results, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Local stand-in for the warframestat.us and content.warframe.com APIs.
+
+Serves the benchmark fixtures over REST and pushes ``ws:update`` frames on
+``/socket`` so the integration can be soak tested without touching the live
+APIs. Point the integration at it with the advanced mode URL options:
+
+    python -m benchmarks.standin --port 8765 --frame-interval 0.5 --platforms pc,ps4 --languages en,de,fr
+
+    API URL:             http://127.0.0.1:8765/
+    Profile Content URL: http://127.0.0.1:8765/
+    WebSocket URL:       ws://127.0.0.1:8765/socket
+
+Every account ID gets its own profile (large or small, see
+``--large-profile-ratio``) so any number of profiles can be tracked.
+Faults can be injected with ``--delay``, ``--rate-limit-ratio`` and
+``--drop-after``. ``--latency`` and ``--catalog-latency`` slow the responses
+down by a fixed time instead, for repeatable timings.
+
+With ``--certfile`` and ``--keyfile`` the stand-in serves ``https://`` and
+``wss://`` instead (the certificate has to be trusted by Home Assistant).
+Frames are compressed with permessage-deflate when the client offers it,
+``--no-compress`` turns the offer down so both modes can be compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+import random
+import ssl
+
+from aiohttp import WSMsgType, web
+
+from custom_components.warframe.const import (
+    URL_RAW_PROFILE_ENDPOINT,
+    URL_STATIC_DATA_LOOKUP,
+    URL_TRANSLATION_OTHER_ENDPOINT,
+    URL_TRANSLATION_SOL_NODES_ENDPOINT,
+    URL_TRANSLATION_SORTIES_ENDPOINT,
+    URL_TRANSLATION_WARFRAME_ENDPOINT,
+)
+from custom_components.warframe.translations import TRANSLATION_TABLES
+
+from . import fixtures
+
+_LOGGER = logging.getLogger(__name__)
+
+DISPLAY_NAME_PLACEHOLDER = "__STANDIN_DISPLAY_NAME__"
+# Number of pre-encoded frames per platform and language, so consecutive frames differ
+FRAME_VARIANTS = 8
+
+
+class StandinServer:
+    """aiohttp application serving fixtures and worldstate frames."""
+
+    def __init__(self, args):
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.counters = {
+            "requests": 0,
+            "rate_limited": 0,
+            "profiles": 0,
+            "websockets": 0,
+            "frames": 0,
+            "dropped_sockets": 0,
+        }
+        self._profiles = {}
+        self._worldstate = fixtures.load(fixtures.WORLDSTATE_FIXTURE)
+        self._worldstate_body = json.dumps(self._worldstate).encode()
+        self._catalog_body = fixtures.load_raw(fixtures.CATALOG_FIXTURE)
+        self._profile_templates = {
+            size: self._profile_template(name)
+            for size, name in (
+                ("large", fixtures.PROFILE_LARGE_FIXTURE),
+                ("small", fixtures.PROFILE_SMALL_FIXTURE),
+            )
+        }
+        self._translations = self._translation_tables()
+        self._frames = {
+            (platform, language): [self._frame(platform, language, variant) for variant in range(FRAME_VARIANTS)]
+            for platform in args.platforms
+            for language in args.languages
+        }
+
+    def application(self):
+        app = web.Application(middlewares=[self._faults])
+        app.router.add_get("/socket", self._socket)
+        app.router.add_get(f"/{URL_RAW_PROFILE_ENDPOINT}", self._profile)
+        app.router.add_get(f"/{URL_STATIC_DATA_LOOKUP}{{query}}", self._catalog)
+        app.router.add_get(f"/{URL_TRANSLATION_OTHER_ENDPOINT}", self._empty)
+        for table in TRANSLATION_TABLES.values():
+            app.router.add_get(f"/{table.endpoint}", self._translation)
+        app.router.add_get("/{platform}", self._worldstate_rest)
+        app.on_shutdown.append(self._log_counters)
+        return app
+
+    def _profile_template(self, name):
+        profile_data = fixtures.load(name)
+        # Keep the trailing platform glyph the integration strips
+        profile_data["Results"][0]["DisplayName"] = f"{DISPLAY_NAME_PLACEHOLDER}\ue000"
+        return json.dumps(profile_data).encode()
+
+    def _frame(self, platform, language, variant):
+        world_state_data = copy.deepcopy(self._worldstate)
+        # Grow the lists the sensors iterate over to the requested frame size
+        for key in ("fissures", "alerts", "invasions"):
+            items = world_state_data.get(key, [])
+            world_state_data[key] = [
+                dict(item, id=f"{item.get('id')}-{variant}-{copy_number}")
+                for copy_number in range(self.args.frame_scale)
+                for item in items
+            ]
+        world_state_data["timestamp"] = datetime.now(timezone.utc).isoformat()
+        return json.dumps(
+            {
+                "event": "ws:update",
+                "packet": {"language": language, "platform": platform, "data": world_state_data},
+            }
+        )
+
+    @web.middleware
+    async def _faults(self, request, handler):
+        self.counters["requests"] += 1
+        if self.args.latency:
+            await asyncio.sleep(self.args.latency)
+        if self.args.delay:
+            await asyncio.sleep(self.random.uniform(0, self.args.delay))
+        if request.path != "/socket" and self.random.random() < self.args.rate_limit_ratio:
+            self.counters["rate_limited"] += 1
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        return await handler(request)
+
+    def _translation_tables(self):
+        """Return small translation tables covering what the fixtures hold."""
+        profile_stats = fixtures.load(fixtures.PROFILE_LARGE_FIXTURE).get("Stats", {})
+        modifiers = {
+            variant.get("modifier") for variant in self._worldstate.get("sortie", {}).get("variants", [])
+        } - {None}
+        return {
+            URL_TRANSLATION_SORTIES_ENDPOINT: {
+                "modifierTypes": {f"SORTIE_MODIFIER_{index}": name for index, name in enumerate(sorted(modifiers))},
+                "modifierDescriptions": {
+                    f"SORTIE_MODIFIER_{index}": f"{name} modifier" for index, name in enumerate(sorted(modifiers))
+                },
+                "bosses": {},
+            },
+            URL_TRANSLATION_SOL_NODES_ENDPOINT: {
+                mission["type"]: {"value": f"Node {index}"}
+                for index, mission in enumerate(profile_stats.get("Missions", []))
+                if not mission["type"].endswith("_HM")
+            },
+            URL_TRANSLATION_WARFRAME_ENDPOINT: [
+                {
+                    "abilities": [
+                        {"uniqueName": ability["type"], "name": f"Ability {index}", "description": ""}
+                        for index, ability in enumerate(profile_stats.get("Abilities", []))
+                    ]
+                }
+            ],
+        }
+
+    async def _empty(self, request):
+        return web.json_response({})
+
+    async def _translation(self, request):
+        return web.json_response(self._translations.get(request.path.lstrip("/"), {}))
+
+    async def _worldstate_rest(self, request):
+        return web.Response(body=self._worldstate_body, content_type="application/json")
+
+    async def _catalog(self, request):
+        if self.args.catalog_latency:
+            await asyncio.sleep(self.args.catalog_latency)
+        return web.Response(body=self._catalog_body, content_type="application/json")
+
+    async def _profile(self, request):
+        account_id = request.query.get("playerId", "")
+        body = self._profiles.get(account_id)
+        if body is None:
+            # The account ID decides the profile size, so it is stable across restarts
+            digest = int(hashlib.sha256(account_id.encode()).hexdigest(), 16)
+            size = "large" if digest % 1000 < self.args.large_profile_ratio * 1000 else "small"
+            body = self._profile_templates[size].replace(
+                DISPLAY_NAME_PLACEHOLDER.encode(), json.dumps(account_id[:24])[1:-1].encode()
+            )
+            self._profiles[account_id] = body
+        self.counters["profiles"] += 1
+        return web.Response(body=body, content_type="application/json")
+
+    async def _socket(self, request):
+        websocket = web.WebSocketResponse(heartbeat=30, compress=self.args.compress)
+        await websocket.prepare(request)
+        self.counters["websockets"] += 1
+        sent = 0
+        variant = 0
+        try:
+            while not websocket.closed:
+                for frames in self._frames.values():
+                    await websocket.send_str(frames[variant])
+                    sent += 1
+                    self.counters["frames"] += 1
+                    if self.args.drop_after and sent >= self.args.drop_after:
+                        # Simulate the server going away without a close handshake
+                        self.counters["dropped_sockets"] += 1
+                        request.transport.close()
+                        return websocket
+                variant = (variant + 1) % FRAME_VARIANTS
+                try:
+                    message = await websocket.receive(timeout=self.args.frame_interval)
+                except asyncio.TimeoutError:
+                    continue
+                if message.type in (WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED, WSMsgType.ERROR):
+                    break
+        except ConnectionResetError:
+            pass
+        return websocket
+
+    async def _log_counters(self, app):
+        _LOGGER.info("Stand-in counters: %s", self.counters)
+
+
+def parse_args(argv=None):
+    """Return the stand-in options, ``argv`` defaults to the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--frame-interval", type=float, default=30.0, help="Seconds between frame bursts (default 30)")
+    parser.add_argument("--platforms", default="pc", help="Comma separated platforms sent in every burst (default pc)")
+    parser.add_argument("--languages", default="en", help="Comma separated languages sent in every burst (default en)")
+    parser.add_argument("--frame-scale", type=int, default=1, help="Multiply the fissure, alert and invasion lists in each frame")
+    parser.add_argument("--large-profile-ratio", type=float, default=0.5, help="Share of account IDs served the large profile")
+    parser.add_argument("--delay", type=float, default=0.0, help="Delay every response by up to this many seconds")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay every response by this many seconds")
+    parser.add_argument(
+        "--catalog-latency", type=float, default=0.0, help="Delay the catalog responses by this many more seconds"
+    )
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Share of REST requests answered with 429")
+    parser.add_argument("--drop-after", type=int, default=0, help="Drop each WebSocket after this many frames")
+    parser.add_argument("--certfile", help="Certificate to serve https and wss with")
+    parser.add_argument("--keyfile", help="Private key of --certfile")
+    parser.add_argument("--no-compress", dest="compress", action="store_false", help="Turn down permessage-deflate")
+    parser.add_argument("--seed", type=int, default=30)
+    args = parser.parse_args(argv)
+    args.platforms = [platform.strip() for platform in args.platforms.split(",") if platform.strip()]
+    args.languages = [language.strip() for language in args.languages.split(",") if language.strip()]
+    return args
+
+
+def _ssl_context(args):
+    if not args.certfile:
+        return None
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(args.certfile, args.keyfile)
+    return context
+
+
+async def async_start(args):
+    """Start a stand-in inside the running event loop.
+
+    Returns the runner (``await runner.cleanup()`` to stop it) and the base
+    URL, a port of 0 picks a free one.
+    """
+    runner = web.AppRunner(StandinServer(args).application())
+    await runner.setup()
+    ssl_context = _ssl_context(args)
+    await web.TCPSite(runner, args.host, args.port, ssl_context=ssl_context).start()
+    host, port = runner.addresses[0][:2]
+    scheme = "https" if ssl_context is not None else "http"
+    return runner, f"{scheme}://{host}:{port}/"
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    web.run_app(
+        StandinServer(args).application(), host=args.host, port=args.port, ssl_context=_ssl_context(args)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Setup time of the Warframe Stats integration against slow stand-ins.
+
+Sets up config entries against an in-process stand-in whose responses are
+slowed down by a fixed ``--latency``, with the multi-megabyte catalog slowed
+down by ``--catalog-latency`` more, and times how long the entry setup takes
+and when the catalog is loaded after it started. Every sample starts from an
+empty config directory, so nothing is restored from an earlier run:
+
+    python -m benchmarks.startup --output before.json
+    python -m benchmarks.startup --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import shutil
+import sys
+import tempfile
+import time
+
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.warframe.const import (
+    CONF_CATALOG_SENSORS,
+    CONF_LEADERBOARDS,
+    CONF_PROFILES,
+    CONF_WORLDSTATES,
+    DOMAIN,
+)
+
+from . import harness, standin
+
+CASES = {
+    "worldstate": {CONF_WORLDSTATES: True},
+    "profiles": {CONF_WORLDSTATES: False, CONF_PROFILES: ["large", "small"], CONF_LEADERBOARDS: True},
+    "all": {
+        CONF_WORLDSTATES: True,
+        CONF_PROFILES: ["large", "small"],
+        CONF_LEADERBOARDS: True,
+        CONF_CATALOG_SENSORS: True,
+    },
+}
+
+
+async def _async_sample(base_url, data, timeout):
+    """Return the nanoseconds until the entry is set up and until its catalog is loaded."""
+    config_dir = tempfile.mkdtemp()
+    hass = await harness.async_start_hass(config_dir)
+    try:
+        start = time.perf_counter_ns()
+        entry = await harness.async_add_entry(hass, harness.standin_data(base_url, data))
+        setup = time.perf_counter_ns() - start
+        if entry.state is not ConfigEntryState.LOADED:
+            raise RuntimeError(f"The entry did not set up: {entry.reason}")
+        static_data = hass.data[DOMAIN][entry.entry_id]["coordinator"][0]
+        async with asyncio.timeout(timeout):
+            while not static_data.catalog_version:
+                await asyncio.sleep(0.01)
+        catalog = time.perf_counter_ns() - start
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+    finally:
+        await hass.async_stop(force=True)
+        shutil.rmtree(config_dir, ignore_errors=True)
+    return setup, catalog
+
+
+async def _async_run(args):
+    runner, base_url = await standin.async_start(
+        standin.parse_args(
+            [
+                "--port", "0",
+                "--latency", str(args.latency),
+                "--catalog-latency", str(args.catalog_latency),
+            ]
+        )
+    )
+    results = {}
+    try:
+        for case, data in CASES.items():
+            samples = [await _async_sample(base_url, data, args.timeout) for _ in range(args.repeat)]
+            results[f"startup.{case}"] = harness.summary([setup for setup, _ in samples])
+            results[f"startup.{case}_catalog"] = harness.summary([catalog for _, catalog in samples])
+    finally:
+        await runner.cleanup()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Setups per case (default 5)")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds every response is delayed (default 0.2)")
+    parser.add_argument(
+        "--catalog-latency", type=float, default=2.0, help="Seconds the catalog is delayed more (default 2)"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the catalog (default 60)")
+    parser.add_argument("--output", help="Write the results as JSON to this file instead of stdout")
+    parser.add_argument("--compare", help="Results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Slowdown ratio reported as a regression (default 0.1)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(_async_run(args))
+    output = {
+        "meta": harness.metadata() | {"latency": args.latency, "catalog_latency": args.catalog_latency},
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(output, output_file, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as base_file:
+            regressions = harness.compare(json.load(base_file), results, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
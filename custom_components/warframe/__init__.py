@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
+import asyncio
+import logging
+import time
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .coordinator import (
     WarframeProfileDataUpdateCoordinator,
@@ -16,13 +22,26 @@ from .coordinator import (
 # For your initial PR, limit it to 1 platform.
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
-from .const import DOMAIN
+from .const import CONF_PROFILES, CONF_WORLDSTATES, DOMAIN
+from .registry import async_get_registry
+from .session import async_close_session
+from .services import async_setup_services
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 # TODO Create ConfigEntry type alias with API object
 # TODO Rename type alias and update all entry annotations
 type WarframeStatsConfigEntry = ConfigEntry[MyApi]  # noqa: F821
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Warframe Stats services."""
+    async_setup_services(hass)
+    return True
+
+
 # TODO Update entry annotation
 async def async_setup_entry(hass: HomeAssistant, entry: WarframeStatsConfigEntry) -> bool:
     """Set up Warframe Stats from a config entry."""
@@ -31,16 +50,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: WarframeStatsConfigEntry
     # TODO 2. Validate the API connection (and authentication)
     # TODO 3. Store an API object for your platforms to access
     # entry.runtime_data = MyAPI(...)
-    staticDataCoordinator = WarframeStaticDataUpdateCoordinator(hass, entry)
-    await staticDataCoordinator.async_config_entry_first_refresh()
-    worldstateCoordinator = WarframeWorldstateDataUpdateCoordinator(hass, entry)
-    await worldstateCoordinator.async_config_entry_first_refresh()
-    # profileCoordinator = WarframeProfileDataUpdateCoordinator(hass, entry)
-    # await profileCoordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})
+    start = time.monotonic()
+    registry = async_get_registry(hass)
+    try:
+        # The static catalog is only loaded once something needs it
+        staticDataCoordinator, owns_static = await registry.async_acquire(
+            WarframeStaticDataUpdateCoordinator.get_key(entry.data),
+            entry.entry_id,
+            lambda: WarframeStaticDataUpdateCoordinator(hass, entry),
+        )
+        worldstate = None
+        profileCoordinator = None
+        first_refreshes = []
+        if entry.data.get(CONF_WORLDSTATES):
+            worldstate = registry.async_acquire(
+                WarframeWorldstateDataUpdateCoordinator.get_key(entry.data),
+                entry.entry_id,
+                lambda: WarframeWorldstateDataUpdateCoordinator(hass, entry),
+                lambda coordinator: coordinator.async_config_entry_first_refresh(),
+            )
+            first_refreshes.append(worldstate)
+        if entry.data.get(CONF_PROFILES):
+            profileCoordinator = WarframeProfileDataUpdateCoordinator(hass, entry, staticDataCoordinator)
+            first_refreshes.append(profileCoordinator.async_config_entry_first_refresh())
+        results = await asyncio.gather(*first_refreshes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    except Exception:
+        await registry.async_release(entry.entry_id)
+        raise
+    worldstateCoordinator, owns_worldstate = results[0] if worldstate is not None else (None, False)
+    if worldstateCoordinator is not None:
+        # Each entry keeps its own watchlist and frame options on a shared coordinator
+        worldstateCoordinator.async_attach_entry(entry)
+    _LOGGER.debug("Coordinators ready after %.3f seconds", time.monotonic() - start)
+
     hass_data = dict(entry.data)
-    hass_data.update({'coordinator': [staticDataCoordinator, worldstateCoordinator]})
+    hass_data.update({
+        'coordinator': [staticDataCoordinator, worldstateCoordinator, profileCoordinator],
+        # Shared coordinators only get sensors from the entry that owns them
+        'owner': [owns_static, owns_worldstate, profileCoordinator is not None],
+    })
     hass.data[DOMAIN][entry.entry_id] = hass_data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -51,4 +102,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: WarframeStatsConfigEntry
 # TODO Update entry annotation
 async def async_unload_entry(hass: HomeAssistant, entry: WarframeStatsConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        worldstateCoordinator = hass.data[DOMAIN][entry.entry_id]['coordinator'][1]
+        if worldstateCoordinator is not None:
+            await worldstateCoordinator.async_detach_entry(entry.entry_id)
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await async_get_registry(hass).async_release(entry.entry_id)
+        # An entry taking over a shared coordinator may still be setting up
+        if not any(
+            other.entry_id != entry.entry_id
+            and other.state in (ConfigEntryState.LOADED, ConfigEntryState.SETUP_IN_PROGRESS)
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            # The pooled connections go with the last entry
+            await async_close_session(hass)
+    return unload_ok
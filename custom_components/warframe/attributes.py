@@ -0,0 +1,48 @@
+"""Size limits for the list attributes of sensors with large payloads."""
+
+from __future__ import annotations
+
+import heapq
+from itertools import islice
+
+from homeassistant.helpers.json import json_bytes
+
+# Same limit the recorder applies to the attributes it stores
+MAX_ATTRIBUTE_BYTES = 16384
+
+
+class AttributePolicy:
+    """How a list attribute is cut down before it is written to the state.
+
+    The largest ``size`` items by ``sort_key`` are picked with a bounded heap
+    (or the first ``size`` items when there is no sort key), only ``fields``
+    are kept, and the list stops before it encodes to more than
+    ``max_bytes``. ``transform`` only runs on the picked items, so names are
+    resolved for what is shown rather than for every item of the profile.
+    """
+
+    def __init__(self, fields, sort_key=None, max_bytes=MAX_ATTRIBUTE_BYTES):
+        self.fields = fields
+        self.sort_key = sort_key
+        self.max_bytes = max_bytes
+
+    def _select(self, items, size):
+        if self.sort_key is None:
+            return islice(items, size)
+        sort_key = self.sort_key
+        return heapq.nlargest(size, items, key=lambda item: item.get(sort_key) or 0)
+
+    def apply(self, items, size, transform=None):
+        """Return the attribute list for ``items``."""
+        result = []
+        # The brackets of the list
+        encoded_size = 2
+        for item in self._select(items, size):
+            if transform is not None:
+                item = transform(item)
+            item = {field: item.get(field) for field in self.fields}
+            encoded_size += len(json_bytes(item)) + 1
+            if encoded_size > self.max_bytes:
+                break
+            result.append(item)
+        return result
@@ -0,0 +1,161 @@
+"""Aggregates and join indexes of the static catalog, gathered while its name lookup is built."""
+
+from __future__ import annotations
+
+import re
+
+from .const import DOMAIN
+
+EVENT_CATALOG_ITEM_ADDED = f"{DOMAIN}_catalog_item_added"
+
+# The lookup types that are items, rather than abilities, enemies or nodes
+CATALOG_ITEM_TYPES = [
+    "warframe",
+    "primary",
+    "secondary",
+    "melee",
+    "companion",
+    "companion-weapon",
+    "archwing",
+    "arch-melee",
+    "arch-gun",
+]
+
+# Resolved trader items kept before the cache starts over
+MAX_JOIN_CACHE = 1024
+
+_NOT_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name):
+    """Return a display name without case, spaces or punctuation.
+
+    Varzia names ``LonyxtorPrime`` what the catalog names ``Lonyxtor Prime``.
+    """
+    return _NOT_ALNUM.sub("", name.casefold()) if isinstance(name, str) else ""
+
+
+class WarframeCatalogStats:
+    """Item counts, prime counts, the newest warframe and the items added.
+
+    Every item is added once, right after its lookup entry is built, so the
+    figures cost no pass over the catalog of their own. Items are only
+    reported as added when there is a ``previous`` lookup (with lowercased
+    keys) to compare with.
+    """
+
+    def __init__(self, previous=None):
+        self.counts = dict.fromkeys(CATALOG_ITEM_TYPES, 0)
+        self.primes = dict.fromkeys(CATALOG_ITEM_TYPES, 0)
+        self.newest_warframe = None
+        self.added = []
+        self._previous = previous
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    @property
+    def total_primes(self):
+        return sum(self.primes.values())
+
+    def add(self, item, entry):
+        """Count a catalog item and the lookup entry built for it."""
+        item_type = entry.get("type")
+        if item_type not in self.counts:
+            return
+        self.counts[item_type] += 1
+        if item.get("isPrime"):
+            self.primes[item_type] += 1
+
+        release_date = item.get("releaseDate")
+        if item_type == "warframe" and release_date and (
+            self.newest_warframe is None or release_date > self.newest_warframe["releaseDate"]
+        ):
+            self.newest_warframe = {
+                "name": item.get("name"),
+                "uniqueName": item.get("uniqueName"),
+                "releaseDate": release_date,
+                "description": item.get("description"),
+            }
+
+        if self._previous is not None and item.get("uniqueName", "").lower() not in self._previous:
+            self.added.append({"name": item.get("name"), "uniqueName": item.get("uniqueName"), "type": item_type})
+
+    def finish(self):
+        """Let go of the previous lookup once the catalog is built."""
+        self._previous = None
+
+
+class WarframeCatalogJoin:
+    """Hash indexes joining the items the traders sell to catalog entries.
+
+    Items are found by their unique name in the lookup itself, by the last
+    part of their unique name (the traders sell ``/Lotus/StoreItems/...``
+    paths of catalog items) and by their normalized display name, each a
+    single dict lookup. A last part or a name shared by several items joins
+    none of them. The indexes point at the lookup's own keys, so they add
+    little to the catalog. Resolved items are cached by their unique name,
+    the inventory of every packet after the first is a cache hit until the
+    catalog changes.
+    """
+
+    def __init__(self, name_lookup=None):
+        self.name_lookup = name_lookup or {}
+        self.by_suffix = {}
+        self.by_name = {}
+        self._cache = {}
+        for unique_name, entry in self.name_lookup.items():
+            if entry.get("type") in CATALOG_ITEM_TYPES:
+                _add_unambiguous(self.by_suffix, unique_name.rsplit("/", 1)[-1], unique_name)
+                _add_unambiguous(self.by_name, normalize_name(entry.get("value")), unique_name)
+
+    def __len__(self):
+        return len(self.by_suffix)
+
+    def _find(self, unique_name, name):
+        if unique_name:
+            unique_name = unique_name.lower()
+            entry = self.name_lookup.get(unique_name)
+            if entry is not None and entry.get("type") in CATALOG_ITEM_TYPES:
+                return unique_name
+            found = self.by_suffix.get(unique_name.rsplit("/", 1)[-1])
+            if found is not None:
+                return found
+        if name:
+            return self.by_name.get(normalize_name(name))
+        return None
+
+    def resolve(self, unique_name, name=None):
+        """Return the catalog entry of a trader item, or None."""
+        key = unique_name or name
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        result = None
+        found = self._find(unique_name, name)
+        if found is not None:
+            entry = self.name_lookup[found]
+            result = {
+                "name": entry.get("value"),
+                "uniqueName": found,
+                "category": entry.get("type"),
+                "description": entry.get("description"),
+                "isPrime": entry.get("isPrime", False),
+            }
+        if len(self._cache) >= MAX_JOIN_CACHE:
+            self._cache = {}
+        self._cache[key] = result
+        return result
+
+
+def _add_unambiguous(index, key, value):
+    if not key:
+        return
+    if key in index and index[key] != value:
+        # Kept as None so a later item with the key cannot take it either
+        index[key] = None
+    else:
+        index[key] = value
@@ -0,0 +1,139 @@
+"""Bus events for worldstate items that appear, disappear or expire."""
+
+from __future__ import annotations
+
+from homeassistant.core import callback
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+CHANGE_EXPIRED = "expired"
+
+ITEM_FISSURE = "fissure"
+ITEM_ALERT = "alert"
+ITEM_INVASION = "invasion"
+ITEM_EVENT = "event"
+ITEM_VOID_TRADER_ITEM = "void_trader_item"
+ITEM_BOUNTY = "bounty"
+
+
+def get_event_type(item_type, change):
+    """Return the bus event fired for a change, e.g. ``warframe_fissure_added``."""
+    return f"{DOMAIN}_{item_type}_{change}"
+
+
+def _list_items(key):
+    def get_items(world_state_data):
+        for item in world_state_data.get(key) or []:
+            yield item.get("id"), item, None, item.get("expiry")
+
+    return get_items
+
+
+def _void_trader_items(world_state_data):
+    void_trader = world_state_data.get("voidTrader") or {}
+    for item in void_trader.get("inventory") or []:
+        # Inventory items have no id and leave with the trader
+        yield item.get("uniqueName") or item.get("item"), item, None, void_trader.get("expiry")
+
+
+def _bounties(world_state_data):
+    for syndicate in world_state_data.get("syndicateMissions") or []:
+        extra = {"syndicate": syndicate.get("syndicate")}
+        for job in syndicate.get("jobs") or []:
+            # Job ids are only unique within a rotation of a syndicate
+            yield f"{syndicate.get('id')}:{job.get('id')}", job, extra, syndicate.get("expiry")
+
+
+ITEM_GETTERS = {
+    ITEM_FISSURE: _list_items("fissures"),
+    ITEM_ALERT: _list_items("alerts"),
+    ITEM_INVASION: _list_items("invasions"),
+    ITEM_EVENT: _list_items("events"),
+    ITEM_VOID_TRADER_ITEM: _void_trader_items,
+    ITEM_BOUNTY: _bounties,
+}
+
+
+class _TrackedItem:
+    __slots__ = ("item", "extra", "expiry_text", "expiry", "expired")
+
+    def __init__(self, item, extra, expiry):
+        self.expiry_text = None
+        self.expiry = None
+        self.expired = False
+        self.update(item, extra, expiry)
+
+    def update(self, item, extra, expiry):
+        self.item = item
+        self.extra = extra
+        # Only parsed again when the packet moves the expiry
+        if expiry != self.expiry_text:
+            self.expiry_text = expiry
+            self.expiry = dt_util.parse_datetime(expiry) if expiry else None
+
+    def is_expired(self, now):
+        return bool(self.item.get("expired")) or (self.expiry is not None and self.expiry <= now)
+
+    def event_data(self):
+        if self.extra:
+            return self.item | self.extra
+        return self.item
+
+
+class WarframeWorldstateChanges:
+    """Diffs consecutive worldstate packets by item id.
+
+    Every tracked item fires one added event, and either one expired event
+    (once it is past its expiry, listed or not) or one removed event (when it
+    leaves the packet early, e.g. a completed invasion). The first packet
+    only sets the baseline.
+    """
+
+    def __init__(self, hass):
+        self.hass = hass
+        self._items = None
+
+    @callback
+    def async_update(self, world_state_data):
+        """Fire the events for the changes since the last packet."""
+        if not world_state_data:
+            return
+
+        now = dt_util.utcnow()
+        baseline = self._items is None
+        previous_items = self._items or {}
+        self._items = {}
+        for item_type, get_items in ITEM_GETTERS.items():
+            previous = previous_items.get(item_type, {})
+            current = {}
+            for item_id, item, extra, expiry in get_items(world_state_data):
+                if item_id is None:
+                    continue
+                tracked = previous.pop(item_id, None)
+                if tracked is None:
+                    tracked = _TrackedItem(item, extra, expiry)
+                    if not baseline:
+                        self._fire(item_type, CHANGE_ADDED, tracked)
+                else:
+                    tracked.update(item, extra, expiry)
+                if not tracked.expired and tracked.is_expired(now):
+                    tracked.expired = True
+                    if not baseline:
+                        self._fire(item_type, CHANGE_EXPIRED, tracked)
+                current[item_id] = tracked
+
+            # Whatever is left was not in this packet
+            for tracked in previous.values():
+                if tracked.expired:
+                    continue
+                if tracked.is_expired(now):
+                    self._fire(item_type, CHANGE_EXPIRED, tracked)
+                else:
+                    self._fire(item_type, CHANGE_REMOVED, tracked)
+            self._items[item_type] = current
+
+    def _fire(self, item_type, change, tracked):
+        self.hass.bus.async_fire(get_event_type(item_type, change), tracked.event_data())
@@ -7,7 +7,7 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import SOURCE_RECONFIGURE, ConfigFlow, ConfigFlowResult
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.selector import (
@@ -16,7 +16,36 @@ from homeassistant.helpers.selector import (
     TextSelectorType,
 )
 
-from .const import CONF_PROFILES, CONF_WORLDSTATES, DOMAIN
+from .const import (
+    CONF_API_URL,
+    CONF_ATTRIBUTE_SIZE,
+    CONF_CATALOG_SENSORS,
+    CONF_CONTENT_URL,
+    CONF_FRAME_INTERVAL,
+    CONF_IMPORT_STATISTICS,
+    CONF_LANGUAGE,
+    CONF_LEADERBOARD_SIZE,
+    CONF_LEADERBOARDS,
+    CONF_PLATFORM,
+    CONF_PROFILE_SENSORS,
+    CONF_PROFILES,
+    CONF_RECORD_FRAMES,
+    CONF_WATCHLIST,
+    CONF_WEBSOCKET_COMPRESSION,
+    CONF_WEBSOCKET_URL,
+    CONF_WORLDSTATES,
+    DEFAULT_ATTRIBUTE_SIZE,
+    DEFAULT_FRAME_INTERVAL,
+    DEFAULT_LANGUAGE,
+    DEFAULT_LEADERBOARD_SIZE,
+    DEFAULT_PLATFORM,
+    DOMAIN,
+    URL_BASE,
+    URL_RAW_BASE,
+    URL_WEBSOCKET,
+    WORLDSTATE_LANGUAGES,
+    WORLDSTATE_PLATFORMS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,15 +53,45 @@ _LOGGER = logging.getLogger(__name__)
 STEP_INIT_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_WORLDSTATES): bool,
-        # vol.Optional(CONF_PROFILES): TextSelector(
-        #     TextSelectorConfig(
-        #         type=TextSelectorType.TEXT,
-        #         multiple=True,
-        #     ),
-        # )
+        vol.Optional(CONF_PLATFORM, default=DEFAULT_PLATFORM): vol.In(WORLDSTATE_PLATFORMS),
+        vol.Optional(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): vol.In(WORLDSTATE_LANGUAGES),
+        vol.Optional(CONF_PROFILES): TextSelector(
+            TextSelectorConfig(
+                type=TextSelectorType.TEXT,
+                multiple=True,
+            ),
+        ),
+        vol.Optional(CONF_PROFILE_SENSORS, default=True): bool,
+        vol.Optional(CONF_LEADERBOARDS, default=False): bool,
+        vol.Optional(CONF_LEADERBOARD_SIZE, default=DEFAULT_LEADERBOARD_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=50)
+        ),
+        vol.Optional(CONF_IMPORT_STATISTICS, default=False): bool,
+        vol.Optional(CONF_WATCHLIST): TextSelector(
+            TextSelectorConfig(
+                type=TextSelectorType.TEXT,
+                multiple=True,
+            ),
+        ),
+        vol.Optional(CONF_ATTRIBUTE_SIZE, default=DEFAULT_ATTRIBUTE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+        vol.Optional(CONF_CATALOG_SENSORS, default=False): bool,
     }
 )
 
+# Only shown in advanced mode, used for soak testing and reproducing issues
+STEP_ADVANCED_DATA_SCHEMA = {
+    vol.Optional(CONF_API_URL, default=URL_BASE): str,
+    vol.Optional(CONF_CONTENT_URL, default=URL_RAW_BASE): str,
+    vol.Optional(CONF_WEBSOCKET_URL, default=URL_WEBSOCKET): str,
+    vol.Optional(CONF_WEBSOCKET_COMPRESSION, default=True): bool,
+    vol.Optional(CONF_FRAME_INTERVAL, default=DEFAULT_FRAME_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=300)
+    ),
+    vol.Optional(CONF_RECORD_FRAMES, default=False): bool,
+}
+
 class PlaceholderHub:
     """Placeholder class to make tests pass.
 
@@ -100,11 +159,24 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 self._options.update(user_input)
                 self._worldstates = user_input.get("worldstates")
-                self._profiles = user_input.get("account_ids")
+                self._profiles = user_input.get(CONF_PROFILES)
+                if self.source == SOURCE_RECONFIGURE:
+                    # Several entries can exist, update the one being reconfigured
+                    # and keep the options this pass did not ask for
+                    entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+                    return self.async_update_reload_and_abort(
+                        entry,
+                        data={**entry.data, **self._options},
+                        reason="reconfigure_successful",
+                    )
                 return self.async_create_entry(title="Warframe Stats", data=self._options)
 
+        data_schema = STEP_INIT_DATA_SCHEMA
+        if self.show_advanced_options:
+            data_schema = data_schema.extend(STEP_ADVANCED_DATA_SCHEMA)
+
         return self.async_show_form(
-            step_id="user", data_schema=STEP_INIT_DATA_SCHEMA, errors=errors
+            step_id="user", data_schema=data_schema, errors=errors
         )
 
     # async def async_step_worldstates(
@@ -3,6 +3,8 @@
 DOMAIN = "warframe"
 
 CONF_WORLDSTATES = "worldstates"
+CONF_PLATFORM = "platform"
+CONF_LANGUAGE = "language"
 CONF_PROFILES = "profiles"
 CONF_STATIC_ITEMS = "static_items"
 
@@ -34,10 +36,35 @@ CONF_RANK = "rank"
 CONF_DEATHS = "death"
 CONF_TIME_PLAYED = "time_played"
 CONF_STAR_CHART_COMPLETION = "star_chart_completion"
+CONF_PROFILE_SENSORS = "profile_sensors"
+CONF_LEADERBOARDS = "leaderboards"
+CONF_LEADERBOARD_SIZE = "leaderboard_size"
+CONF_IMPORT_STATISTICS = "import_statistics"
+CONF_WATCHLIST = "watchlist"
+CONF_ATTRIBUTE_SIZE = "attribute_size"
 
+DEFAULT_LEADERBOARD_SIZE = 5
+DEFAULT_ATTRIBUTE_SIZE = 50
+# Seconds between two worldstate packets of a platform and language
+DEFAULT_FRAME_INTERVAL = 5
+DEFAULT_PLATFORM = "pc"
+DEFAULT_LANGUAGE = "en"
+
+WORLDSTATE_PLATFORMS = ["pc", "ps4", "xb1", "swi"]
+WORLDSTATE_LANGUAGES = ["en", "de", "es", "fr", "it", "ko", "pl", "pt", "ru", "uk", "zh"]
+
+CONF_API_URL = "api_url"
+CONF_CONTENT_URL = "content_url"
+CONF_WEBSOCKET_URL = "websocket_url"
+CONF_WEBSOCKET_COMPRESSION = "websocket_compression"
+CONF_FRAME_INTERVAL = "frame_interval"
+CONF_RECORD_FRAMES = "record_frames"
+
+CONF_CATALOG_SENSORS = "catalog_sensors"
 CONF_TOTAL_ITEMS = "total_items"
 CONF_TOTAL_PRIME_ITEMS = "total_prime_items"
 CONF_NEWEST_WARFRAME = "newest_warframe"
+CONF_ITEMS_ADDED = "items_added"
 
 URL_BASE = "https://api.warframestat.us/"
 URL_TRANSLATION_SORTIES_ENDPOINT = "sortie"
@@ -53,6 +80,9 @@ ITEM_SETS_TO_INCLUDE = ["Warframe","Pets","Sentinels","Node","Enemy","Primary","
 URL_STATIC_DATA_LOOKUP_QUERY_PARAMS = "?by=category"
 
 URL_RAW_BASE = "https://content.warframe.com/"
+URL_WEBSOCKET = "wss://api.warframestat.us/socket"
+# The plain default of earlier versions, kept by entries set up in advanced mode
+URL_WEBSOCKET_PLAIN = "ws://api.warframestat.us:80/socket"
 URL_RAW_PROFILE_ENDPOINT = "dynamic/getProfileViewingData.php"
 URL_RAW_PROFILE_QUERY_PARAMS = "?playerId="
 
@@ -1,46 +1,113 @@
+import asyncio
 from datetime import timedelta
 import logging
-import socket
 import json
+import time
 
-import aiohttp
-from yarl import URL
-
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CALLBACK_TYPE, Event, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 _LOGGER = logging.getLogger(__name__)
 
 from .const import (  # noqa: E402
+    CONF_API_URL,
+    CONF_ATTRIBUTE_SIZE,
+    CONF_CONTENT_URL,
+    CONF_FRAME_INTERVAL,
+    CONF_IMPORT_STATISTICS,
+    CONF_LANGUAGE,
+    CONF_LEADERBOARD_SIZE,
+    CONF_LEADERBOARDS,
+    CONF_PLATFORM,
+    CONF_PROFILES,
+    CONF_RECORD_FRAMES,
+    CONF_WATCHLIST,
+    CONF_WEBSOCKET_COMPRESSION,
+    CONF_WEBSOCKET_URL,
+    DEFAULT_ATTRIBUTE_SIZE,
+    DEFAULT_FRAME_INTERVAL,
+    DEFAULT_LANGUAGE,
+    DEFAULT_LEADERBOARD_SIZE,
+    DEFAULT_PLATFORM,
+    DOMAIN,
     ITEM_SETS_TO_INCLUDE,
     URL_BASE,
     URL_PRE_PROFILE_ENDPOINT,
     URL_STATIC_DATA_LOOKUP,
     URL_STATIC_DATA_LOOKUP_QUERY_PARAMS,
     URL_STATS_ENDPOINT,
-    URL_TRANSLATION_FACTIONS_ENDPOINT,
-    URL_TRANSLATION_FISSURE_MODIFERS_ENDPOINT,
-    URL_TRANSLATION_MISSION_TYPES_ENDPOINT,
     URL_TRANSLATION_OTHER_ENDPOINT,
-    URL_TRANSLATION_SOL_NODES_ENDPOINT,
-    URL_TRANSLATION_SORTIES_ENDPOINT,
-    URL_TRANSLATION_SYNDICATES_ENDPOINT,
-    URL_TRANSLATION_WARFRAME_ENDPOINT,
-    URL_WORLD_STATE_ENDPOINT,
     URL_RAW_BASE,
     URL_RAW_PROFILE_ENDPOINT,
-    URL_RAW_PROFILE_QUERY_PARAMS
+    URL_RAW_PROFILE_QUERY_PARAMS,
+    URL_WEBSOCKET,
+    URL_WEBSOCKET_PLAIN,
+)
+from .catalog import CATALOG_ITEM_TYPES, EVENT_CATALOG_ITEM_ADDED, WarframeCatalogJoin, WarframeCatalogStats  # noqa: E402
+from .changes import WarframeWorldstateChanges  # noqa: E402
+from .leaderboard import WarframeLeaderboard  # noqa: E402
+from .metrics import (  # noqa: E402
+    METRIC_BYTES_RECEIVED,
+    METRIC_DECODE_TIME,
+    METRIC_FETCH_ERRORS,
+    METRIC_FETCH_LATENCY,
+    METRIC_FETCHES,
+    METRIC_FRAMES_RECEIVED,
+    METRIC_INDEX_BUILD_TIME,
+    METRIC_LOOKUP_BUILD_TIME,
+    METRIC_READ_TIME,
+    METRIC_WIRE_BYTES,
+    WarframeCoordinatorMetrics,
 )
+from .recorder import WarframeFrameRecorder, get_recording_path  # noqa: E402
+from .search import WarframeCatalogIndex  # noqa: E402
+from .session import async_get_session  # noqa: E402
+from .statistics import WarframeProfileStatistics  # noqa: E402
+from .store import WarframeSnapshotStore, profiles_digest, worldstate_digest  # noqa: E402
+from .translations import TRANSLATION_NODES, WarframeTranslations  # noqa: E402
+from .watchlist import WarframeWatchlist  # noqa: E402
+from .websocket import async_dispatch_frame, async_get_worldstate_socket  # noqa: E402
+
 
+class WarframeDataUpdateCoordinator(DataUpdateCoordinator):
+    """Coordinator that times every listener callback into its metrics."""
+
+    @property
+    def session(self):
+        # Looked up on every use, another entry may have closed the last one
+        return async_get_session(self.hass)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        durations = []
+        for update_callback, _ in list(self._listeners.values()):
+            start = time.perf_counter()
+            update_callback()
+            durations.append((_get_callback_name(update_callback), time.perf_counter() - start))
+        self.metrics.record_callbacks(durations)
+
+class WarframeStaticDataUpdateCoordinator(WarframeDataUpdateCoordinator):
+    @staticmethod
+    def get_key(config):
+        """Return what the coordinator fetches, entries with the same key share it."""
+        return ("static", _get_base_url(config, CONF_API_URL, URL_BASE))
 
-class WarframeStaticDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass, entry):
         """Initialize the coordinator."""
-        self.session = async_get_clientsession(hass)
         self.config = entry.data
+        self.metrics = WarframeCoordinatorMetrics("static")
+        self.api_url = _get_base_url(self.config, CONF_API_URL, URL_BASE)
         self.name_lookup = {}
+        self.catalog_version = 0
+        self.catalog_stats = WarframeCatalogStats()
+        self.catalog_join = WarframeCatalogJoin()
+        self.search_index = WarframeCatalogIndex()
+        self._new_lookup = {}
+        self._new_stats = None
+        self._resolve_cache = {}
+        self._resolve_cache_version = None
+        self._load_lock = asyncio.Lock()
+        self.translations = WarframeTranslations(hass, self.api_url, self._async_fetch)
 
         update_interval = timedelta(seconds=(3600 * 24))
         super().__init__(
@@ -50,244 +117,152 @@ class WarframeStaticDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
+    async def async_ensure_loaded(self):
+        """Load the catalog the first time a consumer needs it."""
+        if self.catalog_version:
+            return
+        async with self._load_lock:
+            if not self.catalog_version:
+                await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Let go of the catalog."""
+        await super().async_shutdown()
+        self.name_lookup = {}
+        self.catalog_version = 0
+        self.catalog_stats = WarframeCatalogStats()
+        self.catalog_join = WarframeCatalogJoin()
+        self.search_index = WarframeCatalogIndex()
+        self._new_lookup = {}
+        self._new_stats = None
+        self._resolve_cache = {}
+        self._resolve_cache_version = None
+        self.translations.clear()
+
+    async def _async_fetch(self, url):
+        return await _makeRequest(url, self.session, metrics=self.metrics)
+
     async def _async_update_data(self):
+        self._new_lookup = {}
         try:
-            # await self._get_init_data(self.session)
             await self._get_item_data(self.session)
             await self._standardise_lookup()
         except Exception as err:
-            print(err)
+            # The catalog held so far is kept
+            self.logger.warning("Could not update the static catalog: %s", err)
+        self._new_lookup = {}
+        self._new_stats = None
+        # Only the tables sensors asked for are kept fresh
+        await self.translations.async_refresh()
 
     async def _standardise_lookup(self):
-        self.name_lookup = {k.lower(): v for k, v in self.name_lookup.items()}
+        name_lookup = {k.lower(): v for k, v in self._new_lookup.items()}
+        # Only a changed catalog invalidates the resolved names
+        if name_lookup != self.name_lookup:
+            self.name_lookup = name_lookup
+            self.catalog_version += 1
+            await self._async_update_catalog_indexes()
+
+    async def _async_update_catalog_indexes(self):
+        """Rebuild what is derived from the catalog after it changed.
+
+        The trader join and search index are built in the executor, so the
+        event loop keeps running, and swapped in once both are built. Until
+        then the ones of the previous catalog are used.
+        """
+        self._update_catalog_stats()
+        name_lookup = self.name_lookup
+        catalog_join, search_index, index_build_time = await self.hass.async_add_executor_job(
+            _build_catalog_indexes, name_lookup
+        )
+        # A newer catalog (or a shutdown) came in while they were built
+        if self.name_lookup is not name_lookup:
+            return
+        # Resolved trader items are only cached for the catalog they came from
+        self.catalog_join = catalog_join
+        self.search_index = search_index
+        self.metrics.record_time(METRIC_INDEX_BUILD_TIME, index_build_time)
+
+    def _update_catalog_stats(self):
+        stats = self._new_stats or WarframeCatalogStats()
+        stats.finish()
+        # The first catalog adds nothing
+        if not (stats.total and self.catalog_stats.total):
+            stats.added = []
+        self.catalog_stats = stats
+        for item in stats.added:
+            self.hass.bus.async_fire(EVENT_CATALOG_ITEM_ADDED, item | {"catalog_version": self.catalog_version})
+
+    def resolve(self, item_type, partial=False, layers=()):
+        """Return the lookup entry for a raw profile type, or None.
+
+        Types the catalog does not know are looked up in the translation
+        tables of ``layers``, in order, once they are loaded. Results are
+        cached by the raw type string and shared by every account until the
+        catalog or a translation table changes.
+        """
+        version = (self.catalog_version, self.translations.version)
+        if self._resolve_cache_version != version:
+            self._resolve_cache = {}
+            self._resolve_cache_version = version
+
+        cache_key = (item_type, partial, layers)
+        try:
+            return self._resolve_cache[cache_key]
+        except KeyError:
+            pass
+
+        if partial:
+            data = _get_partial_lookup(item_type, self.name_lookup)
+        else:
+            data = self.name_lookup.get(item_type.lower())
+        for domain in layers:
+            if data is not None:
+                break
+            data = self.translations.tables.get(domain, {}).get(item_type.lower())
+        self._resolve_cache[cache_key] = data
+        return data
 
     async def _get_item_data(self, session):
         # Gets some basic strings lookup
+        # A failed request raises, an empty catalog must not replace the last one
         await self._update_lookup_if_valid(
-            await _makeRequest(f"{URL_BASE}{URL_TRANSLATION_OTHER_ENDPOINT}", session)
+            await _makeRequest(f"{self.api_url}{URL_TRANSLATION_OTHER_ENDPOINT}", session, metrics=self.metrics, raise_errors=True)
         )
 
         # Gets indepth naming data for items
-        static_data = await _makeRequest(f"{URL_BASE}{URL_STATIC_DATA_LOOKUP}{",".join(ITEM_SETS_TO_INCLUDE)}{URL_STATIC_DATA_LOOKUP_QUERY_PARAMS}", session)
-        for item in static_data:
-            match item.get("category"):
-                case "Warframes":
-                    # warframe
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "warframe"
-                        }
-                    })
-                    # abilities
-                    for ability in item.get("abilities", []):
-                        self.name_lookup.update({
-                        ability.get("uniqueName"): {
-                            "value": ability.get("name"),
-                            "description": ability.get("description"),
-                            "type": "ability"
-                            }
-                        })
-                case "Archwing":
-                    # archwing
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "archwing"
-                        }
-                    })
-                    # abilities
-                    for ability in item.get("abilities", []):
-                        self.name_lookup.update({
-                        ability.get("uniqueName"): {
-                            "value": ability.get("name"),
-                            "description": ability.get("description"),
-                            "type": "ability"
-                            }
-                        })
-                case "Sentinels":
-                    # sentinel
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "companion"
-                        }
-                    })
-                case "Pets":
-                    # pet
-                    if item.get("type") and item.get("type") == "Pet":
-                        self.name_lookup.update({
-                            item.get("uniqueName"): {
-                                "value": item.get("name"),
-                                "description": item.get("description"),
-                                "type": "companion"
-                            }
-                        })
-                case "Primary":
-                    # primary
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "primary" if item.get("type") and item.get("type") != "Companion Weapon" else "companion-weapon",
-                        }
-                    })
-                case "Secondary":
-                    # secondary
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "secondary"
-                        }
-                    })
-                case "Melee":
-                    # melee
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "melee"
-                        }
-                    })
-                case "Arch-Gun":
-                    # arch-gun
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "arch-gun"
-                        }
-                    })
-                case "Arch-Melee":
-                    # arch-melee
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description"),
-                            "type": "arch-melee"
-                        }
-                    })
-                case "Enemy":
-                    # enemy
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "description": item.get("description")
-                        }
-                    })
-                case "Node":
-                    # node
-                    self.name_lookup.update({
-                        item.get("uniqueName"): {
-                            "value": item.get("name"),
-                            "systemName": item.get("systemName")
-                        }
-                    })
-
-    async def _get_init_data(self, session):
-        # Sorties Modifiers
-        await self._update_lookup_if_valid(
-            await self._orginize_sorties_lookup(
-                await _makeRequest(
-                    f"{URL_BASE}{URL_TRANSLATION_SORTIES_ENDPOINT}", session
-                )
-            )
-        )
-        # Warframe Abilities
-        await self._update_lookup_if_valid(
-            await self._orginize_warframe_abilitiy_lookup(
-                await _makeRequest(
-                    f"{URL_BASE}{URL_TRANSLATION_WARFRAME_ENDPOINT}", session
-                )
-            )
-        )
-        # Faction Names
-        await self._update_lookup_if_valid(
-            await _makeRequest(
-                f"{URL_BASE}{URL_TRANSLATION_FACTIONS_ENDPOINT}", session
-            )
-        )
-        # Node Names
-        await self._update_lookup_if_valid(
-            await _makeRequest(
-                f"{URL_BASE}{URL_TRANSLATION_SOL_NODES_ENDPOINT}", session
-            )
-        )
-        # Fissures
-        await self._update_lookup_if_valid(
-            await _makeRequest(
-                f"{URL_BASE}{URL_TRANSLATION_FISSURE_MODIFERS_ENDPOINT}", session
-            )
-        )
-        # Syndicates (All including things like Ostrons and such)
-        await self._update_lookup_if_valid(
-            await _makeRequest(
-                f"{URL_BASE}{URL_TRANSLATION_SYNDICATES_ENDPOINT}", session
-            )
-        )
-        # Mission Types
-        await self._update_lookup_if_valid(
-            await _makeRequest(
-                f"{URL_BASE}{URL_TRANSLATION_MISSION_TYPES_ENDPOINT}", session
-            )
-        )
-        # Everything else
-        await self._update_lookup_if_valid(
-            await _makeRequest(f"{URL_BASE}{URL_TRANSLATION_OTHER_ENDPOINT}", session)
-        )
+        static_data = await _makeRequest(f"{self.api_url}{URL_STATIC_DATA_LOOKUP}{",".join(ITEM_SETS_TO_INCLUDE)}{URL_STATIC_DATA_LOOKUP_QUERY_PARAMS}", session, metrics=self.metrics, raise_errors=True)
+        if not static_data or not isinstance(static_data, list):
+            raise UpdateFailed("The items endpoint returned no items")
+        start = time.perf_counter()
+        # The catalog figures are gathered in the same pass
+        self._new_stats = WarframeCatalogStats(self.name_lookup if self.catalog_stats.total else None)
+        _build_item_lookup(static_data, self._new_lookup, self._new_stats)
+        self.metrics.record_time(METRIC_LOOKUP_BUILD_TIME, time.perf_counter() - start)
 
     async def _update_lookup_if_valid(self, data):
         for key, value in data.items():
             if isinstance(key, str) and isinstance(value, dict):
                 if value.get("value"):
-                    self.name_lookup.update({key: value})
-
-    async def _orginize_sorties_lookup(self, sorties_data):
-        orginized_sorties_data = {}
-        for key, value in sorties_data.items():
-            if isinstance(key, str) and isinstance(value, dict):
-                if key == "modifierTypes":
-                    for modifier_key, modifier_value in value.items():
-                        sortie_modifier = orginized_sorties_data.get(modifier_key, {})
-                        sortie_modifier.update({"value": modifier_value})
-                        # This might be unessesary (idk how object ref work in python)
-                        orginized_sorties_data.update({modifier_key: sortie_modifier})
-                elif key == "modifierDescriptions":
-                    for modifier_key, modifier_description in value.items():
-                        sortie_modifier = orginized_sorties_data.get(modifier_key, {})
-                        sortie_modifier.update({"description": modifier_description})
-                        # This might be unessesary (idk how object ref work in python)
-                        orginized_sorties_data.update({modifier_key: sortie_modifier})
-                elif key == "bosses":
-                    for boss_key, boss_value in value.items():
-                        orginized_sorties_data.update({boss_key: {"value": boss_value}})
-        return orginized_sorties_data
-
-    async def _orginize_warframe_abilitiy_lookup(self, warframe_data):
-        orginized_warframe_ability_data = {}
-        for warframe_entity in warframe_data:
-            if isinstance(warframe_entity, dict):
-                abilities = warframe_entity.get("abilities")
-                if abilities and isinstance(abilities, list):
-                    for ability in abilities:
-                        ability_data = {
-                            "value": ability.get("name"),
-                            "description": ability.get("description"),
-                        }
-                        orginized_warframe_ability_data.update(
-                            {ability.get("uniqueName"): ability_data}
-                        )
-        return orginized_warframe_ability_data
+                    self._new_lookup.update({key: value})
 
-class WarframeProfileDataUpdateCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, entry):
+class WarframeProfileDataUpdateCoordinator(WarframeDataUpdateCoordinator):
+    def __init__(self, hass, entry, static_data):
         """Initialize the coordinator."""
-        self.session = async_get_clientsession(hass)
         self.config = entry.data
+        self.metrics = WarframeCoordinatorMetrics("profile")
+        self.content_url = _get_base_url(self.config, CONF_CONTENT_URL, URL_RAW_BASE)
+        self.static_data = static_data
+        self.leaderboard = None
+        if self.config.get(CONF_LEADERBOARDS):
+            self.leaderboard = WarframeLeaderboard(
+                self.config.get(CONF_LEADERBOARD_SIZE, DEFAULT_LEADERBOARD_SIZE)
+            )
+        self.statistics = None
+        if self.config.get(CONF_IMPORT_STATISTICS):
+            self.statistics = WarframeProfileStatistics(hass, entry)
+        self._snapshot_store = WarframeSnapshotStore(hass, f"{DOMAIN}.{entry.entry_id}.profiles", profiles_digest)
+        self._restored_data = None
 
         update_interval = timedelta(seconds=3600)
         super().__init__(
@@ -297,14 +272,47 @@ class WarframeProfileDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
+    async def _async_setup(self):
+        if self.statistics is not None:
+            # Import anything left over from before the last restart
+            await self.statistics.async_load()
+            self.statistics.async_import()
+
+        snapshot = await self._snapshot_store.async_load()
+        if snapshot:
+            self._restored_data = {
+                account_id: profile_data
+                for account_id, profile_data in snapshot.items()
+                if account_id in self.config.get(CONF_PROFILES, [])
+            }
+
+    async def async_shutdown(self) -> None:
+        """Write what is waiting to be saved."""
+        await super().async_shutdown()
+        await self._snapshot_store.async_flush()
+        if self.statistics is not None:
+            await self.statistics.async_flush()
+        self._restored_data = None
+
     async def _async_update_data(self):
+        if self._restored_data:
+            # Serve the last snapshot straight away and revalidate in the background
+            user_data = self._restored_data
+            self._restored_data = None
+            self._async_resolve_later(user_data, record=False)
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_refresh(), "warframe-profile-revalidate"
+            )
+            return user_data
+
         user_data = {}
-        for account_id in self.config.get("profiles", []):
+        for account_id in self.config.get(CONF_PROFILES, []):
             single_user_data = {}
             try:
                 single_user_data = await _makeRequest(
-                        f"{URL_RAW_BASE}{URL_RAW_PROFILE_ENDPOINT}{URL_RAW_PROFILE_QUERY_PARAMS}{account_id}",
-                        self.session
+                        f"{self.content_url}{URL_RAW_PROFILE_ENDPOINT}{URL_RAW_PROFILE_QUERY_PARAMS}{account_id}",
+                        self.session,
+                        metrics=self.metrics,
                     )
             except Exception as err:
                 self.logger.info(f"Could not update get user data for account ID {account_id}: {err}")
@@ -314,16 +322,86 @@ class WarframeProfileDataUpdateCoordinator(DataUpdateCoordinator):
                     account_id: single_user_data
                 }
             )
+        if user_data:
+            self._snapshot_store.async_save(user_data)
+        if self.static_data.catalog_version:
+            await self._async_resolve(user_data)
+        else:
+            self._async_resolve_later(user_data)
         return user_data
 
-class WarframeWorldstateDataUpdateCoordinator(DataUpdateCoordinator):
+    async def _async_resolve(self, user_data, record=True):
+        """Fold profiles into the leaderboards and statistics, which name their items."""
+        await self.static_data.async_ensure_loaded()
+        if self.statistics is not None and record:
+            # The star chart statistic counts the nodes the sensor can name
+            await self.static_data.translations.async_load(TRANSLATION_NODES)
+        for account_id, single_user_data in user_data.items():
+            if self.leaderboard is not None:
+                self.leaderboard.update_account(
+                    account_id, single_user_data, self.static_data.resolve
+                )
+            if self.statistics is not None and record:
+                self.statistics.async_record(account_id, single_user_data, self.static_data.resolve)
+        if self.statistics is not None and record:
+            self.statistics.async_import()
+
+    @callback
+    def _async_resolve_later(self, user_data, record=True):
+        """Resolve the profiles once the catalog is loaded, without holding up the update.
+
+        The sensors are updated again then, so they show the resolved names.
+        """
+        async def resolve():
+            await self._async_resolve(user_data, record)
+            if self.data is user_data:
+                self.async_update_listeners()
+
+        self.config_entry.async_create_background_task(
+            self.hass, resolve(), "warframe-profile-resolve"
+        )
+
+class WarframeWorldstateDataUpdateCoordinator(WarframeDataUpdateCoordinator):
+    @staticmethod
+    def get_key(config):
+        """Return what the coordinator fetches, entries with the same key share it."""
+        return (
+            "worldstate",
+            _get_base_url(config, CONF_API_URL, URL_BASE),
+            _get_websocket_url(config),
+            config.get(CONF_WEBSOCKET_COMPRESSION, True),
+            config.get(CONF_PLATFORM, DEFAULT_PLATFORM),
+            config.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
+            # Only the owner creates the worldstate sensors, so they are
+            # shared by the entries limiting their attributes the same way
+            config.get(CONF_ATTRIBUTE_SIZE, DEFAULT_ATTRIBUTE_SIZE),
+        )
+
     def __init__(self, hass, entry):
         """Initialize the coordinator."""
-        self.session = async_get_clientsession(hass)
         self.config = entry.data
+        self.metrics = WarframeCoordinatorMetrics("worldstate")
+        self.api_url = _get_base_url(self.config, CONF_API_URL, URL_BASE)
+        self.platform = self.config.get(CONF_PLATFORM, DEFAULT_PLATFORM)
+        self.language = self.config.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
         self.world_state_data = None
-        self._client: aiohttp.ClientWebSocketResponse | None = None
-        self.unsub: CALLBACK_TYPE | None = None
+        self.changes = WarframeWorldstateChanges(hass)
+        # The options below are kept per entry using the coordinator
+        self.watchlists = {}
+        self._frame_intervals = {}
+        self._recording_entries = set()
+        # Shared by every entry following this platform and language
+        self._snapshot_store = WarframeSnapshotStore(
+            hass, f"{DOMAIN}.worldstate_{self.platform}_{self.language}", worldstate_digest
+        )
+        self._recorder = None
+        self._socket = async_get_worldstate_socket(
+            hass,
+            _get_websocket_url(self.config),
+            self.config.get(CONF_WEBSOCKET_COMPRESSION, True),
+        )
+        self._unsubscribe_socket: CALLBACK_TYPE | None = None
+        self._revalidate_task = None
 
         update_interval = timedelta(seconds=10)
         super().__init__(
@@ -333,125 +411,339 @@ class WarframeWorldstateDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
-    async def _async_setup(self):
-        self.world_state_data = await _makeRequest(
-            f"{URL_BASE}{URL_WORLD_STATE_ENDPOINT}", self.session
+    @property
+    def frame_interval(self):
+        """Return the shortest Frame Interval of the entries using the coordinator."""
+        return min(
+            self._frame_intervals.values(),
+            default=self.config.get(CONF_FRAME_INTERVAL, DEFAULT_FRAME_INTERVAL),
         )
 
     @callback
-    def _use_websocket(self) -> None:
-        """Use WebSocket for updates, instead of polling."""
+    def async_attach_entry(self, entry):
+        """Apply the Reward Watchlist, Frame Interval and Record WebSocket Frames of an entry.
+
+        Every entry sharing the coordinator gets its own watchlist, matched
+        against the packets of the shared socket. Frames are processed at the
+        shortest Frame Interval and recorded while any entry asks for it.
+        """
+        watchlist = WarframeWatchlist(self.hass, entry.data.get(CONF_WATCHLIST), entry.entry_id)
+        # What is already available when the entry is set up fires no events
+        watchlist.async_update(self.world_state_data)
+        self.watchlists[entry.entry_id] = watchlist
+        self._frame_intervals[entry.entry_id] = entry.data.get(CONF_FRAME_INTERVAL, DEFAULT_FRAME_INTERVAL)
+        if entry.data.get(CONF_RECORD_FRAMES):
+            self._recording_entries.add(entry.entry_id)
+            if self._recorder is None:
+                self._recorder = WarframeFrameRecorder(self.hass, get_recording_path(self.hass))
+                _LOGGER.info("Recording worldstate frames to %s", self._recorder.path)
+
+    async def async_detach_entry(self, entry_id):
+        """Drop the options of an entry that no longer uses the coordinator."""
+        self.watchlists.pop(entry_id, None)
+        self._frame_intervals.pop(entry_id, None)
+        self._recording_entries.discard(entry_id)
+        if not self._recording_entries and self._recorder is not None:
+            recorder = self._recorder
+            self._recorder = None
+            await recorder.async_flush()
+
+    @property
+    def worldstate_url(self):
+        url = f"{self.api_url}{self.platform}"
+        if self.language != DEFAULT_LANGUAGE:
+            url = f"{url}?language={self.language}"
+        return url
 
-        async def listen() -> None:
-            """Listen for state changes via WebSocket."""
-            try:
-                await self._connect()
-            except Exception as err:
-                self.logger.info(err)
-                return
+    async def _async_setup(self):
+        snapshot = await self._snapshot_store.async_load()
+        if snapshot:
+            # Start from the last packet and revalidate in the background
+            self.world_state_data = snapshot
+            self._process_packet(snapshot)
+            # Not tied to an entry, the coordinator is shared by all of them
+            self._revalidate_task = self.hass.async_create_background_task(
+                self._async_revalidate(snapshot), "warframe-worldstate-revalidate"
+            )
+        else:
+            self.world_state_data = await _makeRequest(
+                self.worldstate_url, self.session, metrics=self.metrics
+            )
+            self._process_packet(self.world_state_data)
+            self._snapshot_store.async_save(self.world_state_data)
 
-            try:
-                await self._listen()
-            except Exception as err:
-                self.last_update_success = False
-                self.logger.error(err)
-
-            # Ensure we are disconnected
-            await self._disconnect()
-            if self.unsub:
-                self.unsub()
-                self.unsub = None
-
-        async def close_websocket(_: Event) -> None:
-            """Close WebSocket connection."""
-            self.unsub = None
-            await self._disconnect()
-
-        # Clean disconnect WebSocket on Home Assistant shutdown
-        self.unsub = self.hass.bus.async_listen_once(
-            EVENT_HOMEASSISTANT_STOP, close_websocket
-        )
+        self._unsubscribe_socket = self._socket.async_subscribe(self.platform, self.language, self)
 
-        # Start listening
-        self.config_entry.async_create_background_task(
-            self.hass, listen(), "warframe-ws-listen"
-        )
+    async def _async_revalidate(self, snapshot):
+        try:
+            world_state_data = await _makeRequest(
+                self.worldstate_url, self.session, metrics=self.metrics
+            )
+        except UpdateFailed as err:
+            self.logger.info(f"Could not revalidate the restored worldstate: {err}")
+            return
 
-    async def _connect(self):
+        # A packet from the WebSocket is newer than the REST response
+        if world_state_data and self.world_state_data is snapshot:
+            self.world_state_data = world_state_data
+            self._process_packet(world_state_data)
+            self._snapshot_store.async_save(world_state_data)
+            self.async_set_updated_data(world_state_data)
+
+    async def async_shutdown(self) -> None:
+        """Leave the shared WebSocket."""
+        await super().async_shutdown()
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+        if self._unsubscribe_socket is not None:
+            self._unsubscribe_socket()
+            self._unsubscribe_socket = None
+        await self.async_flush_recorder()
+        await self._snapshot_store.async_flush()
+
+    async def async_flush_recorder(self):
+        if self._recorder is not None:
+            await self._recorder.async_flush()
 
-        if self._client is not None and not self._client.closed:
-            return
+    @callback
+    def _process_packet(self, world_state_data):
+        """Fire the events of a new worldstate packet."""
+        self.changes.async_update(world_state_data)
+        for watchlist in self.watchlists.values():
+            watchlist.async_update(world_state_data)
 
-        url = URL.build(
-            scheme="ws", host="api.warframestat.us", port=80, path="/socket"
-        )
+    @callback
+    def async_frame_received(self, raw, wire_bytes=None, read_time=None):
+        """Count (and record) a raw frame of the shared WebSocket."""
+        if self._recorder is not None:
+            self._recorder.async_record(raw)
+        self.metrics.increment(METRIC_FRAMES_RECEIVED)
+        self.metrics.increment(METRIC_BYTES_RECEIVED, len(raw))
+        if wire_bytes is not None:
+            self.metrics.increment(METRIC_WIRE_BYTES, wire_bytes)
+            self.metrics.record_time(METRIC_READ_TIME, read_time)
 
-        try:
-            self._client = await self.session.ws_connect(
-                url=url, heartbeat=30
-            )
-        except (
-            aiohttp.WSServerHandshakeError,
-            aiohttp.ClientConnectionError,
-            socket.gaierror,
-        ):
-            msg = (
-                "Error occurred while communicating with Warframe API"
-                " on WebSocket at api.warframestat.us"
-            )
-            self.logger.error(msg)
-
-    async def _listen(self):
-        self.logger.info("_listen")
-        if not self._client or not (self._client is not None and not self._client.closed):
-            msg = "Not connected to a Warframe WebSocket"
-            self.logger.info(msg)
-
-        while not self._client.closed:
-            message = await self._client.receive()
-
-            if message.type == aiohttp.WSMsgType.ERROR:
-                self.logger.error(self._client.exception())
-
-            if message.type == aiohttp.WSMsgType.TEXT:
-                message_data = message.json()
-                if message_data.get("event") == "ws:update":
-                    if message_data.get("packet").get("language") == "en":
-                        self.world_state_data = message_data.get("packet").get("data")
-
-            if message.type in (
-                aiohttp.WSMsgType.CLOSE,
-                aiohttp.WSMsgType.CLOSED,
-                aiohttp.WSMsgType.CLOSING,
-            ):
-                msg = "Connection to the Warframe WebSocket on api.warframestat.us has been closed"
-                self.logger.error(self._client.exception())
-                self.logger.error(msg)
-
-    async def _disconnect(self):
-        self.logger.info("_disconnect")
-        await self._client.close()
+    @callback
+    def _handle_frame(self, raw):
+        """Process one raw WebSocket frame as if only this coordinator subscribed."""
+        async_dispatch_frame(raw, {(self.platform, self.language): [self]}, self._socket.strings)
+
+    @callback
+    def _handle_packet(self, world_state_data):
+        """Take the decoded packet of this coordinator's platform and language."""
+        self.world_state_data = world_state_data
+        self._process_packet(world_state_data)
+        self._snapshot_store.async_save(world_state_data)
 
     async def _async_update_data(self):
-        if (not (self._client is not None and not self._client.closed)
-            and not self.unsub
-        ):
-            self._use_websocket()
+        if self._unsubscribe_socket is not None:
+            self._socket.async_ensure_connected()
 
         return self.world_state_data
 
 
-async def _makeRequest(url, session, logger=None):
+def _get_base_url(config, key, default):
+    url = config.get(key) or default
+    return url if url.endswith("/") else f"{url}/"
+
+
+def _get_websocket_url(config):
+    url = config.get(CONF_WEBSOCKET_URL) or URL_WEBSOCKET
+    # Entries saved with the old plain default move to the secure one
+    return URL_WEBSOCKET if url == URL_WEBSOCKET_PLAIN else url
+
+
+def _build_item_lookup(static_data, lookup, stats=None):
+    for item in static_data:
+        match item.get("category"):
+            case "Warframes":
+                # warframe
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "warframe"
+                    }
+                })
+                # abilities
+                for ability in item.get("abilities", []):
+                    lookup.update({
+                    ability.get("uniqueName"): {
+                        "value": ability.get("name"),
+                        "description": ability.get("description"),
+                        "type": "ability"
+                        }
+                    })
+            case "Archwing":
+                # archwing
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "archwing"
+                    }
+                })
+                # abilities
+                for ability in item.get("abilities", []):
+                    lookup.update({
+                    ability.get("uniqueName"): {
+                        "value": ability.get("name"),
+                        "description": ability.get("description"),
+                        "type": "ability"
+                        }
+                    })
+            case "Sentinels":
+                # sentinel
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "companion"
+                    }
+                })
+            case "Pets":
+                # pet
+                if item.get("type") and item.get("type") == "Pet":
+                    lookup.update({
+                        item.get("uniqueName"): {
+                            "value": item.get("name"),
+                            "description": item.get("description"),
+                            "type": "companion"
+                        }
+                    })
+            case "Primary":
+                # primary
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "primary" if item.get("type") and item.get("type") != "Companion Weapon" else "companion-weapon",
+                    }
+                })
+            case "Secondary":
+                # secondary
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "secondary"
+                    }
+                })
+            case "Melee":
+                # melee
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "melee"
+                    }
+                })
+            case "Arch-Gun":
+                # arch-gun
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "arch-gun"
+                    }
+                })
+            case "Arch-Melee":
+                # arch-melee
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description"),
+                        "type": "arch-melee"
+                    }
+                })
+            case "Enemy":
+                # enemy
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "description": item.get("description")
+                    }
+                })
+            case "Node":
+                # node
+                lookup.update({
+                    item.get("uniqueName"): {
+                        "value": item.get("name"),
+                        "systemName": item.get("systemName")
+                    }
+                })
+        entry = lookup.get(item.get("uniqueName"))
+        if entry is not None and entry.get("type") in CATALOG_ITEM_TYPES:
+            # For the trader join, a fourth key keeps the entry's dict size
+            entry["isPrime"] = bool(item.get("isPrime"))
+        if stats is not None and entry is not None:
+            stats.add(item, entry)
+
+
+def _build_catalog_indexes(name_lookup):
+    """Return the trader join and search index of a lookup, and the seconds the index took.
+
+    Runs in the executor, the lookup is only read.
+    """
+    catalog_join = WarframeCatalogJoin(name_lookup)
+    start = time.perf_counter()
+    search_index = WarframeCatalogIndex(name_lookup)
+    return catalog_join, search_index, time.perf_counter() - start
+
+
+def _get_partial_lookup(to_lookup, lookup_table, default=None):
+    to_lookup = to_lookup.lower()
+    data = lookup_table.get(to_lookup)
+    if data is not None:
+        return data
+    for lookup_key, data in lookup_table.items():
+        ## if lookup key is substring
+        if lookup_key.startswith(to_lookup) or to_lookup.startswith(lookup_key):
+            return data
+    for lookup_key, data in lookup_table.items():
+        if lookup_key.startswith("/".join(to_lookup.split("/")[:-1])) or "/".join(to_lookup.split("/")[:-1]).startswith(lookup_key):
+            return data
+    return default
+
+
+def _get_callback_name(update_callback):
+    entity = getattr(update_callback, "__self__", None)
+    return getattr(entity, "entity_id", None) or getattr(update_callback, "__qualname__", repr(update_callback))
+
+
+async def _makeRequest(url, session, logger=None, metrics=None, raise_errors=False):
+    """Return the decoded response of ``url``.
+
+    A response other than 200 returns an empty dict, or raises UpdateFailed
+    with ``raise_errors``.
+    """
     getHeaders = {}
     toReturn = {}
 
     try:
-        async with session.get(url, headers=getHeaders, timeout=20) as getResponse:
+        start = time.perf_counter()
+        async with session.get(url, headers=getHeaders, timeout=20, trace_request_ctx=metrics) as getResponse:
             if getResponse.status == 200:
                 data = await getResponse.read()
                 if logger is not None:
                     logger.info(data)
-                return json.loads(data)
+                if metrics is None:
+                    return json.loads(data)
+                metrics.increment(METRIC_FETCHES)
+                metrics.increment(METRIC_BYTES_RECEIVED, len(data))
+                metrics.record_time(METRIC_FETCH_LATENCY, time.perf_counter() - start)
+                start = time.perf_counter()
+                data = json.loads(data)
+                metrics.record_time(METRIC_DECODE_TIME, time.perf_counter() - start)
+                return data
+            if metrics is not None:
+                metrics.increment(METRIC_FETCH_ERRORS)
+            status = getResponse.status
     except Exception as err:
+        if metrics is not None:
+            metrics.increment(METRIC_FETCH_ERRORS)
         raise UpdateFailed(f"Error fetching data: {err}")
+    if raise_errors:
+        raise UpdateFailed(f"Error fetching data: {url} returned {status}")
     return toReturn
@@ -0,0 +1,57 @@
+"""Diagnostics support for the Warframe Stats integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PROFILES, DOMAIN
+
+TO_REDACT = {CONF_PROFILES}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    staticDataCoordinator, worldstateCoordinator, profileCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    coordinators = {}
+    for coordinator in (staticDataCoordinator, worldstateCoordinator, profileCoordinator):
+        if coordinator is None:
+            continue
+        coordinators[coordinator.metrics.name] = {
+            "last_update_success": coordinator.last_update_success,
+            "listeners": len(coordinator._listeners),
+            "metrics": coordinator.metrics.as_dict(),
+        }
+    coordinators["static"]["catalog_version"] = staticDataCoordinator.catalog_version
+    coordinators["static"]["lookup_size"] = len(staticDataCoordinator.name_lookup)
+    coordinators["static"]["search_index"] = {
+        "entries": len(staticDataCoordinator.search_index),
+        "words": staticDataCoordinator.search_index.words,
+    }
+    coordinators["static"]["translations"] = {
+        domain: len(table) for domain, table in staticDataCoordinator.translations.tables.items()
+    }
+    if worldstateCoordinator is not None:
+        coordinators["worldstate"]["platform"] = worldstateCoordinator.platform
+        coordinators["worldstate"]["language"] = worldstateCoordinator.language
+        coordinators["worldstate"]["socket_connected"] = worldstateCoordinator._socket.connected
+        coordinators["worldstate"]["socket_url"] = str(worldstateCoordinator._socket.url)
+        coordinators["worldstate"]["socket_compression"] = worldstateCoordinator._socket.negotiated_compression
+        coordinators["worldstate"]["frame_interval"] = worldstateCoordinator.frame_interval
+        coordinators["worldstate"]["queued_frames"] = len(worldstateCoordinator._socket.queue)
+        coordinators["worldstate"]["socket_routes"] = [
+            f"{platform}/{language}" for platform, language in worldstateCoordinator._socket.routes
+        ]
+    if profileCoordinator is not None:
+        coordinators["profile"]["accounts"] = len(profileCoordinator.data or {})
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "coordinators": coordinators,
+    }
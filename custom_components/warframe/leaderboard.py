@@ -0,0 +1,129 @@
+"""Cross-account leaderboards for the Warframe Stats integration."""
+
+from __future__ import annotations
+
+import heapq
+
+LEADERBOARD_KILLS = "kills"
+LEADERBOARD_TIME_PLAYED = "time_played"
+LEADERBOARD_CREDITS = "credits"
+LEADERBOARD_MASTERY_RANK = "mastery_rank"
+LEADERBOARD_MOST_USED_WARFRAME = "most_used_warframe"
+
+ACCOUNT_LEADERBOARDS = [
+    LEADERBOARD_KILLS,
+    LEADERBOARD_TIME_PLAYED,
+    LEADERBOARD_CREDITS,
+    LEADERBOARD_MASTERY_RANK,
+]
+LEADERBOARDS = [*ACCOUNT_LEADERBOARDS, LEADERBOARD_MOST_USED_WARFRAME]
+
+
+def get_display_name(profile_data, default):
+    """Return the display name of a profile without the trailing platform glyph."""
+    display_name = profile_data.get("Results", [{}])[0].get("DisplayName")
+    if not display_name:
+        return default
+    return display_name[:len(display_name)-1]
+
+
+def _get_account_values(profile_data):
+    stats = profile_data.get("Stats", {})
+    return {
+        LEADERBOARD_KILLS: sum(int(enemy.get("kills", 0)) for enemy in stats.get("Enemies", [])),
+        LEADERBOARD_TIME_PLAYED: float(stats.get("TimePlayedSec", 0.0)),
+        LEADERBOARD_CREDITS: int(stats.get("Income", 0)),
+        LEADERBOARD_MASTERY_RANK: int(profile_data.get("Results", [{}])[0].get("PlayerLevel", 0)),
+    }
+
+
+class WarframeLeaderboard:
+    """Top-K rankings across all tracked accounts.
+
+    Values are kept per account and the top-K of a leaderboard is only
+    reselected (with a bounded heap) when a refreshed account could change it.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.usernames = {}
+        self._values = {leaderboard: {} for leaderboard in ACCOUNT_LEADERBOARDS}
+        self._warframe_usage = {}
+        self._warframe_totals = {}
+        self._top = {}
+
+    def update_account(self, account_id, profile_data, resolve):
+        """Fold a freshly fetched profile into every leaderboard."""
+        if not profile_data:
+            return
+
+        self.usernames[account_id] = get_display_name(profile_data, account_id)
+
+        for leaderboard, value in _get_account_values(profile_data).items():
+            values = self._values[leaderboard]
+            if values.get(account_id) == value:
+                continue
+            values[account_id] = value
+            if self._could_change_top(leaderboard, account_id, value):
+                self._top.pop(leaderboard, None)
+
+        usage = {}
+        for item in profile_data.get("Stats", {}).get("Weapons", []):
+            key = item.get("type", "")
+            if (resolve(key) or {}).get("type") == "warframe":
+                usage[key] = usage.get(key, 0.0) + float(item.get("equipTime", 0.0))
+        self._update_warframe_usage(account_id, usage)
+
+    def remove_account(self, account_id):
+        """Drop an account from every leaderboard."""
+        self.usernames.pop(account_id, None)
+        for values in self._values.values():
+            values.pop(account_id, None)
+        self._update_warframe_usage(account_id, {})
+        self._top.clear()
+
+    def top(self, leaderboard):
+        """Return the ranked (key, value) pairs of a leaderboard."""
+        top = self._top.get(leaderboard)
+        if top is None:
+            if leaderboard == LEADERBOARD_MOST_USED_WARFRAME:
+                values = self._warframe_totals
+            else:
+                values = self._values[leaderboard]
+            top = heapq.nlargest(self.size, values.items(), key=lambda entry: entry[1])
+            self._top[leaderboard] = top
+        return top
+
+    def _could_change_top(self, leaderboard, key, value):
+        top = self._top.get(leaderboard)
+        if top is None:
+            return True
+        if len(top) < self.size:
+            return True
+        if any(top_key == key for top_key, _ in top):
+            return True
+        return value >= top[-1][1]
+
+    def _update_warframe_usage(self, account_id, usage):
+        previous = self._warframe_usage.pop(account_id, {})
+        if previous == usage:
+            if usage:
+                self._warframe_usage[account_id] = usage
+            return
+
+        changed = set(previous) | set(usage)
+        for key in changed:
+            total = self._warframe_totals.get(key, 0.0) - previous.get(key, 0.0) + usage.get(key, 0.0)
+            if total > 0:
+                self._warframe_totals[key] = total
+            else:
+                self._warframe_totals.pop(key, None)
+        if usage:
+            self._warframe_usage[account_id] = usage
+
+        leaderboard = LEADERBOARD_MOST_USED_WARFRAME
+        if any(
+            self._could_change_top(leaderboard, key, self._warframe_totals.get(key, 0.0))
+            for key in changed
+        ):
+            self._top.pop(leaderboard, None)
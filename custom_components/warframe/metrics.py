@@ -0,0 +1,158 @@
+"""Performance metrics kept by the Warframe Stats coordinators."""
+
+from __future__ import annotations
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Listener callbacks taking longer than this hold up the event loop
+CALLBACK_TIME_BUDGET = 0.05
+
+METRIC_FETCHES = "fetches"
+METRIC_FETCH_ERRORS = "fetch_errors"
+METRIC_FETCH_LATENCY = "fetch_latency"
+METRIC_BYTES_RECEIVED = "bytes_received"
+METRIC_DECODE_TIME = "decode_time"
+METRIC_LOOKUP_BUILD_TIME = "lookup_build_time"
+METRIC_INDEX_BUILD_TIME = "index_build_time"
+METRIC_FRAMES_RECEIVED = "frames_received"
+METRIC_FRAMES_DROPPED = "frames_dropped"
+METRIC_FRAMES_COALESCED = "frames_coalesced"
+METRIC_WIRE_BYTES = "wire_bytes"
+METRIC_READ_TIME = "read_time"
+METRIC_CONNECTIONS_CREATED = "connections_created"
+METRIC_CONNECTIONS_REUSED = "connections_reused"
+METRIC_POOL_WAIT = "pool_wait"
+METRIC_CONNECT_TIME = "connect_time"
+METRIC_CALLBACK_TIME = "callback_time"
+METRIC_SLOW_CALLBACKS = "slow_callbacks"
+
+TIMING_METRICS = [
+    METRIC_FETCH_LATENCY,
+    METRIC_DECODE_TIME,
+    METRIC_LOOKUP_BUILD_TIME,
+    METRIC_INDEX_BUILD_TIME,
+    METRIC_READ_TIME,
+    METRIC_POOL_WAIT,
+    METRIC_CONNECT_TIME,
+    METRIC_CALLBACK_TIME,
+]
+
+# The metrics exposed as diagnostic sensors for each coordinator
+COORDINATOR_METRICS = {
+    "static": [
+        METRIC_FETCH_LATENCY,
+        METRIC_BYTES_RECEIVED,
+        METRIC_DECODE_TIME,
+        METRIC_LOOKUP_BUILD_TIME,
+        METRIC_INDEX_BUILD_TIME,
+        METRIC_CONNECTIONS_CREATED,
+        METRIC_CONNECTIONS_REUSED,
+        METRIC_POOL_WAIT,
+        METRIC_CONNECT_TIME,
+    ],
+    "worldstate": [
+        METRIC_FETCH_LATENCY,
+        METRIC_BYTES_RECEIVED,
+        METRIC_DECODE_TIME,
+        METRIC_FRAMES_RECEIVED,
+        METRIC_FRAMES_DROPPED,
+        METRIC_FRAMES_COALESCED,
+        METRIC_WIRE_BYTES,
+        METRIC_READ_TIME,
+        METRIC_CALLBACK_TIME,
+        METRIC_SLOW_CALLBACKS,
+    ],
+    "profile": [
+        METRIC_FETCH_LATENCY,
+        METRIC_BYTES_RECEIVED,
+        METRIC_DECODE_TIME,
+        METRIC_CONNECTIONS_CREATED,
+        METRIC_CONNECTIONS_REUSED,
+        METRIC_POOL_WAIT,
+        METRIC_CONNECT_TIME,
+        METRIC_CALLBACK_TIME,
+        METRIC_SLOW_CALLBACKS,
+    ],
+}
+
+
+class WarframeCoordinatorMetrics:
+    """Counters and timings of one coordinator.
+
+    Timings keep the last, max, total and count of their samples in seconds,
+    callback timings are kept per listener. Metrics that cannot be measured
+    are kept in ``unavailable`` with the reason.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.counters = {}
+        self.timings = {}
+        self.callbacks = {}
+        self.unavailable = {}
+
+    def increment(self, metric, value=1):
+        """Add to a counter."""
+        self.counters[metric] = self.counters.get(metric, 0) + value
+
+    def record_time(self, metric, seconds):
+        """Add a timing sample."""
+        _record(self.timings, metric, seconds)
+
+    def set_unavailable(self, metric, reason):
+        """Mark a metric as not measured for ``reason``, None when it is measured."""
+        if reason is None:
+            self.unavailable.pop(metric, None)
+        else:
+            self.unavailable[metric] = reason
+
+    def record_callbacks(self, durations):
+        """Add the durations of one round of listener callbacks."""
+        total = 0.0
+        for name, seconds in durations:
+            total += seconds
+            timing = _record(self.callbacks, name, seconds)
+            if seconds > CALLBACK_TIME_BUDGET:
+                self.increment(METRIC_SLOW_CALLBACKS)
+                timing[METRIC_SLOW_CALLBACKS] = timing.get(METRIC_SLOW_CALLBACKS, 0) + 1
+                if timing[METRIC_SLOW_CALLBACKS] == 1:
+                    _LOGGER.warning(
+                        "Updating %s took %.3f seconds, over the %.3f second budget",
+                        name, seconds, CALLBACK_TIME_BUDGET,
+                    )
+        self.record_time(METRIC_CALLBACK_TIME, total)
+
+    def get(self, metric):
+        """Return the current value of a metric, the last sample for timings."""
+        if metric in TIMING_METRICS:
+            return self.timings.get(metric, {}).get("last")
+        return self.counters.get(metric, 0)
+
+    def as_dict(self):
+        """Return every metric for diagnostics."""
+        return {
+            "counters": dict(self.counters),
+            "timings": {metric: dict(timing) for metric, timing in self.timings.items()},
+            "unavailable": dict(self.unavailable),
+            "callbacks": dict(
+                sorted(
+                    ((name, dict(timing)) for name, timing in self.callbacks.items()),
+                    key=lambda item: item[1].get("max", 0.0),
+                    reverse=True,
+                )
+            ),
+        }
+
+
+def _record(timings, name, seconds):
+    timing = timings.get(name)
+    if timing is None:
+        timing = timings[name] = {"count": 0, "total": 0.0, "max": 0.0}
+    timing["count"] += 1
+    timing["total"] += seconds
+    timing["last"] = seconds
+    if seconds > timing["max"]:
+        timing["max"] = seconds
+    return timing
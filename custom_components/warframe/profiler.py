@@ -0,0 +1,205 @@
+"""On demand cProfile and tracemalloc runs over coordinator cycles."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import linecache
+import logging
+import pstats
+import time
+import tracemalloc
+
+from homeassistant.core import callback
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SUMMARY_SIZE = 10
+ALLOCATIONS_FILE_SIZE = 50
+TRACEMALLOC_FRAMES = 10
+
+# Methods whose own work is profiled, the coordinators are never patched
+# while no run is active so there is no overhead outside of a run
+PROFILED_METHODS = ["_handle_frame", "_handle_packet", "_async_update_data", "async_update_listeners"]
+
+
+class WarframeProfiler:
+    """Profiles one coordinator over its next cycles.
+
+    A cycle ends every time the coordinator updates its listeners, which is
+    once per refresh (or per poll of the latest worldstate packet). Only the
+    coordinator's own work is profiled, coroutines are profiled step by step
+    so other tasks running while they wait on I/O are left out.
+    """
+
+    def __init__(self, hass, coordinator, cycles):
+        self.hass = hass
+        self.coordinator = coordinator
+        self.cycles = cycles
+        self.completed = 0
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self._done = asyncio.Event()
+
+    async def async_run(self, timeout, refresh):
+        """Profile the next cycles and return a summary."""
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        start = time.monotonic()
+
+        self._patch()
+        try:
+            if refresh:
+                async with asyncio.timeout(timeout):
+                    while self.completed < self.cycles:
+                        await self.coordinator.async_refresh()
+            else:
+                await asyncio.wait_for(self._done.wait(), timeout)
+        except TimeoutError:
+            _LOGGER.info("Profiling stopped after %s of %s cycles", self.completed, self.cycles)
+        finally:
+            self._unpatch()
+            duration = time.monotonic() - start
+            after = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+
+        name = self.coordinator.metrics.name
+        path = self.hass.config.path(f"{DOMAIN}_profile_{name}_{dt_util.utcnow().strftime('%Y%m%d_%H%M%S')}")
+        allocations = after.compare_to(before, "lineno")
+        await self.hass.async_add_executor_job(self._write, path, allocations)
+
+        return {
+            "coordinator": name,
+            "cycles": self.completed,
+            "duration": round(duration, 3),
+            "stats_file": f"{path}.prof",
+            "allocations_file": f"{path}.allocations.txt",
+            "peak_traced_memory_kib": round(peak / 1024, 1),
+            "top_functions": _top_functions(self._profile),
+            "top_allocations": [
+                {
+                    "location": str(stat.traceback[0]),
+                    "size_diff_kib": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                }
+                for stat in allocations[:SUMMARY_SIZE]
+            ],
+        }
+
+    def _write(self, path, allocations):
+        self._profile.dump_stats(f"{path}.prof")
+        with open(f"{path}.allocations.txt", "w") as allocations_file:
+            for stat in allocations[:ALLOCATIONS_FILE_SIZE]:
+                allocations_file.write(f"{stat}\n")
+                frame = stat.traceback[0]
+                line = linecache.getline(frame.filename, frame.lineno).strip()
+                if line:
+                    allocations_file.write(f"    {line}\n")
+
+    def _patch(self):
+        for method_name in PROFILED_METHODS:
+            method = getattr(self.coordinator, method_name, None)
+            if method is None:
+                continue
+            if asyncio.iscoroutinefunction(method):
+                wrapper = self._wrap_coroutine_function(method)
+            else:
+                wrapper = self._wrap_function(method)
+            setattr(self.coordinator, method_name, wrapper)
+
+    def _unpatch(self):
+        for method_name in PROFILED_METHODS:
+            # Drop the instance attribute so the class method is used again
+            self.coordinator.__dict__.pop(method_name, None)
+
+    def _enable(self):
+        self._depth += 1
+        if self._depth == 1:
+            self._profile.enable()
+
+    def _disable(self):
+        self._depth -= 1
+        if self._depth == 0:
+            self._profile.disable()
+
+    def _wrap_function(self, method):
+        is_cycle = method.__name__ == "async_update_listeners"
+
+        @callback
+        def wrapper(*args, **kwargs):
+            self._enable()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._disable()
+                if is_cycle:
+                    self._cycle_completed()
+
+        return wrapper
+
+    def _wrap_coroutine_function(self, method):
+        async def wrapper(*args, **kwargs):
+            return await _ProfiledCoroutine(method(*args, **kwargs), self._enable, self._disable)
+
+        return wrapper
+
+    def _cycle_completed(self):
+        self.completed += 1
+        if self.completed >= self.cycles:
+            self._done.set()
+
+
+class _ProfiledCoroutine:
+    """Awaitable that only profiles while its coroutine is running."""
+
+    def __init__(self, coro, enable, disable):
+        self._coro = coro
+        self._enable = enable
+        self._disable = disable
+
+    def __await__(self):
+        value = None
+        error = None
+        while True:
+            self._enable()
+            try:
+                if error is not None:
+                    future = self._coro.throw(error)
+                else:
+                    future = self._coro.send(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._disable()
+            try:
+                value = yield future
+                error = None
+            except BaseException as err:  # noqa: BLE001
+                value = None
+                error = err
+
+
+def _top_functions(profile):
+    try:
+        stats = pstats.Stats(profile)
+    except TypeError:
+        # Nothing ran while profiling
+        return []
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [
+        {
+            "function": pstats.func_std_string(function),
+            "calls": calls,
+            "cumulative_ms": round(cumulative * 1000, 3),
+            "own_ms": round(own * 1000, 3),
+        }
+        for function, (_, calls, own, cumulative, _) in rows[:SUMMARY_SIZE]
+    ]
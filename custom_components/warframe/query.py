@@ -0,0 +1,127 @@
+"""Filter, sort and paginate the data the coordinators hold in memory."""
+
+from __future__ import annotations
+
+import heapq
+from itertools import islice
+
+DATASET_FISSURES = "fissures"
+DATASET_ALERTS = "alerts"
+DATASET_INVASIONS = "invasions"
+DATASET_EVENTS = "events"
+DATASET_BOUNTIES = "bounties"
+DATASET_VOID_TRADER = "void_trader"
+DATASET_VARZIA = "varzia"
+DATASET_CATALOG = "catalog"
+DATASET_ABILITIES = "abilities"
+DATASET_ENEMIES = "enemies"
+DATASET_SCANS = "scans"
+DATASET_MISSIONS = "missions"
+DATASET_WEAPONS = "weapons"
+
+WORLDSTATE_DATASETS = [
+    DATASET_FISSURES,
+    DATASET_ALERTS,
+    DATASET_INVASIONS,
+    DATASET_EVENTS,
+    DATASET_BOUNTIES,
+    DATASET_VOID_TRADER,
+    DATASET_VARZIA,
+]
+# Profile datasets and the list in the profile's Stats they come from
+PROFILE_DATASETS = {
+    DATASET_ABILITIES: "Abilities",
+    DATASET_ENEMIES: "Enemies",
+    DATASET_SCANS: "Scans",
+    DATASET_MISSIONS: "Missions",
+    DATASET_WEAPONS: "Weapons",
+}
+DATASETS = [*WORLDSTATE_DATASETS, DATASET_CATALOG, *PROFILE_DATASETS]
+
+
+def worldstate_rows(world_state_data, dataset):
+    """Return the rows of a worldstate dataset."""
+    world_state_data = world_state_data or {}
+    if dataset == DATASET_BOUNTIES:
+        return [
+            {"syndicate": syndicate.get("syndicate"), "expiry": syndicate.get("expiry")} | job
+            for syndicate in world_state_data.get("syndicateMissions") or []
+            for job in syndicate.get("jobs") or []
+        ]
+    if dataset == DATASET_VOID_TRADER:
+        return (world_state_data.get("voidTrader") or {}).get("inventory") or []
+    if dataset == DATASET_VARZIA:
+        return (world_state_data.get("vaultTrader") or {}).get("inventory") or []
+    return world_state_data.get(dataset) or []
+
+
+def catalog_rows(name_lookup):
+    """Return a row for every entry of the static lookup."""
+    for unique_name, item in name_lookup.items():
+        yield {
+            "unique_name": unique_name,
+            "name": item.get("value"),
+            "type": item.get("type"),
+            "description": item.get("description"),
+        }
+
+
+def profile_rows(profile_data, dataset, resolve):
+    """Return one account's rows of a profile dataset, with resolved names."""
+    for item in profile_data.get("Stats", {}).get(PROFILE_DATASETS[dataset], []):
+        item_info = resolve(item.get("type", "")) or {}
+        row = {"name": item_info.get("value", item.get("type"))}
+        if dataset == DATASET_WEAPONS:
+            row["category"] = item_info.get("type")
+        yield row | item
+
+
+def _matches(row, filters, search):
+    for key, expected in filters.items():
+        value = row.get(key)
+        if isinstance(value, str):
+            value = value.casefold()
+        if isinstance(expected, list):
+            if value not in expected:
+                return False
+        elif value != expected:
+            return False
+    if search is not None:
+        return any(isinstance(value, str) and search in value.casefold() for value in row.values())
+    return True
+
+
+def _normalize_filter(expected):
+    if isinstance(expected, list):
+        return [_normalize_filter(value) for value in expected]
+    if isinstance(expected, str):
+        return expected.casefold()
+    return expected
+
+
+def query(rows, filters=None, search=None, sort_by=None, descending=False, offset=0, limit=50, fields=None):
+    """Return one page of the rows matching the filters.
+
+    Only ``offset + limit`` rows are selected (with a bounded heap) when
+    sorting, so large datasets are never fully sorted. Rows without the sort
+    key come last.
+    """
+    filters = {key: _normalize_filter(expected) for key, expected in (filters or {}).items()}
+    if search is not None:
+        search = search.casefold()
+    matching = [row for row in rows if _matches(row, filters, search)]
+
+    if sort_by is None:
+        page = matching[offset:offset + limit]
+    else:
+        present = [row for row in matching if row.get(sort_by) is not None]
+        missing = (row for row in matching if row.get(sort_by) is None)
+        select = heapq.nlargest if descending else heapq.nsmallest
+        page = select(offset + limit, present, key=lambda row: row[sort_by])
+        if len(page) < offset + limit:
+            page.extend(islice(missing, offset + limit - len(page)))
+        page = page[offset:]
+
+    if fields:
+        page = [{field: row.get(field) for field in fields} for row in page]
+    return {"total": len(matching), "offset": offset, "limit": limit, "items": page}
@@ -0,0 +1,82 @@
+"""Opt-in recorder for the raw worldstate WebSocket frames."""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds frames are buffered before they are appended to the recording
+RECORDER_FLUSH_DELAY = 10
+RECORDER_FLUSH_FRAMES = 50
+
+
+def get_recording_path(hass):
+    """Return a new recording path in the config directory."""
+    return hass.config.path(f"{DOMAIN}_frames_{dt_util.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl.gz")
+
+
+class WarframeFrameRecorder:
+    """Appends timestamped raw frames to a gzipped JSON lines file.
+
+    Each line is ``{"time": <unix time>, "frame": <raw frame>}``. Frames are
+    buffered and written from the executor, every flush appends a new gzip
+    member which ``gzip.open`` reads back as one stream.
+    """
+
+    def __init__(self, hass, path):
+        self.hass = hass
+        self.path = path
+        self.frames = 0
+        self._pending = []
+        self._unsub_flush = None
+
+    @callback
+    def async_record(self, raw):
+        """Buffer one raw frame."""
+        # The frame is already JSON, so it is embedded without re-encoding
+        self._pending.append(f'{{"time":{time.time():.3f},"frame":{raw}}}\n')
+        self.frames += 1
+        if len(self._pending) >= RECORDER_FLUSH_FRAMES:
+            self.hass.async_create_task(self.async_flush(), eager_start=True)
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, RECORDER_FLUSH_DELAY, self._async_flush_later)
+
+    async def _async_flush_later(self, _):
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self):
+        """Append the buffered frames to the recording."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        if not self._pending:
+            return
+        lines = self._pending
+        self._pending = []
+        try:
+            await self.hass.async_add_executor_job(self._write, lines)
+        except OSError as err:
+            _LOGGER.error("Could not write the frame recording %s: %s", self.path, err)
+
+    def _write(self, lines):
+        with gzip.open(self.path, "at", encoding="utf-8") as recording:
+            recording.writelines(lines)
+
+
+def read_recording(path):
+    """Yield the (time, raw frame) pairs of a recording."""
+    with gzip.open(path, "rt", encoding="utf-8") as recording:
+        for line in recording:
+            # Split the envelope by hand so the frame stays undecoded
+            head, _, frame = line.rstrip("\n").partition(',"frame":')
+            yield float(head[len('{"time":'):]), frame[:-1]
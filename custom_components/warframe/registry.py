@@ -0,0 +1,101 @@
+"""Coordinators shared by every Warframe Stats config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_REGISTRY = "registry"
+
+
+class _SharedCoordinator:
+    __slots__ = ("coordinator", "entry_ids", "setup")
+
+    def __init__(self, coordinator):
+        self.coordinator = coordinator
+        self.entry_ids = []
+        self.setup = None
+
+
+class WarframeCoordinatorRegistry:
+    """Reference counted coordinators keyed by what they fetch.
+
+    Entries that fetch the same thing (the catalog of an API, or the
+    worldstate of a platform and language) share one coordinator, so an
+    extra entry costs no extra downloads, sockets or catalogs. The first
+    entry holding a coordinator owns it and creates its sensors. When the
+    owner lets go the coordinator is shut down and the entries left are
+    reloaded, the first of them creates it again and becomes its owner.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._shared = {}
+
+    async def async_acquire(self, key, entry_id, create, setup=None):
+        """Return the coordinator for ``key`` and whether the entry owns it.
+
+        ``create()`` builds the coordinator the first time, outside of the
+        entry so it is not shut down with it. ``setup(coordinator)`` runs once
+        and every entry waits for it.
+        """
+        shared = self._shared.get(key)
+        if shared is None:
+            token = config_entries.current_entry.set(None)
+            try:
+                shared = _SharedCoordinator(create())
+            finally:
+                config_entries.current_entry.reset(token)
+            if setup is not None:
+                shared.setup = self.hass.async_create_task(
+                    setup(shared.coordinator), f"warframe-setup-{key[0]}"
+                )
+            self._shared[key] = shared
+        shared.entry_ids.append(entry_id)
+
+        if shared.setup is not None:
+            try:
+                await asyncio.shield(shared.setup)
+            except Exception:
+                # Every waiting entry fails and retries on its own
+                shared.entry_ids.remove(entry_id)
+                if self._shared.get(key) is shared:
+                    del self._shared[key]
+                    await shared.coordinator.async_shutdown()
+                raise
+        return shared.coordinator, shared.entry_ids[0] == entry_id
+
+    async def async_release(self, entry_id):
+        """Drop the references of an entry, shutting down what nobody owns."""
+        for key, shared in list(self._shared.items()):
+            if entry_id not in shared.entry_ids:
+                continue
+            owner = shared.entry_ids[0] == entry_id
+            shared.entry_ids.remove(entry_id)
+            if shared.entry_ids and not owner:
+                continue
+
+            del self._shared[key]
+            await shared.coordinator.async_shutdown()
+            for other_entry_id in shared.entry_ids:
+                _LOGGER.debug("Reloading %s to take over the %s coordinator", other_entry_id, key[0])
+                self.hass.config_entries.async_schedule_reload(other_entry_id)
+
+    def __len__(self):
+        return len(self._shared)
+
+
+def async_get_registry(hass: HomeAssistant) -> WarframeCoordinatorRegistry:
+    """Return the registry, created on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_REGISTRY)
+    if registry is None:
+        registry = domain_data[DATA_REGISTRY] = WarframeCoordinatorRegistry(hass)
+    return registry
@@ -0,0 +1,191 @@
+"""Word search over the static catalog."""
+
+from __future__ import annotations
+
+from array import array
+import bisect
+import heapq
+import math
+import re
+import unicodedata
+
+# Words of an item's name count this much more than words of its description
+NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+# A prefix matches at most this many words, so a short prefix stays fast
+MAX_PREFIX_WORDS = 200
+# Postings pack an entry and its weight into one int, the weight in the low bits
+WEIGHT_BITS = 3
+WEIGHT_MASK = (1 << WEIGHT_BITS) - 1
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    """Return the words of ``text``, lowercased and without accents."""
+    if not isinstance(text, str):
+        return []
+    text = text.casefold().replace("'", "").replace("\u2019", "")
+    if not text.isascii():
+        text = "".join(char for char in unicodedata.normalize("NFKD", text) if not unicodedata.combining(char))
+    # Light plural folding, "rifles" finds "rifle" but "glass" is kept
+    return [
+        word[:-1] if len(word) > 3 and word[-1] == "s" and word[-2] != "s" else word
+        for word in _WORD.findall(text)
+    ]
+
+
+def _parse(text):
+    terms = []
+    for part in text.split():
+        words = tokenize(part)
+        if words and part.endswith("*"):
+            words[-1] += "*"
+        terms.extend(words)
+    return list(dict.fromkeys(terms))
+
+
+class _Postings:
+    """Read the postings of one word like a dict of entry to weight."""
+
+    __slots__ = ("_packed", "_start", "_end")
+
+    def __init__(self, packed, start, end):
+        self._packed = packed
+        self._start = start
+        self._end = end
+
+    def __len__(self):
+        return self._end - self._start
+
+    def items(self):
+        for index in range(self._start, self._end):
+            value = self._packed[index]
+            yield value >> WEIGHT_BITS, value & WEIGHT_MASK
+
+    def get(self, doc):
+        index = bisect.bisect_left(self._packed, doc << WEIGHT_BITS, self._start, self._end)
+        if index < self._end and self._packed[index] >> WEIGHT_BITS == doc:
+            return self._packed[index] & WEIGHT_MASK
+        return None
+
+
+class WarframeCatalogIndex:
+    """Inverted index from the words of every catalog entry to the entries.
+
+    Built once per catalog change, a search then only looks at the entries
+    holding its rarest word instead of scanning the catalog. Every word of
+    a search must match, a word ending in ``*`` matches any word it starts.
+    Entries are ranked by how rare the matched words are and whether they
+    are in the name or only in the description. The entries of every word
+    are packed into one array of ints, found by the word's position in the
+    sorted words, which takes a fifth of the memory of a dict per word.
+    """
+
+    def __init__(self, name_lookup=None):
+        self._keys = []
+        self._entries = []
+        postings = {}
+        for unique_name, entry in (name_lookup or {}).items():
+            self._add(unique_name, entry, postings)
+
+        self._words = sorted(postings)
+        self._offsets = array("I", [0])
+        self._packed = array("I")
+        for word in self._words:
+            # Entries were added in order, so every word's entries are sorted
+            self._packed.extend(postings[word])
+            self._offsets.append(len(self._packed))
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def words(self):
+        return len(self._words)
+
+    def _add(self, unique_name, entry, postings):
+        doc = len(self._keys)
+        self._keys.append(unique_name)
+        self._entries.append(entry)
+        weights = dict.fromkeys(tokenize(entry.get("value")), NAME_WEIGHT)
+        for word in set(tokenize(entry.get("description"))):
+            weights[word] = weights.get(word, 0) + DESCRIPTION_WEIGHT
+        for word, weight in weights.items():
+            word_postings = postings.get(word)
+            if word_postings is None:
+                word_postings = postings[word] = []
+            word_postings.append(doc << WEIGHT_BITS | weight)
+
+    def _postings(self, index):
+        return _Postings(self._packed, self._offsets[index], self._offsets[index + 1])
+
+    def _idf(self, postings):
+        return math.log(1 + len(self._keys) / len(postings))
+
+    def _term_postings(self, term):
+        """Return the entries matching one search word and the idf to weigh them by.
+
+        The entries of a prefix are merged into one dict, weighed already.
+        """
+        if not term.endswith("*"):
+            index = bisect.bisect_left(self._words, term)
+            if index == len(self._words) or self._words[index] != term:
+                return {}, 0.0
+            postings = self._postings(index)
+            return postings, self._idf(postings)
+
+        prefix = term.rstrip("*")
+        start = bisect.bisect_left(self._words, prefix)
+        scores = {}
+        for index in range(start, min(start + MAX_PREFIX_WORDS, len(self._words))):
+            if not self._words[index].startswith(prefix):
+                break
+            postings = self._postings(index)
+            idf = self._idf(postings)
+            for doc, weight in postings.items():
+                score = idf * weight
+                if score > scores.get(doc, 0):
+                    scores[doc] = score
+        return scores, 1.0
+
+    def search(self, text, categories=None, offset=0, limit=50):
+        """Return one page of the entries matching every word of ``text``."""
+        terms = _parse(text)
+        matching = {}
+        if terms:
+            # Only the entries of the rarest word are looked at, the other
+            # words are looked up for each of them
+            (rarest, rarest_idf), *others = sorted(
+                (self._term_postings(term) for term in terms), key=lambda term: len(term[0])
+            )
+            for doc, weight in rarest.items():
+                if categories and self._entries[doc].get("type") not in categories:
+                    continue
+                score = rarest_idf * weight
+                for postings, idf in others:
+                    other = postings.get(doc)
+                    if other is None:
+                        break
+                    score += idf * other
+                else:
+                    matching[doc] = score
+
+        # Ties keep the catalog order
+        page = heapq.nsmallest(offset + limit, matching.items(), key=lambda item: (-item[1], item[0]))[offset:]
+        return {
+            "total": len(matching),
+            "offset": offset,
+            "limit": limit,
+            "items": [self._row(doc, score) for doc, score in page],
+        }
+
+    def _row(self, doc, score):
+        entry = self._entries[doc]
+        return {
+            "unique_name": self._keys[doc],
+            "name": entry.get("value"),
+            "type": entry.get("type"),
+            "description": entry.get("description"),
+            "score": round(score, 3),
+        }
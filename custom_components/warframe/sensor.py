@@ -6,22 +6,57 @@ import logging
 
 from homeassistant.components.sensor import (
     RestoreSensor,
+    SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import MATCH_ALL, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.const import (
+    MATCH_ALL,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN
+from .attributes import AttributePolicy
+from .const import (
+    CONF_ATTRIBUTE_SIZE,
+    CONF_CATALOG_SENSORS,
+    CONF_ITEMS_ADDED,
+    CONF_LEADERBOARDS,
+    CONF_PROFILE_SENSORS,
+    CONF_NEWEST_WARFRAME,
+    CONF_PROFILES,
+    CONF_TOTAL_ITEMS,
+    CONF_TOTAL_PRIME_ITEMS,
+    CONF_WATCHLIST,
+    DEFAULT_ATTRIBUTE_SIZE,
+    DEFAULT_LANGUAGE,
+    DEFAULT_PLATFORM,
+    DOMAIN,
+)
 from .coordinator import (
     WarframeStaticDataUpdateCoordinator,
     WarframeWorldstateDataUpdateCoordinator,
 )
+from .leaderboard import LEADERBOARD_MOST_USED_WARFRAME, LEADERBOARDS, get_display_name
+from .metrics import (
+    COORDINATOR_METRICS,
+    METRIC_BYTES_RECEIVED,
+    METRIC_FRAMES_RECEIVED,
+    METRIC_WIRE_BYTES,
+    TIMING_METRICS,
+)
+from .statistics import get_star_chart_completion, get_star_chart_nodes
+from .translations import TRANSLATION_ABILITIES, TRANSLATION_NODES, TRANSLATION_SORTIES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +79,40 @@ worldstate_device = DeviceInfo(
 profile_device_base_identifiers=(DOMAIN, "profile")
 profile_device_base_name="Warframe "
 
+leaderboard_device = DeviceInfo(
+            identifiers={(DOMAIN, "leaderboards")},
+            name="Warframe Leaderboards",
+        )
+
+catalog_device = DeviceInfo(
+            identifiers={(DOMAIN, "catalog")},
+            name="Warframe Catalog",
+        )
+
+metrics_device = DeviceInfo(
+            identifiers={(DOMAIN, "metrics")},
+            name="Warframe Stats Metrics",
+        )
+
+metric_names = {
+    "fetch_latency": "Fetch Latency",
+    "bytes_received": "Bytes Received",
+    "decode_time": "Decode Time",
+    "lookup_build_time": "Lookup Build Time",
+    "index_build_time": "Search Index Build Time",
+    "frames_received": "Frames Received",
+    "frames_dropped": "Frames Dropped",
+    "frames_coalesced": "Frames Coalesced",
+    "wire_bytes": "Wire Bytes",
+    "read_time": "Frame Read Time",
+    "connections_created": "Connections Created",
+    "connections_reused": "Connections Reused",
+    "pool_wait": "Connection Pool Wait",
+    "connect_time": "Connect Time",
+    "callback_time": "Update Callback Time",
+    "slow_callbacks": "Slow Update Callbacks",
+}
+
 most_used_types = [
     "warframe",
     "primary",
@@ -67,11 +136,12 @@ async def async_setup_entry(
 
     staticDataCoordinator = config["coordinator"][0]
     worldstateCoordinator = config["coordinator"][1]
-    # profileCoordinator = config["coordinator"][2]
+    profileCoordinator = config["coordinator"][2]
 
     sensors = []
 
-    if config.get("worldstates"):
+    # Another entry creates the sensors of a shared coordinator it owns
+    if worldstateCoordinator is not None and config["owner"][1]:
         sensors.append(LastUpdateSensor(worldstateCoordinator, staticDataCoordinator))
         sensors.append(AlertSensor(worldstateCoordinator))
         sensors.append(ArchonHuntSensor(worldstateCoordinator))
@@ -87,41 +157,73 @@ async def async_setup_entry(
         sensors.append(FissureSensor(worldstateCoordinator, "steel_path"))
         sensors.append(FissureSensor(worldstateCoordinator, "void_storm"))
         sensors.append(InvasionSensor(worldstateCoordinator))
-        sensors.append(SortieSensor(worldstateCoordinator))
+        sensors.append(SortieSensor(worldstateCoordinator, staticDataCoordinator))
         sensors.append(SteelPathSensor(worldstateCoordinator))
-        sensors.append(VoidTraderSensor(worldstateCoordinator))
-        sensors.append(VarziaSensor(worldstateCoordinator))
+        sensors.append(VoidTraderSensor(worldstateCoordinator, staticDataCoordinator))
+        sensors.append(VarziaSensor(worldstateCoordinator, staticDataCoordinator))
         sensors.append(DeepArchimedeaSensor(worldstateCoordinator))
         sensors.append(TemporalArchimedeaSensor(worldstateCoordinator))
-    # if config.get("profiles"):
-    #     for account_id in config.get("profiles"):
-    #         u_username = profileCoordinator.data.get(account_id, {}).get("Results",[{}])[0].get("DisplayName", account_id+"")
-    #         username = u_username[:len(u_username)-1]
-
-    #         sensors.append(AbilitiesSensor(profileCoordinator, username, staticDataCoordinator))
-    #         sensors.append(EnemiesSensor(profileCoordinator, username, staticDataCoordinator))
-    #         sensors.append(ScansSensor(profileCoordinator, username, staticDataCoordinator))
-    #         sensors.append(CreditSensor(profileCoordinator, username))
-    #         sensors.append(RankSensor(profileCoordinator, username))
-    #         sensors.append(DeathSensor(profileCoordinator, username, staticDataCoordinator))
-    #         sensors.append(TimePlayedSensor(profileCoordinator, username))
-    #         sensors.append(StarChartSensor(profileCoordinator, username, staticDataCoordinator))
-    #         for item_type in most_used_types:
-    #             sensors.append(MostUsedSensor(profileCoordinator, username, staticDataCoordinator, item_type))
-
-    async_add_entities(sensors, True)
+    # Every entry has its own watchlist, also on a shared coordinator
+    if worldstateCoordinator is not None and config.get(CONF_WATCHLIST):
+        sensors.append(WatchlistSensor(worldstateCoordinator, config_entry.entry_id))
+    if profileCoordinator is not None and config.get(CONF_PROFILE_SENSORS, True):
+        for account_id in config.get(CONF_PROFILES):
+            username = get_display_name(profileCoordinator.data.get(account_id, {}), account_id)
+
+            sensors.append(AbilitiesSensor(profileCoordinator, account_id, username, staticDataCoordinator))
+            sensors.append(EnemiesSensor(profileCoordinator, account_id, username, staticDataCoordinator))
+            sensors.append(ScansSensor(profileCoordinator, account_id, username, staticDataCoordinator))
+            sensors.append(CreditSensor(profileCoordinator, account_id, username))
+            sensors.append(RankSensor(profileCoordinator, account_id, username))
+            sensors.append(DeathSensor(profileCoordinator, account_id, username, staticDataCoordinator))
+            sensors.append(TimePlayedSensor(profileCoordinator, account_id, username))
+            sensors.append(StarChartSensor(profileCoordinator, account_id, username, staticDataCoordinator))
+            for item_type in most_used_types:
+                sensors.append(MostUsedSensor(profileCoordinator, account_id, username, staticDataCoordinator, item_type))
+    if profileCoordinator is not None and config.get(CONF_LEADERBOARDS):
+        for leaderboard in LEADERBOARDS:
+            sensors.append(LeaderboardSensor(profileCoordinator, staticDataCoordinator, leaderboard))
+    if config.get(CONF_CATALOG_SENSORS):
+        for stat in (CONF_TOTAL_ITEMS, CONF_TOTAL_PRIME_ITEMS, CONF_NEWEST_WARFRAME, CONF_ITEMS_ADDED):
+            sensors.append(CatalogSensor(staticDataCoordinator, stat))
+    for coordinator, owner in zip(config["coordinator"], config["owner"]):
+        if coordinator is not None and owner:
+            for metric in COORDINATOR_METRICS[coordinator.metrics.name]:
+                sensors.append(MetricSensor(coordinator, metric))
+
+    entity_registry = er.async_get(hass)
+    for sensor in sensors:
+        sensor.attribute_size = config.get(CONF_ATTRIBUTE_SIZE, DEFAULT_ATTRIBUTE_SIZE)
+        # Another entry already has this sensor (e.g. the leaderboards of
+        # two clan groups), keep them apart with this entry's id
+        entity_id = entity_registry.async_get_entity_id("sensor", DOMAIN, sensor.unique_id)
+        if entity_id is not None and entity_registry.async_get(entity_id).config_entry_id != config_entry.entry_id:
+            sensor._attr_unique_id = f"{sensor.unique_id}_{config_entry.entry_id}"
+
+    async_add_entities(sensors)
 
 class BaseWarframeSensor(CoordinatorEntity, RestoreSensor, SensorEntity):
     _attr_icon = "mdi:controller"
     _attr_native_value: float | None = None
     _attr_extra_state_attributes: dict | None = {}
     _unrecorded_attributes = frozenset({MATCH_ALL})
+    _attribute_policy: AttributePolicy | None = None
+    # Translation tables of ``self.static_data`` the sensor reads
+    _translations: tuple[str, ...] = ()
+    # Whether the sensor joins its items to the catalog of ``self.static_data``
+    _joins_catalog = False
+    # Items of a list attribute, set from the entry creating the sensor
+    attribute_size = DEFAULT_ATTRIBUTE_SIZE
 
     _base_id = "sensor.warframe_"
 
     def __init__(self, coordinator):
         super().__init__(coordinator)
 
+    def _limit_attribute(self, items, transform=None):
+        """Return the list attribute for ``items`` under the sensor's policy."""
+        return self._attribute_policy.apply(items, self.attribute_size, transform)
+
     async def async_added_to_hass(self) -> None:
         """Restore state on startup."""
         await super().async_added_to_hass()
@@ -129,10 +231,38 @@ class BaseWarframeSensor(CoordinatorEntity, RestoreSensor, SensorEntity):
         last_state = await self.async_get_last_state()
         last_sensor_data = await self.async_get_last_sensor_data()
 
-        if not last_state or not last_sensor_data or last_state.state in IGNORED_STATES:
-            return
-
-        self._attr_native_value = last_sensor_data.native_value
+        if last_state and last_sensor_data and last_state.state not in IGNORED_STATES:
+            self._attr_native_value = last_sensor_data.native_value
+
+        # Start from the data the coordinator already holds
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
+        if self._translations:
+            task = self.hass.async_create_background_task(
+                self._async_load_translations(), f"warframe-translations-{self.entity_id}"
+            )
+            self.async_on_remove(task.cancel)
+
+        if self._joins_catalog:
+            task = self.hass.async_create_background_task(
+                self._async_load_catalog(), f"warframe-catalog-{self.entity_id}"
+            )
+            self.async_on_remove(task.cancel)
+
+    async def _async_load_catalog(self):
+        """Load the catalog the sensor joins its items to without holding up its setup."""
+        catalog_version = self.static_data.catalog_version
+        await self.static_data.async_ensure_loaded()
+        if self.static_data.catalog_version != catalog_version and self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
+    async def _async_load_translations(self):
+        """Load the translation tables of the sensor without holding up its setup."""
+        version = self.static_data.translations.version
+        await self.static_data.translations.async_load(*self._translations)
+        if self.static_data.translations.version != version and self.coordinator.data is not None:
+            self._handle_coordinator_update()
 
 class WorldStateSesnor(BaseWarframeSensor):
     _attr_icon = "mdi:earth"
@@ -142,15 +272,27 @@ class WorldStateSesnor(BaseWarframeSensor):
         super().__init__(coordinator)
 
         self._attr_device_info = worldstate_device
+        if (coordinator.platform, coordinator.language) != (DEFAULT_PLATFORM, DEFAULT_LANGUAGE):
+            # Keep the sensors of every platform and language apart
+            self._worldstate_name = f"worldstate_{coordinator.platform}_{coordinator.language}_"
+            self._attr_device_info = DeviceInfo(
+                identifiers={(DOMAIN, f"worldstates_{coordinator.platform}_{coordinator.language}")},
+                name=f"Warframe Worldstate Info ({coordinator.platform.upper()} {coordinator.language})",
+            )
 
 class ProfileSensor(BaseWarframeSensor):
     _attr_icon = "mdi:earth"
 
-    def __init__(self, coordinator, username):
+    def __init__(self, coordinator, account_id, username):
         super().__init__(coordinator)
 
+        self.account_id = account_id
         self.username = username
 
+        if coordinator.statistics is not None and self.state_class is not None:
+            # The coordinator imports these counters into long-term statistics
+            self._attr_state_class = None
+
         self._attr_device_info = DeviceInfo(
             identifiers={(*profile_device_base_identifiers, username)},
             name=profile_device_base_name + username
@@ -159,7 +301,10 @@ class ProfileSensor(BaseWarframeSensor):
     async def async_added_to_hass(self) -> None:
         """Restore state on startup."""
         await super().async_added_to_hass()
-        
+
+    @property
+    def _profile_data(self):
+        return self.coordinator.data.get(self.account_id, {})
 
 
 class AlertSensor(WorldStateSesnor):
@@ -431,10 +576,13 @@ class InvasionSensor(WorldStateSesnor):
 
 class SortieSensor(WorldStateSesnor):
     _attr_icon = "mdi:calendar-today"
+    _translations = (TRANSLATION_SORTIES,)
 
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, staticDataCoordinator):
         super().__init__(coordinator)
 
+        self.static_data = staticDataCoordinator
+
         self._attr_name = "Sorties"
         self._attr_unique_id = f"{self._base_id}{self._worldstate_name}sorties"
         self.entity_id = self._attr_unique_id
@@ -455,7 +603,8 @@ class SortieSensor(WorldStateSesnor):
             missions_data.append({
                 "node": mission.get("node"),
                 "missionType": mission_name,
-                "modifier": mission.get("modifier")
+                "modifier": mission.get("modifier"),
+                "modifierDescription": self._modifier_description(mission)
             })
             state += mission_name
             if index < len(missions)-1:
@@ -466,6 +615,14 @@ class SortieSensor(WorldStateSesnor):
         self._attr_native_value = state
         self.async_write_ha_state()
 
+    def _modifier_description(self, mission):
+        description = mission.get("modifierDescription")
+        if description or not mission.get("modifier"):
+            return description
+        # The worldstate names the modifier, the sortie table is also keyed by name
+        sorties = self.static_data.translations.tables.get(TRANSLATION_SORTIES, {})
+        return sorties.get(mission["modifier"].lower(), {}).get("description")
+
 class SteelPathSensor(WorldStateSesnor):
     _attr_icon = "mdi:calendar-week"
 
@@ -487,10 +644,14 @@ class SteelPathSensor(WorldStateSesnor):
 
 class VoidTraderSensor(WorldStateSesnor):
     _attr_icon = "mdi:storefront-outline"
+    _attribute_policy = AttributePolicy(fields=("item", "ducats", "credits", "category", "isPrime", "description"))
+    _joins_catalog = True
 
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, staticDataCoordinator):
         super().__init__(coordinator)
 
+        self.static_data = staticDataCoordinator
+
         self._attr_name = "Void Trader"
         self._attr_unique_id = f"{self._base_id}{self._worldstate_name}void_trader"
         self.entity_id = self._attr_unique_id
@@ -503,18 +664,32 @@ class VoidTraderSensor(WorldStateSesnor):
 
         if _data.get("active"):
             self._attr_native_value = "Active"
-            self._attr_extra_state_attributes = {"inventory": _data.get("inventory")}
+            self._attr_extra_state_attributes = {
+                "inventory": self._limit_attribute(_data.get("inventory") or [], self._join_item)
+            }
         else:
             self._attr_native_value = "Inactive"
             self._attr_extra_state_attributes = {"inventory": []}
         self.async_write_ha_state()
 
+    def _join_item(self, item):
+        catalog_item = self.static_data.catalog_join.resolve(item.get("uniqueName"), item.get("item")) or {}
+        return item | {
+            "category": catalog_item.get("category"),
+            "isPrime": catalog_item.get("isPrime"),
+            "description": catalog_item.get("description"),
+        }
+
 class VarziaSensor(WorldStateSesnor):
     _attr_icon = "mdi:storefront-outline"
+    _attribute_policy = AttributePolicy(fields=("name", "aya", "regal_aya", "category", "isPrime", "description"))
+    _joins_catalog = True
 
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, staticDataCoordinator):
         super().__init__(coordinator)
 
+        self.static_data = staticDataCoordinator
+
         self._attr_name = "Primed Resurgence"
         self._attr_unique_id = f"{self._base_id}{self._worldstate_name}prime_resurgence_rotation"
         self.entity_id = self._attr_unique_id
@@ -525,20 +700,48 @@ class VarziaSensor(WorldStateSesnor):
             self.coordinator.data.get("vaultTrader", {})
         )
 
-        count = 0
-        data = []
-
         inventory = _data.get("inventory",[])
-        for item in inventory:
-            data.append({
-                "name": item.get("item"),
-                "aya": item.get("credits"),
-                "regal_aya": item.get("ducats")
-            })
-            count += 1
+        data = self._limit_attribute(inventory, self._join_item)
 
         self._attr_extra_state_attributes = {"items":data}
-        self._attr_native_value = count
+        self._attr_native_value = len(inventory)
+        self.async_write_ha_state()
+
+    def _join_item(self, item):
+        # Varzia's names are raw (``LonyxtorPrime``), the catalog has the display name
+        catalog_item = self.static_data.catalog_join.resolve(item.get("uniqueName"), item.get("item")) or {}
+        return {
+            "name": catalog_item.get("name") or item.get("item"),
+            "aya": item.get("credits"),
+            "regal_aya": item.get("ducats"),
+            "category": catalog_item.get("category"),
+            "isPrime": catalog_item.get("isPrime"),
+            "description": catalog_item.get("description"),
+        }
+
+class WatchlistSensor(WorldStateSesnor):
+    _attr_icon = "mdi:eye-outline"
+
+    def __init__(self, coordinator, entry_id):
+        super().__init__(coordinator)
+
+        self.entry_id = entry_id
+        self._attr_name = "Watchlist"
+        self._attr_unique_id = f"{self._base_id}{self._worldstate_name}watchlist"
+        self.entity_id = self._attr_unique_id
+
+    @callback
+    def _handle_coordinator_update(self):
+        watchlist = self.coordinator.watchlists.get(self.entry_id)
+        if watchlist is None:
+            return
+
+        matched_items = watchlist.matched_items
+        self._attr_extra_state_attributes = {
+            "items": matched_items,
+            "matches": watchlist.matches,
+        }
+        self._attr_native_value = len(matched_items)
         self.async_write_ha_state()
 
 class LastUpdateSensor(WorldStateSesnor):
@@ -568,7 +771,13 @@ class LastUpdateSensor(WorldStateSesnor):
                     newest_news_date = date
                     newest_news = news.get("message")
 
-        if self._attr_native_value != newest_news:
+        # Only a catalog something already loaded needs refreshing, and only
+        # when the news changed rather than on the first update
+        if (
+            self._attr_native_value is not None
+            and self._attr_native_value != newest_news
+            and self.staticDataCoordinator.catalog_version
+        ):
             self.hass.async_create_task(self.staticDataCoordinator.async_refresh())
 
         self._attr_native_value = newest_news
@@ -647,9 +856,11 @@ class TemporalArchimedeaSensor(WorldStateSesnor):
 
 class AbilitiesSensor(ProfileSensor):
     _attr_icon = "mdi:exclamation-thick"
+    _attribute_policy = AttributePolicy(fields=("name", "used"), sort_key="used")
+    _translations = (TRANSLATION_ABILITIES,)
 
-    def __init__(self, coordinator, username, staticDataCoordinator):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username, staticDataCoordinator):
+        super().__init__(coordinator, account_id, username)
 
         self.static_data = staticDataCoordinator
         self._attr_name = self.username + " Abilities Used"
@@ -659,30 +870,30 @@ class AbilitiesSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         user_ability_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Abilities", [])
-        )
-
-        ability_count = 0
-        abilities_used = []
-        for ability in user_ability_data:
-            key = ability.get("type")
-            used = int(ability.get("used", 0))
-            ability_name = self.static_data.name_lookup.get(key.lower())
-            ability_count += used
-            abilities_used.append({
-                "name": ability_name.get("value") if isinstance(ability_name, dict) else key,
-                "used": used
-            })
+            self._profile_data.get("Stats", {}).get("Abilities", [])
+        )
+
+        ability_count = sum(int(ability.get("used", 0)) for ability in user_ability_data)
+        abilities_used = self._limit_attribute(user_ability_data, self._resolve_ability)
 
         self._attr_extra_state_attributes = {"abilities": abilities_used}
         self._attr_native_value = ability_count
         self.async_write_ha_state()
 
+    def _resolve_ability(self, ability):
+        key = ability.get("type")
+        ability_name = self.static_data.resolve(key, layers=self._translations)
+        return {
+            "name": ability_name.get("value") if isinstance(ability_name, dict) else key,
+            "used": int(ability.get("used", 0))
+        }
+
 class EnemiesSensor(ProfileSensor):
     _attr_icon = "mdi:ammunition"
+    _attribute_policy = AttributePolicy(fields=("name", "killed"), sort_key="kills")
 
-    def __init__(self, coordinator, username, staticDataCoordinator):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username, staticDataCoordinator):
+        super().__init__(coordinator, account_id, username)
 
         self.static_data = staticDataCoordinator
         self._attr_name = username + " Enemies Killed"
@@ -692,30 +903,30 @@ class EnemiesSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         user_enemie_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Enemies", [])
-        )
-
-        enemies_killed_count = 0
-        enemies_killed = []
-        for enemy in user_enemie_data:
-            key = enemy.get("type")
-            killed = int(enemy.get("kills", 0))
-            enemy_name = self.static_data.name_lookup.get(key.lower())
-            enemies_killed_count += killed
-            enemies_killed.append({
-                "name": enemy_name.get("value") if isinstance(enemy_name, dict) else key,
-                "killed": killed
-            })
+            self._profile_data.get("Stats", {}).get("Enemies", [])
+        )
+
+        enemies_killed_count = sum(int(enemy.get("kills", 0)) for enemy in user_enemie_data)
+        enemies_killed = self._limit_attribute(user_enemie_data, self._resolve_enemy)
 
         self._attr_extra_state_attributes = {"enemies_killed": enemies_killed}
         self._attr_native_value = enemies_killed_count
         self.async_write_ha_state()
 
+    def _resolve_enemy(self, enemy):
+        key = enemy.get("type")
+        enemy_name = self.static_data.resolve(key)
+        return {
+            "name": enemy_name.get("value") if isinstance(enemy_name, dict) else key,
+            "killed": int(enemy.get("kills", 0))
+        }
+
 class ScansSensor(ProfileSensor):
     _attr_icon = "mdi:skull-scan-outline"
+    _attribute_policy = AttributePolicy(fields=("name", "scans"), sort_key="scans")
 
-    def __init__(self, coordinator, username, staticDataCoordinator):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username, staticDataCoordinator):
+        super().__init__(coordinator, account_id, username)
 
         self.static_data = staticDataCoordinator
         self._attr_name = username + " Most Scans"
@@ -733,35 +944,36 @@ class ScansSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         user_enemie_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Scans", [])
+            self._profile_data.get("Stats", {}).get("Scans", [])
         )
 
+        items_scanned = self._limit_attribute(user_enemie_data, self._resolve_scan)
+
         max_scan_amount = 0
         max_scan_item = ""
-        items_scanned = []
-        for enemy in user_enemie_data:
-            key = enemy.get("type")
-            scans = int(enemy.get("scans", 0))
-            item_name = self.static_data.name_lookup.get(key.lower())
-            if max_scan_amount < scans:
-                max_scan_amount = scans
-                max_scan_item = item_name.get("value") if isinstance(item_name, dict) else key
-
-            items_scanned.append({
-                "name": item_name.get("value") if isinstance(item_name, dict) else key,
-                "scans": scans
-            })
+        # The most scanned item comes first
+        if items_scanned and items_scanned[0]["scans"] > 0:
+            max_scan_amount = items_scanned[0]["scans"]
+            max_scan_item = items_scanned[0]["name"]
 
         self._attr_extra_state_attributes = {"max_scanned": {"name":max_scan_item, "scans": max_scan_amount}, "items_scanned": items_scanned}
         self._attr_native_value = max_scan_item
         self.async_write_ha_state()
 
+    def _resolve_scan(self, scan):
+        key = scan.get("type")
+        item_name = self.static_data.resolve(key)
+        return {
+            "name": item_name.get("value") if isinstance(item_name, dict) else key,
+            "scans": int(scan.get("scans", 0))
+        }
+
 class CreditSensor(ProfileSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:micro-sd"
 
-    def __init__(self, coordinator, username):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username):
+        super().__init__(coordinator, account_id, username)
 
         self._attr_name = username + " Total Credits"
         self._attr_unique_id = f"sensor.warframe_{username}_total_credits"
@@ -770,10 +982,10 @@ class CreditSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         credit_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Income", 0)
+            self._profile_data.get("Stats", {}).get("Income", 0)
         )
         time_played_seconds_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("TimePlayedSec", 0.0)
+            self._profile_data.get("Stats", {}).get("TimePlayedSec", 0.0)
         )
 
         self._attr_extra_state_attributes = {"credits_per_hour": 0 if time_played_seconds_data == 0.0 else (credit_data/((time_played_seconds_data/60.0)/60.0))}
@@ -783,8 +995,8 @@ class CreditSensor(ProfileSensor):
 class RankSensor(ProfileSensor):
     _attr_icon = "mdi:chevron-triple-up"
 
-    def __init__(self, coordinator, username):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username):
+        super().__init__(coordinator, account_id, username)
 
         self._attr_name = username + " Rank"
         self._attr_unique_id = f"sensor.warframe_{username}_rank"
@@ -793,7 +1005,7 @@ class RankSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         rank_data = (
-            self.coordinator.data.get(self.username, {}).get("Results",[{}])[0].get("PlayerLevel", 0)
+            self._profile_data.get("Results",[{}])[0].get("PlayerLevel", 0)
         )
 
         rank = 0
@@ -802,7 +1014,7 @@ class RankSensor(ProfileSensor):
             is_legendary = True
             rank = rank_data - 30
         time_played_seconds_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("TimePlayedSec", 0.0)
+            self._profile_data.get("Stats", {}).get("TimePlayedSec", 0.0)
         )
 
         # self._attr_extra_state_attributes.update({"rank_per_day": rank_data/(((time_played_seconds_data/60)/60)/24)})
@@ -812,9 +1024,10 @@ class RankSensor(ProfileSensor):
 class DeathSensor(ProfileSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:robot-dead-outline"
+    _attribute_policy = AttributePolicy(fields=("name", "deaths"), sort_key="deaths")
 
-    def __init__(self, coordinator, username, staticDataCoordinator):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username, staticDataCoordinator):
+        super().__init__(coordinator, account_id, username)
 
         self.static_data = staticDataCoordinator
         self._attr_name = username + " Deaths"
@@ -824,33 +1037,34 @@ class DeathSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         death_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Deaths", 0)
+            self._profile_data.get("Stats", {}).get("Deaths", 0)
         )
         user_enemy_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Enemies", [])
-        )
-
-        enemies_that_killed_player = []
-        for enemy in user_enemy_data:
-            if enemy.get("deaths"):
-                key = enemy.get("type")
-                deaths = int(enemy.get("deaths", 0))
-                enemy_name = self.static_data.name_lookup.get(key.lower())
-                enemies_that_killed_player.append({
-                    "name": enemy_name.get("value") if isinstance(enemy_name, dict) else key,
-                    "deaths": deaths
-                })
+            self._profile_data.get("Stats", {}).get("Enemies", [])
+        )
+
+        enemies_that_killed_player = self._limit_attribute(
+            (enemy for enemy in user_enemy_data if enemy.get("deaths")), self._resolve_enemy
+        )
 
         self._attr_extra_state_attributes = {"player_kills": enemies_that_killed_player}
         self._attr_native_value = death_data
         self.async_write_ha_state()
 
+    def _resolve_enemy(self, enemy):
+        key = enemy.get("type")
+        enemy_name = self.static_data.resolve(key)
+        return {
+            "name": enemy_name.get("value") if isinstance(enemy_name, dict) else key,
+            "deaths": int(enemy.get("deaths", 0))
+        }
+
 class TimePlayedSensor(ProfileSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:timer-alert-outline"
 
-    def __init__(self, coordinator, username):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username):
+        super().__init__(coordinator, account_id, username)
 
         self._attr_name = username + " Time Played"
         self._attr_unique_id = f"sensor.warframe_{username}_time_played"
@@ -859,7 +1073,7 @@ class TimePlayedSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         time_played_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("TimePlayedSec", 0.0)
+            self._profile_data.get("Stats", {}).get("TimePlayedSec", 0.0)
         )
         seconds_played = float(time_played_data)
         minutes_played = seconds_played/60.0
@@ -880,9 +1094,11 @@ class TimePlayedSensor(ProfileSensor):
 class StarChartSensor(ProfileSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:map-marker-path"
+    _attribute_policy = AttributePolicy(fields=("node", "highScore"), sort_key="highScore")
+    _translations = (TRANSLATION_NODES,)
 
-    def __init__(self, coordinator, username, staticDataCoordinator):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username, staticDataCoordinator):
+        super().__init__(coordinator, account_id, username)
 
         self.static_data = staticDataCoordinator
         self._attr_name = username + " Star Chart Completion"
@@ -891,47 +1107,41 @@ class StarChartSensor(ProfileSensor):
 
     @callback
     def _handle_coordinator_update(self):
-        mission_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Missions", [])
-        )
+        # Shared with the long-term statistic, so both count the same nodes
+        nodes = get_star_chart_nodes(self._profile_data, self.static_data.resolve)
 
-        total_missions = 0
-        total_completed_missions = 0
         steel_path = []
         regular = []
-        for mission in mission_data:
-            nodeKey = mission.get("type")
-            complete = True if mission.get("highScore") else False
-            nodeName = self.static_data.name_lookup.get((nodeKey[:-3] if _check_hard_mode(nodeKey) else nodeKey).lower() )
-            if nodeName:
-                total_missions += 1
-                if complete:
-                    total_completed_missions += 1
-                    highScore = mission.get("highScore", 0)
-                    if _check_hard_mode(nodeKey):
-                        steel_path.append({
-                            "node": nodeName,
-                            "highScore": highScore
-                        })
-                    else:
-                        regular.append({
-                            "node": nodeName,
-                            "highScore": highScore
-                        })
+        for nodeName, hard_mode, mission in nodes:
+            if mission.get("highScore"):
+                highScore = mission.get("highScore", 0)
+                if hard_mode:
+                    steel_path.append({
+                        "node": nodeName,
+                        "highScore": highScore
+                    })
+                else:
+                    regular.append({
+                        "node": nodeName,
+                        "highScore": highScore
+                    })
 
         self._attr_extra_state_attributes = {
-            "steel_path": steel_path,
-            "regular": regular,
-            "total_missions": total_missions
+            "steel_path": self._limit_attribute(steel_path),
+            "regular": self._limit_attribute(regular),
+            "total_missions": len(nodes)
             }
-        self._attr_native_value = total_completed_missions / total_missions if total_missions else 0
+        self._attr_native_value = get_star_chart_completion(nodes)
         self.async_write_ha_state()
 
 class MostUsedSensor(ProfileSensor):
     _attr_icon = "mdi:chart-donut"
+    _attribute_policy = AttributePolicy(
+        fields=("name", "type", "equipTime", "xp", "kills", "headshots", "assists"), sort_key="equipTime"
+    )
 
-    def __init__(self, coordinator, username, staticDataCoordinator, type):
-        super().__init__(coordinator, username)
+    def __init__(self, coordinator, account_id, username, staticDataCoordinator, type):
+        super().__init__(coordinator, account_id, username)
 
         self.static_data = staticDataCoordinator
         self.type = type
@@ -942,41 +1152,174 @@ class MostUsedSensor(ProfileSensor):
     @callback
     def _handle_coordinator_update(self):
         weapon_data = (
-            self.coordinator.data.get(self.username, {}).get("Stats", {}).get("Weapons", [])
+            self._profile_data.get("Stats", {}).get("Weapons", [])
         )
-        lookup = self.static_data.name_lookup
 
         most_used_key = ""
-        most_equip_time = 0
-
-        weapons = []
 
+        names = {}
         for item in weapon_data:
-            item_info = lookup.get(item.get("type").lower(), {})
+            item_info = self.static_data.resolve(item.get("type")) or {}
             if (item_info.get("type") and item_info.get("type") == self.type):
-                equip_time = item.get("equipTime", 0.0)
-                weapons.append(item | {"name": item_info.get("value", item.get("type", "Unknown"))})
-                if most_equip_time < equip_time:
-                    most_equip_time = equip_time
-                    most_used_key = item.get("type")
+                names[item.get("type")] = item_info.get("value", item.get("type", "Unknown"))
+
+        weapons = self._limit_attribute(
+            (item for item in weapon_data if item.get("type") in names),
+            lambda item: item | {"name": names[item.get("type")]},
+        )
+        # The most used item comes first
+        if weapons and weapons[0]["equipTime"]:
+            most_used_key = weapons[0]["type"]
 
         self._attr_extra_state_attributes = {self.type: weapons}
-        self._attr_native_value =_get_partial_lookup(most_used_key, lookup, {}).get("value")
+        self._attr_native_value = (self.static_data.resolve(most_used_key, partial=True) or {}).get("value")
         self.async_write_ha_state()
 
-def _check_hard_mode(nodeKey):
-    return True if nodeKey.endswith("_HM") else False
-
-def _get_partial_lookup(to_lookup, lookup_table, default=None):
-    to_lookup = to_lookup.lower()
-    data = lookup_table.get(to_lookup)
-    if data is not None:
-        return data
-    for lookup_key, data in lookup_table.items():
-        ## if lookup key is substring
-        if lookup_key.startswith(to_lookup) or to_lookup.startswith(lookup_key):
-            return data
-    for lookup_key, data in lookup_table.items():
-        if lookup_key.startswith("/".join(to_lookup.split("/")[:-1])) or "/".join(to_lookup.split("/")[:-1]).startswith(lookup_key):
-            return data
-    return default
+class LeaderboardSensor(BaseWarframeSensor):
+    _attr_icon = "mdi:podium"
+
+    def __init__(self, coordinator, staticDataCoordinator, leaderboard):
+        super().__init__(coordinator)
+
+        self.static_data = staticDataCoordinator
+        self.leaderboard = leaderboard
+        self._attr_device_info = leaderboard_device
+        self._attr_name = "Top " + leaderboard.replace("_", " ").title()
+        self._attr_unique_id = f"{self._base_id}leaderboard_{leaderboard}"
+        self.entity_id = self._attr_unique_id
+
+    @callback
+    def _handle_coordinator_update(self):
+        top = self.coordinator.leaderboard.top(self.leaderboard)
+
+        ranking = []
+        for rank, (key, value) in enumerate(top, start=1):
+            if self.leaderboard == LEADERBOARD_MOST_USED_WARFRAME:
+                name = (self.static_data.resolve(key) or {}).get("value", key)
+            else:
+                name = self.coordinator.leaderboard.usernames.get(key, key)
+            ranking.append({
+                "rank": rank,
+                "name": name,
+                "value": value
+            })
+
+        self._attr_extra_state_attributes = {"ranking": ranking}
+        self._attr_native_value = ranking[0].get("name") if ranking else None
+        self.async_write_ha_state()
+
+class CatalogSensor(BaseWarframeSensor):
+    _attr_icon = "mdi:book-open-variant"
+    _attribute_policy = AttributePolicy(fields=("name", "type", "uniqueName"))
+
+    def __init__(self, coordinator, stat):
+        super().__init__(coordinator)
+
+        self.stat = stat
+        self._catalog_version = None
+        self._attr_device_info = catalog_device
+        self._attr_name = stat.replace("_", " ").title()
+        self._attr_unique_id = f"{self._base_id}catalog_{stat}"
+        self.entity_id = self._attr_unique_id
+
+    async def async_added_to_hass(self) -> None:
+        """Restore state on startup and load the catalog in the background."""
+        await super().async_added_to_hass()
+
+        task = self.hass.async_create_background_task(
+            self._async_load_catalog(), f"warframe-catalog-{self.entity_id}"
+        )
+        self.async_on_remove(task.cancel)
+
+    async def _async_load_catalog(self):
+        await self.coordinator.async_ensure_loaded()
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self):
+        # The figures only change with the catalog
+        catalog_version = self.coordinator.catalog_version
+        if not catalog_version or catalog_version == self._catalog_version:
+            return
+        self._catalog_version = catalog_version
+
+        stats = self.coordinator.catalog_stats
+        match self.stat:
+            case "total_items":
+                self._attr_native_value = stats.total
+                self._attr_extra_state_attributes = dict(stats.counts)
+            case "total_prime_items":
+                self._attr_native_value = stats.total_primes
+                self._attr_extra_state_attributes = dict(stats.primes)
+            case "newest_warframe":
+                newest_warframe = stats.newest_warframe or {}
+                self._attr_native_value = newest_warframe.get("name")
+                self._attr_extra_state_attributes = {
+                    "releaseDate": newest_warframe.get("releaseDate"),
+                    "description": newest_warframe.get("description"),
+                }
+            case "items_added":
+                self._attr_native_value = len(stats.added)
+                self._attr_extra_state_attributes = {
+                    "items": self._limit_attribute(stats.added),
+                    "catalog_version": catalog_version,
+                }
+        self.async_write_ha_state()
+
+class MetricSensor(CoordinatorEntity, SensorEntity):
+    _attr_icon = "mdi:speedometer"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, metric):
+        super().__init__(coordinator)
+
+        self.metric = metric
+        coordinator_name = coordinator.metrics.name
+        self._attr_name = f"{coordinator_name.capitalize()} {metric_names[metric]}"
+        self._attr_unique_id = f"sensor.warframe_metrics_{coordinator_name}_{metric}"
+        self.entity_id = self._attr_unique_id
+        self._attr_device_info = metrics_device
+        if metric in TIMING_METRICS:
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+            if metric in (METRIC_BYTES_RECEIVED, METRIC_WIRE_BYTES):
+                self._attr_device_class = SensorDeviceClass.DATA_SIZE
+                self._attr_native_unit_of_measurement = UnitOfInformation.BYTES
+
+    @property
+    def available(self) -> bool:
+        """Metrics that cannot be measured (see the diagnostics for why) are unavailable."""
+        return super().available and self.metric not in self.coordinator.metrics.unavailable
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self):
+        metrics = self.coordinator.metrics
+        if self.metric in TIMING_METRICS:
+            timing = metrics.timings.get(self.metric)
+            if timing is None:
+                self._attr_native_value = None
+                self._attr_extra_state_attributes = {}
+            else:
+                self._attr_native_value = round(timing["last"] * 1000, 2)
+                self._attr_extra_state_attributes = {
+                    "max": round(timing["max"] * 1000, 2),
+                    "mean": round(timing["total"] / timing["count"] * 1000, 2),
+                    "count": timing["count"],
+                }
+        else:
+            self._attr_native_value = metrics.get(self.metric)
+            frames = metrics.get(METRIC_FRAMES_RECEIVED)
+            if self.metric == METRIC_WIRE_BYTES and frames:
+                # Compare with the bytes received (decompressed) per frame
+                self._attr_extra_state_attributes = {
+                    "per_frame": round(self._attr_native_value / frames),
+                }
+        self.async_write_ha_state()
@@ -0,0 +1,215 @@
+"""Services for the Warframe Stats integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import CONF_PROFILES, DOMAIN
+from .profiler import WarframeProfiler
+from .query import (
+    DATASET_CATALOG,
+    DATASETS,
+    PROFILE_DATASETS,
+    catalog_rows,
+    profile_rows,
+    query,
+    worldstate_rows,
+)
+
+SERVICE_PROFILE = "profile"
+SERVICE_QUERY = "query"
+SERVICE_SEARCH = "search"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_COORDINATOR = "coordinator"
+ATTR_CYCLES = "cycles"
+ATTR_TIMEOUT = "timeout"
+ATTR_REFRESH = "refresh"
+
+ATTR_DATASET = "dataset"
+ATTR_ACCOUNT_ID = "account_id"
+ATTR_FILTER = "filter"
+ATTR_SEARCH = "search"
+ATTR_SORT_BY = "sort_by"
+ATTR_DESCENDING = "descending"
+ATTR_FIELDS = "fields"
+ATTR_OFFSET = "offset"
+ATTR_LIMIT = "limit"
+
+ATTR_TEXT = "text"
+ATTR_CATEGORY = "category"
+
+MAX_QUERY_LIMIT = 500
+
+COORDINATOR_INDEX = {"static": 0, "worldstate": 1, "profile": 2}
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_COORDINATOR, default="worldstate"): vol.In(list(COORDINATOR_INDEX)),
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional(ATTR_TIMEOUT, default=300): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+        vol.Optional(ATTR_REFRESH, default=False): bool,
+    }
+)
+
+SERVICE_QUERY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DATASET): vol.In(DATASETS),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_ACCOUNT_ID): cv.string,
+        vol.Optional(ATTR_FILTER, default={}): {cv.string: vol.Any(bool, int, float, cv.string, list)},
+        vol.Optional(ATTR_SEARCH): cv.string,
+        vol.Optional(ATTR_SORT_BY): cv.string,
+        vol.Optional(ATTR_DESCENDING, default=False): bool,
+        vol.Optional(ATTR_FIELDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_LIMIT, default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_QUERY_LIMIT)),
+    }
+)
+
+SERVICE_SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TEXT): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CATEGORY): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_LIMIT, default=20): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_QUERY_LIMIT)),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, name, call: ServiceCall, account_id=None):
+    """Return the coordinator of the call's entry.
+
+    Without a ``config_entry_id`` the coordinator is only picked when the
+    loaded entries have one between them (entries can share it), or only one
+    of them tracks ``account_id``.
+    """
+    entries = hass.config_entries.async_loaded_entries(DOMAIN)
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is not None:
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if not entries:
+            raise ServiceValidationError(f"{entry_id} is not a loaded Warframe Stats entry")
+
+    coordinators = []
+    for entry in entries:
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"][COORDINATOR_INDEX[name]]
+        if coordinator is None or coordinator in coordinators:
+            continue
+        if account_id is not None and account_id not in coordinator.config.get(CONF_PROFILES, []):
+            continue
+        coordinators.append(coordinator)
+
+    if not coordinators:
+        if account_id is not None and entry_id is not None:
+            raise ServiceValidationError(f"{entry_id} does not track the account {account_id}")
+        if account_id is not None:
+            raise ServiceValidationError(f"No loaded Warframe Stats entry tracks the account {account_id}")
+        raise ServiceValidationError(f"No Warframe Stats {name} coordinator is loaded")
+    if len(coordinators) > 1:
+        raise ServiceValidationError(
+            f"Several Warframe Stats entries have a {name} coordinator, choose one with {ATTR_CONFIG_ENTRY_ID}"
+        )
+    return coordinators[0]
+
+
+async def _async_get_rows(hass: HomeAssistant, call: ServiceCall):
+    dataset = call.data[ATTR_DATASET]
+    if dataset == DATASET_CATALOG:
+        static_data = _get_coordinator(hass, "static", call)
+        await static_data.async_ensure_loaded()
+        return catalog_rows(static_data.name_lookup)
+
+    if dataset in PROFILE_DATASETS:
+        account_id = call.data.get(ATTR_ACCOUNT_ID)
+        profile = _get_coordinator(hass, "profile", call, account_id)
+        account_ids = profile.config.get(CONF_PROFILES, [])
+        if account_id is None and len(account_ids) == 1:
+            account_id = account_ids[0]
+        if account_id not in account_ids:
+            raise ServiceValidationError(f"{ATTR_ACCOUNT_ID} must be one of the tracked accounts for {dataset}")
+        return profile_rows((profile.data or {}).get(account_id, {}), dataset, profile.static_data.resolve)
+
+    return worldstate_rows(_get_coordinator(hass, "worldstate", call).world_state_data, dataset)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Warframe Stats services."""
+    profiling = set()
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the next cycles of a coordinator."""
+        coordinator = _get_coordinator(hass, call.data[ATTR_COORDINATOR], call)
+        if coordinator in profiling:
+            raise ServiceValidationError(f"The {call.data[ATTR_COORDINATOR]} coordinator is already being profiled")
+
+        profiling.add(coordinator)
+        try:
+            profiler = WarframeProfiler(hass, coordinator, call.data[ATTR_CYCLES])
+            return await profiler.async_run(call.data[ATTR_TIMEOUT], call.data[ATTR_REFRESH])
+        except ValueError as err:
+            # cProfile refuses to run next to another profiler
+            raise HomeAssistantError(f"Could not start profiling: {err}") from err
+        finally:
+            profiling.discard(coordinator)
+
+    async def async_query(call: ServiceCall) -> ServiceResponse:
+        """Return one page of a dataset."""
+        rows = await _async_get_rows(hass, call)
+        try:
+            result = query(
+                rows,
+                filters=call.data[ATTR_FILTER],
+                search=call.data.get(ATTR_SEARCH),
+                sort_by=call.data.get(ATTR_SORT_BY),
+                descending=call.data[ATTR_DESCENDING],
+                offset=call.data[ATTR_OFFSET],
+                limit=call.data[ATTR_LIMIT],
+                fields=call.data.get(ATTR_FIELDS),
+            )
+        except TypeError as err:
+            # Values of different types under the sort key
+            raise ServiceValidationError(f"Cannot sort by {call.data.get(ATTR_SORT_BY)}: {err}") from err
+        return {ATTR_DATASET: call.data[ATTR_DATASET]} | result
+
+    async def async_search(call: ServiceCall) -> ServiceResponse:
+        """Return one page of the catalog entries matching some words."""
+        static_data = _get_coordinator(hass, "static", call)
+        await static_data.async_ensure_loaded()
+        result = static_data.search_index.search(
+            call.data[ATTR_TEXT],
+            categories=[category.casefold() for category in call.data.get(ATTR_CATEGORY, [])],
+            offset=call.data[ATTR_OFFSET],
+            limit=call.data[ATTR_LIMIT],
+        )
+        return {ATTR_TEXT: call.data[ATTR_TEXT]} | result
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=SERVICE_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY,
+        async_query,
+        schema=SERVICE_QUERY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH,
+        async_search,
+        schema=SERVICE_SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,123 @@
+"""HTTP session owned by the integration for the Warframe APIs."""
+
+from __future__ import annotations
+
+import time
+
+import aiohttp
+from aiohttp.compression_utils import HAS_BROTLI
+from aiohttp.hdrs import ACCEPT_ENCODING, USER_AGENT
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util import ssl as ssl_util
+
+from .const import DOMAIN
+from .metrics import (
+    METRIC_CONNECT_TIME,
+    METRIC_CONNECTIONS_CREATED,
+    METRIC_CONNECTIONS_REUSED,
+    METRIC_POOL_WAIT,
+)
+
+DATA_SESSION = f"{DOMAIN}_session"
+
+# Only api.warframestat.us and content.warframe.com are called, a burst of
+# profile fetches queues behind these rather than opening more connections
+CONNECTIONS_PER_HOST = 4
+CONNECTIONS = 8
+# Idle connections are kept this long (aiohttp keeps them 15 seconds), so a
+# refresh reuses the connection of the one before instead of a new TLS setup
+KEEPALIVE_TIMEOUT = 120
+DNS_CACHE_TTL = 300
+
+ACCEPT_ENCODINGS = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+
+class WarframeSession:
+    """The integration's ClientSession and its connection pool.
+
+    Requests made with a coordinator's metrics as ``trace_request_ctx``
+    count the connections they open or reuse and time the wait for a free
+    connection and the connection setup (including TLS) into them.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.connector = aiohttp.TCPConnector(
+            limit=CONNECTIONS,
+            limit_per_host=CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            ssl=ssl_util.client_context(),
+        )
+        self.session = aiohttp.ClientSession(
+            connector=self.connector,
+            headers={USER_AGENT: SERVER_SOFTWARE, ACCEPT_ENCODING: ACCEPT_ENCODINGS},
+            trace_configs=[_trace_config()],
+        )
+        self._unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_closed)
+
+    async def _async_closed(self, _: Event) -> None:
+        self._unsub_close = None
+        await self.async_close()
+
+    async def async_close(self):
+        """Close the session and every pooled connection."""
+        if self.hass.data.get(DATA_SESSION) is self:
+            del self.hass.data[DATA_SESSION]
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self.session.close()
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the integration's session, created on first use."""
+    warframe_session = hass.data.get(DATA_SESSION)
+    if warframe_session is None:
+        warframe_session = hass.data[DATA_SESSION] = WarframeSession(hass)
+    return warframe_session.session
+
+
+async def async_close_session(hass: HomeAssistant):
+    """Close the integration's session, once no entry uses it."""
+    warframe_session = hass.data.get(DATA_SESSION)
+    if warframe_session is not None:
+        await warframe_session.async_close()
+
+
+def _trace_config():
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_queued_start.append(_on_queued_start)
+    trace_config.on_connection_queued_end.append(_on_queued_end)
+    trace_config.on_connection_create_start.append(_on_create_start)
+    trace_config.on_connection_create_end.append(_on_create_end)
+    trace_config.on_connection_reuseconn.append(_on_reuseconn)
+    return trace_config
+
+
+async def _on_queued_start(session, context, params):
+    context.queued = time.perf_counter()
+
+
+async def _on_queued_end(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.record_time(METRIC_POOL_WAIT, time.perf_counter() - context.queued)
+
+
+async def _on_create_start(session, context, params):
+    context.connecting = time.perf_counter()
+
+
+async def _on_create_end(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.increment(METRIC_CONNECTIONS_CREATED)
+        context.trace_request_ctx.record_time(METRIC_CONNECT_TIME, time.perf_counter() - context.connecting)
+
+
+async def _on_reuseconn(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.increment(METRIC_CONNECTIONS_REUSED)
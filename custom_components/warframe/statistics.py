@@ -0,0 +1,189 @@
+"""Long-term statistics import for the Warframe Stats profile counters."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+from .leaderboard import get_display_name
+from .translations import TRANSLATION_NODES
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_STORAGE_VERSION = 1
+STATISTICS_SAVE_DELAY = 30
+# Hours of snapshots kept while they cannot be imported, the oldest are dropped
+MAX_PENDING_HOURS = 24 * 31
+
+HOUR = 3600
+
+
+def get_star_chart_nodes(profile_data, resolve):
+    """Return ``(node, steel_path, mission)`` for every mission of a known node.
+
+    Missions whose node ``resolve`` cannot find are left out, so the Star
+    Chart Completion sensor and statistic count the same nodes.
+    """
+    nodes = []
+    for mission in profile_data.get("Stats", {}).get("Missions", []):
+        node_key = mission.get("type", "")
+        steel_path = node_key.endswith("_HM")
+        node = resolve(node_key[:-3] if steel_path else node_key, layers=(TRANSLATION_NODES,))
+        if node:
+            nodes.append((node, steel_path, mission))
+    return nodes
+
+
+def get_star_chart_completion(nodes):
+    """Return the share of the nodes of ``get_star_chart_nodes`` with a high score."""
+    if not nodes:
+        return 0
+    return sum(1 for _, _, mission in nodes if mission.get("highScore")) / len(nodes)
+
+
+# key: (name, unit, has_sum, value getter)
+PROFILE_STATISTICS = {
+    "total_credits": (
+        "Total Credits",
+        None,
+        True,
+        lambda profile_data, resolve: profile_data.get("Stats", {}).get("Income", 0),
+    ),
+    "deaths": (
+        "Deaths",
+        None,
+        True,
+        lambda profile_data, resolve: profile_data.get("Stats", {}).get("Deaths", 0),
+    ),
+    "time_played": (
+        "Time Played",
+        UnitOfTime.HOURS,
+        True,
+        lambda profile_data, resolve: round(float(profile_data.get("Stats", {}).get("TimePlayedSec", 0.0))/HOUR, 2),
+    ),
+    "star_chart_completion": (
+        "Star Chart Completion",
+        None,
+        False,
+        lambda profile_data, resolve: get_star_chart_completion(get_star_chart_nodes(profile_data, resolve)),
+    ),
+}
+
+
+class WarframeProfileStatistics:
+    """Batches profile counters into hourly external statistics.
+
+    Every profile refresh records one snapshot per counter. Snapshots are
+    persisted so rows that could not be imported before a restart are
+    imported afterwards. Hours without a snapshot are left out rather than
+    made up from the last known value.
+    """
+
+    def __init__(self, hass, entry):
+        self.hass = hass
+        self._store = Store(hass, STATISTICS_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.statistics")
+        self._statistics = {}
+        self._unsaved = False
+
+    async def async_load(self):
+        """Load the persisted snapshots."""
+        data = await self._store.async_load()
+        if data:
+            self._statistics = data.get("statistics", {})
+
+    @callback
+    def async_record(self, account_id, profile_data, resolve):
+        """Record one snapshot per counter for the current hour.
+
+        ``resolve`` finds the nodes of the star chart, as for the sensors.
+        """
+        if not profile_data:
+            return
+        username = get_display_name(profile_data, account_id)
+        hour = int(dt_util.utcnow().timestamp()) // HOUR * HOUR
+        for key, (name, _, _, get_value) in PROFILE_STATISTICS.items():
+            statistic_id = f"{DOMAIN}:{slugify(account_id)}_{key}"
+            statistic = self._statistics.setdefault(
+                statistic_id, {"last": None, "pending": []}
+            )
+            statistic["name"] = f"{username} {name}"
+            statistic["key"] = key
+            pending = statistic["pending"]
+            value = get_value(profile_data, resolve)
+            if pending and pending[-1][0] == hour:
+                pending[-1][1] = value
+            else:
+                pending.append([hour, value])
+                if len(pending) > MAX_PENDING_HOURS:
+                    del pending[:-MAX_PENDING_HOURS]
+        self._unsaved = True
+        self._store.async_delay_save(self._data_to_save, STATISTICS_SAVE_DELAY)
+
+    @callback
+    def async_import(self):
+        """Import every pending snapshot with one call per statistic."""
+        if "recorder" not in self.hass.config.components:
+            return
+
+        imported = False
+        for statistic_id, statistic in self._statistics.items():
+            if not statistic["pending"]:
+                continue
+            _, unit, has_sum, _ = PROFILE_STATISTICS[statistic["key"]]
+            last = statistic["last"]
+
+            # The latest snapshot of every hour wins, and the last imported
+            # hour is imported again when it got a newer snapshot
+            latest = dict(statistic["pending"])
+            rows = []
+            for hour, value in sorted(latest.items()):
+                if last is not None and hour < last:
+                    continue
+                rows.append(_statistic_row(hour, value, has_sum))
+                last = hour
+
+            statistic["pending"] = []
+            if not rows:
+                continue
+
+            metadata = StatisticMetaData(
+                has_mean=not has_sum,
+                has_sum=has_sum,
+                name=statistic["name"],
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_of_measurement=unit,
+            )
+            async_add_external_statistics(self.hass, metadata, rows)
+            _LOGGER.debug("Imported %s statistic rows for %s", len(rows), statistic_id)
+            statistic["last"] = last
+            imported = True
+
+        if imported:
+            self._unsaved = True
+            self._store.async_delay_save(self._data_to_save, STATISTICS_SAVE_DELAY)
+
+    async def async_flush(self):
+        """Write a scheduled save now, so nothing is left behind on unload."""
+        if self._unsaved:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self):
+        self._unsaved = False
+        return {"statistics": self._statistics}
+
+
+def _statistic_row(hour, value, has_sum):
+    start = dt_util.utc_from_timestamp(hour)
+    if has_sum:
+        return StatisticData(start=start, state=value, sum=value)
+    return StatisticData(start=start, mean=value, min=value, max=value)
@@ -0,0 +1,112 @@
+"""Snapshot storage used to warm start the Warframe Stats coordinators."""
+
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+
+# Only the parts of a packet the sensors read are persisted
+WORLDSTATE_SNAPSHOT_KEYS = [
+    "alerts",
+    "archonHunt",
+    "constructionProgress",
+    "deepArchimedea",
+    "events",
+    "fissures",
+    "invasions",
+    "news",
+    "sortie",
+    "steelPath",
+    "syndicateMissions",
+    "temporalArchimedea",
+    "vaultTrader",
+    "voidTrader",
+]
+PROFILE_SNAPSHOT_RESULT_KEYS = ["DisplayName", "PlayerLevel"]
+PROFILE_SNAPSHOT_STATS_KEYS = {
+    "Abilities": ["type", "used"],
+    "Enemies": ["type", "kills", "deaths"],
+    "Scans": ["type", "scans"],
+    "Missions": ["type", "highScore"],
+    # Weapons are copied into the most used attributes as is
+    "Weapons": None,
+    "Income": None,
+    "Deaths": None,
+    "TimePlayedSec": None,
+}
+
+
+def worldstate_digest(world_state_data):
+    """Return the compact form of a worldstate packet."""
+    return {
+        key: value
+        for key, value in world_state_data.items()
+        if key in WORLDSTATE_SNAPSHOT_KEYS or key.endswith("Cycle")
+    }
+
+
+def profile_digest(profile_data):
+    """Return the compact form of a profile."""
+    results = profile_data.get("Results", [{}])[0]
+    stats = profile_data.get("Stats", {})
+    digest_stats = {}
+    for key, item_keys in PROFILE_SNAPSHOT_STATS_KEYS.items():
+        if key not in stats:
+            continue
+        if item_keys is None:
+            digest_stats[key] = stats[key]
+        else:
+            digest_stats[key] = [
+                {item_key: item[item_key] for item_key in item_keys if item_key in item}
+                for item in stats[key]
+            ]
+    return {
+        "Results": [{key: results[key] for key in PROFILE_SNAPSHOT_RESULT_KEYS if key in results}],
+        "Stats": digest_stats,
+    }
+
+
+def profiles_digest(user_data):
+    """Return the compact form of every tracked profile."""
+    return {
+        account_id: profile_digest(profile_data)
+        for account_id, profile_data in user_data.items()
+    }
+
+
+class WarframeSnapshotStore:
+    """Debounced Store holding the last data a coordinator received."""
+
+    def __init__(self, hass, key, digest):
+        self._store = Store(hass, SNAPSHOT_STORAGE_VERSION, key)
+        self._digest = digest
+        self._data = None
+
+    async def async_load(self):
+        """Return the last saved snapshot, or None."""
+        return await self._store.async_load()
+
+    @callback
+    def async_save(self, data):
+        """Schedule a save of the newest data.
+
+        Only the newest data is kept, so bursts of updates result in a single
+        write and the digest is only built when the write happens.
+        """
+        self._data = data
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self):
+        """Write a scheduled save now, so nothing is left behind on unload."""
+        if self._data is None:
+            return
+        data = self._data
+        self._data = None
+        await self._store.async_save(self._digest(data))
+
+    @callback
+    def _data_to_save(self):
+        return self._digest(self._data)
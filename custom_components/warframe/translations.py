@@ -0,0 +1,205 @@
+"""Translation tables of the Warframe API, loaded the first time they are needed."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    DOMAIN,
+    URL_TRANSLATION_FACTIONS_ENDPOINT,
+    URL_TRANSLATION_FISSURE_MODIFERS_ENDPOINT,
+    URL_TRANSLATION_MISSION_TYPES_ENDPOINT,
+    URL_TRANSLATION_SOL_NODES_ENDPOINT,
+    URL_TRANSLATION_SORTIES_ENDPOINT,
+    URL_TRANSLATION_SYNDICATES_ENDPOINT,
+    URL_TRANSLATION_WARFRAME_ENDPOINT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TRANSLATIONS_STORAGE_VERSION = 1
+
+TRANSLATION_SORTIES = "sortie"
+TRANSLATION_ABILITIES = "abilities"
+TRANSLATION_FACTIONS = "factions"
+TRANSLATION_NODES = "nodes"
+TRANSLATION_FISSURE_MODIFIERS = "fissure_modifiers"
+TRANSLATION_SYNDICATES = "syndicates"
+TRANSLATION_MISSION_TYPES = "mission_types"
+
+
+def build_value_table(data):
+    """Return the entries of a plain ``{key: {"value": ...}}`` endpoint."""
+    if not isinstance(data, dict):
+        return {}
+    return {
+        key.lower(): value
+        for key, value in data.items()
+        if isinstance(key, str) and isinstance(value, dict) and value.get("value")
+    }
+
+
+def build_sortie_table(sorties_data):
+    """Return the sortie modifiers and bosses.
+
+    Modifiers are found by their key and by their name, the worldstate only
+    names the modifier of a sortie mission.
+    """
+    if not isinstance(sorties_data, dict):
+        return {}
+    table = {}
+    modifier_types = sorties_data.get("modifierTypes", {})
+    modifier_descriptions = sorties_data.get("modifierDescriptions", {})
+    for modifier_key, modifier_value in modifier_types.items():
+        modifier = {"value": modifier_value}
+        if modifier_key in modifier_descriptions:
+            modifier["description"] = modifier_descriptions[modifier_key]
+        table[modifier_key.lower()] = modifier
+        table.setdefault(str(modifier_value).lower(), modifier)
+    for boss_key, boss_value in sorties_data.get("bosses", {}).items():
+        table[boss_key.lower()] = {"value": boss_value}
+    return table
+
+
+def build_ability_table(warframe_data):
+    """Return the abilities of every warframe by their unique name."""
+    table = {}
+    for warframe_entity in warframe_data if isinstance(warframe_data, list) else []:
+        if not isinstance(warframe_entity, dict):
+            continue
+        for ability in warframe_entity.get("abilities") or []:
+            if ability.get("uniqueName") and ability.get("name"):
+                table[ability["uniqueName"].lower()] = {
+                    "value": ability.get("name"),
+                    "description": ability.get("description"),
+                }
+    return table
+
+
+class TranslationTable:
+    """Where a translation table is fetched from and how long it stays fresh."""
+
+    __slots__ = ("endpoint", "max_age", "build")
+
+    def __init__(self, endpoint, max_age, build=build_value_table):
+        self.endpoint = endpoint
+        self.max_age = max_age
+        self.build = build
+
+
+# Node names and abilities change with updates, the rest hardly ever
+TRANSLATION_TABLES = {
+    TRANSLATION_SORTIES: TranslationTable(URL_TRANSLATION_SORTIES_ENDPOINT, timedelta(days=7), build_sortie_table),
+    TRANSLATION_ABILITIES: TranslationTable(URL_TRANSLATION_WARFRAME_ENDPOINT, timedelta(days=1), build_ability_table),
+    TRANSLATION_FACTIONS: TranslationTable(URL_TRANSLATION_FACTIONS_ENDPOINT, timedelta(days=30)),
+    TRANSLATION_NODES: TranslationTable(URL_TRANSLATION_SOL_NODES_ENDPOINT, timedelta(days=1)),
+    TRANSLATION_FISSURE_MODIFIERS: TranslationTable(URL_TRANSLATION_FISSURE_MODIFERS_ENDPOINT, timedelta(days=30)),
+    TRANSLATION_SYNDICATES: TranslationTable(URL_TRANSLATION_SYNDICATES_ENDPOINT, timedelta(days=30)),
+    TRANSLATION_MISSION_TYPES: TranslationTable(URL_TRANSLATION_MISSION_TYPES_ENDPOINT, timedelta(days=30)),
+}
+
+
+class WarframeTranslations:
+    """Translation tables kept apart from the catalog and loaded on demand.
+
+    A table is only fetched once something asks for it, so installations
+    without the sensors that need it never download it. Tables asked for
+    together are fetched concurrently and each is cached on disk with the
+    time it was fetched, a cached table is used until it is older than its
+    ``max_age``. ``fetch(url)`` downloads and decodes an endpoint.
+    """
+
+    def __init__(self, hass, api_url, fetch):
+        self.hass = hass
+        self.api_url = api_url
+        self.tables = {}
+        # Bumped whenever a table changes, resolved names are cached by it
+        self.version = 0
+        self._fetch = fetch
+        self._fetched = {}
+        self._loading = {}
+
+    def is_fresh(self, domain):
+        """Return whether the table of ``domain`` is loaded and not too old."""
+        fetched = self._fetched.get(domain)
+        return (
+            domain in self.tables
+            and fetched is not None
+            and time.time() - fetched < TRANSLATION_TABLES[domain].max_age.total_seconds()
+        )
+
+    async def async_load(self, *domains):
+        """Load the tables of ``domains`` that are missing or stale.
+
+        Concurrent calls share the download of a table. A table that cannot
+        be fetched keeps its last version until the next call.
+        """
+        tasks = []
+        for domain in domains:
+            if self.is_fresh(domain):
+                continue
+            task = self._loading.get(domain)
+            if task is None:
+                task = self._loading[domain] = self.hass.async_create_background_task(
+                    self._async_load_table(domain), f"warframe-translations-{domain}"
+                )
+            tasks.append(task)
+        if tasks:
+            # Waiting is cancelled with the caller, the downloads are not
+            await asyncio.wait(tasks)
+
+    async def async_refresh(self):
+        """Reload the stale tables among the ones loaded so far."""
+        await self.async_load(*self.tables)
+
+    def clear(self):
+        """Let go of every table, cancelling the downloads still running."""
+        for task in self._loading.values():
+            task.cancel()
+        self._loading = {}
+        self.tables = {}
+        self._fetched = {}
+        self.version += 1
+
+    def _store(self, domain):
+        return Store(self.hass, TRANSLATIONS_STORAGE_VERSION, f"{DOMAIN}.translations.{domain}")
+
+    def _set_table(self, domain, table, fetched):
+        if self.tables.get(domain) != table:
+            self.tables[domain] = table
+            self.version += 1
+        self._fetched[domain] = fetched
+
+    async def _async_load_table(self, domain):
+        store = self._store(domain)
+        try:
+            if domain not in self.tables:
+                cached = await store.async_load()
+                # A table of another API is not used
+                if cached and cached.get("url") == self.api_url:
+                    self._set_table(domain, cached["table"], cached["fetched"])
+                    if self.is_fresh(domain):
+                        return
+
+            try:
+                data = await self._fetch(f"{self.api_url}{TRANSLATION_TABLES[domain].endpoint}")
+            except UpdateFailed as err:
+                _LOGGER.warning("Could not fetch the %s translations: %s", domain, err)
+                return
+
+            table = TRANSLATION_TABLES[domain].build(data)
+            if not table:
+                _LOGGER.warning("The %s translations of %s are empty", domain, self.api_url)
+                return
+            fetched = time.time()
+            self._set_table(domain, table, fetched)
+            await store.async_save({"url": self.api_url, "fetched": fetched, "table": table})
+        finally:
+            if self._loading.get(domain) is asyncio.current_task():
+                del self._loading[domain]
@@ -0,0 +1,123 @@
+"""Reward watchlist matched against every worldstate packet."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import re
+
+from homeassistant.core import callback
+
+from .const import DOMAIN
+
+EVENT_WATCHLIST_MATCH = f"{DOMAIN}_watchlist_match"
+
+SOURCE_BOUNTY = "bounty"
+SOURCE_ALERT = "alert"
+SOURCE_INVASION = "invasion"
+SOURCE_VOID_TRADER = "void_trader"
+SOURCE_VARZIA = "varzia"
+
+# "3x Orokin Catalyst", "2 Detonite Injector"
+QUANTITY_PREFIX = re.compile(r"^\d[\d,]*\s*x?\s+")
+NOT_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_item_name(name):
+    """Return the key an item name is matched by.
+
+    Case, quantities, spaces and punctuation are ignored, so "2x Theorem
+    Infection" and "TheoremInfection" both match "Theorem Infection".
+    """
+    name = QUANTITY_PREFIX.sub("", name.strip().casefold())
+    return NOT_ALPHANUMERIC.sub("", name)
+
+
+def _reward_names(reward):
+    if not reward:
+        return
+    if reward.get("itemString"):
+        yield reward["itemString"]
+    for item in reward.get("items") or []:
+        yield item
+    for counted_item in reward.get("countedItems") or []:
+        yield counted_item.get("type")
+
+
+def _rewards(world_state_data):
+    """Yield every reward of a packet with where it was found."""
+    for syndicate in world_state_data.get("syndicateMissions") or []:
+        for job in syndicate.get("jobs") or []:
+            context = {"syndicate": syndicate.get("syndicate"), "job": job.get("type")}
+            for reward in job.get("rewardPool") or []:
+                yield SOURCE_BOUNTY, reward, context
+    for alert in world_state_data.get("alerts") or []:
+        mission = alert.get("mission") or {}
+        context = {"node": mission.get("node"), "expiry": alert.get("expiry")}
+        for reward in _reward_names(mission.get("reward")):
+            yield SOURCE_ALERT, reward, context
+    for invasion in world_state_data.get("invasions") or []:
+        if invasion.get("completed"):
+            continue
+        context = {"node": invasion.get("node")}
+        for side in ("attacker", "defender"):
+            for reward in _reward_names((invasion.get(side) or {}).get("reward")):
+                yield SOURCE_INVASION, reward, context
+    for source, key in ((SOURCE_VOID_TRADER, "voidTrader"), (SOURCE_VARZIA, "vaultTrader")):
+        trader = world_state_data.get(key) or {}
+        context = {"expiry": trader.get("expiry")}
+        for item in trader.get("inventory") or []:
+            yield source, item.get("item"), context
+
+
+class WarframeWatchlist:
+    """Matches the rewards of every packet against the watched items.
+
+    The watched names are compiled once into a dict keyed by their
+    normalized name, so every reward costs one (cached) normalization and
+    one lookup no matter how many items are watched. Match events carry
+    the ``entry_id`` of the config entry the watchlist belongs to.
+    """
+
+    def __init__(self, hass, items, entry_id=None):
+        self.hass = hass
+        self.entry_id = entry_id
+        self.watched = {}
+        for item in items or []:
+            key = normalize_item_name(item)
+            if key:
+                self.watched[key] = item.strip()
+        self.matches = []
+        self._match_keys = None
+
+    @callback
+    def async_update(self, world_state_data):
+        """Match a packet and fire an event for every new match."""
+        if not self.watched or not world_state_data:
+            return
+
+        matches = []
+        match_keys = set()
+        for source, reward, context in _rewards(world_state_data):
+            if not reward:
+                continue
+            item = self.watched.get(normalize_item_name(reward))
+            if item is None:
+                continue
+            match = {"item": item, "source": source, "reward": reward} | context
+            match_key = (source, reward, *context.values())
+            if match_key in match_keys:
+                continue
+            match_keys.add(match_key)
+            matches.append(match)
+            # No events for what was already available at startup
+            if self._match_keys is not None and match_key not in self._match_keys:
+                self.hass.bus.async_fire(EVENT_WATCHLIST_MATCH, match | {"config_entry_id": self.entry_id})
+
+        self.matches = matches
+        self._match_keys = match_keys
+
+    @property
+    def matched_items(self):
+        """Return the watched items found in the last packet."""
+        return sorted({match["item"] for match in self.matches})
@@ -0,0 +1,472 @@
+"""One worldstate WebSocket shared by every platform and language."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import socket
+import time
+
+import aiohttp
+from yarl import URL
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, callback
+
+from .const import DOMAIN
+from .metrics import (
+    METRIC_DECODE_TIME,
+    METRIC_FRAMES_COALESCED,
+    METRIC_FRAMES_DROPPED,
+    METRIC_READ_TIME,
+    METRIC_WIRE_BYTES,
+)
+from .session import async_get_session
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_WORLDSTATE_SOCKETS = f"{DOMAIN}_worldstate_sockets"
+
+EVENT_WORLDSTATE_UPDATE = "ws:update"
+
+# "event", "platform" and "language" are sent ahead of the packet's data
+HEADER_FIELD = re.compile(r'"(event|platform|language)"\s*:\s*"([^"]*)"')
+
+# Window bits asked for with permessage-deflate, 0 sends no offer
+WEBSOCKET_COMPRESS = 15
+
+# aiohttp releases whose WebSocket parser the wire counter was checked against
+WIRE_COUNTER_AIOHTTP = ("3.10.", "3.11.", "3.12.", "3.13.")
+
+
+def peek_frame(raw):
+    """Return the event, platform and language of a raw frame.
+
+    Only the part of the frame before the packet's data is searched, so
+    frames for platforms and languages nobody subscribed to are dropped
+    without decoding them. Returns None when the header is not found there.
+    """
+    end = raw.find('"data"')
+    fields = dict(HEADER_FIELD.findall(raw if end == -1 else raw[:end]))
+    try:
+        return fields["event"], fields["platform"], fields["language"]
+    except KeyError:
+        return None
+
+
+def _decode_frame(raw):
+    """Return the message of a raw frame, None when it is not a JSON object."""
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def _decoded_header(message):
+    packet = message.get("packet")
+    if not isinstance(packet, dict):
+        packet = {}
+    return message.get("event"), packet.get("platform"), packet.get("language")
+
+
+class StringTable:
+    """Shares equal strings between the packets of every platform and language.
+
+    Ids, timestamps, unique names and untranslated text are the same in the
+    packets of every route, with the table they are kept once. Strings are
+    kept for two generations, a generation ends when a route sends its next
+    packet, so strings of expired items are let go of (unlike ``sys.intern``
+    which keeps them for good on Python 3.12).
+    """
+
+    def __init__(self):
+        self._current = {}
+        self._previous = {}
+        self._routes = set()
+
+    def intern_packet(self, route, value):
+        """Return ``value`` with its keys and strings taken from the table."""
+        if route in self._routes:
+            self._previous = self._current
+            self._current = {}
+            self._routes = set()
+        self._routes.add(route)
+        return self._intern(value)
+
+    def _intern_string(self, value):
+        string = self._current.get(value)
+        if string is None:
+            string = self._previous.get(value, value)
+            self._current[string] = string
+        return string
+
+    def _intern(self, value):
+        if isinstance(value, str):
+            return self._intern_string(value)
+        if isinstance(value, dict):
+            return {self._intern_string(key): self._intern(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._intern(item) for item in value]
+        return value
+
+
+class WireCounter:
+    """Counts the bytes and CPU time of a WebSocket before its frames are decoded.
+
+    Wraps the parser aiohttp feeds the bytes read from the transport, so
+    bytes are counted as they crossed the wire (compressed when
+    permessage-deflate was negotiated) and the time covers unmasking and
+    inflating them. A read can hold several frames, so the totals are right
+    rather than every single frame (frames read along with the handshake are
+    not counted at all). aiohttp has no public hook for this, so the counter
+    is only installed on the aiohttp releases it was checked against, and
+    the metrics are reported as unavailable elsewhere.
+    """
+
+    _unavailable_logged = False
+
+    def __init__(self, parser):
+        self._parser = parser
+        self.bytes = 0
+        self.time = 0.0
+
+    @classmethod
+    def install(cls, client):
+        """Count the bytes of ``client``.
+
+        Returns the counter and None, or None and why it cannot be installed.
+        """
+        protocol = getattr(getattr(client, "_conn", None), "protocol", None)
+        parser = getattr(protocol, "_payload_parser", None)
+        reason = None
+        if not aiohttp.__version__.startswith(WIRE_COUNTER_AIOHTTP):
+            reason = f"Not checked against aiohttp {aiohttp.__version__}"
+        elif not hasattr(parser, "feed_data"):
+            reason = f"The WebSocket parser of aiohttp {aiohttp.__version__} could not be reached"
+        if reason is not None:
+            if not cls._unavailable_logged:
+                cls._unavailable_logged = True
+                _LOGGER.info("WebSocket wire bytes and read time are not recorded: %s", reason)
+            return None, reason
+        counter = protocol._payload_parser = cls(parser)
+        return counter, None
+
+    def feed_data(self, data):
+        start = time.perf_counter()
+        try:
+            return self._parser.feed_data(data)
+        finally:
+            self.time += time.perf_counter() - start
+            self.bytes += len(data)
+
+    def feed_eof(self):
+        return self._parser.feed_eof()
+
+    def take(self):
+        """Return the bytes and seconds since the last call."""
+        wire = (self.bytes, self.time)
+        self.bytes = 0
+        self.time = 0.0
+        return wire
+
+
+def _set_wire_metrics(coordinator, reason):
+    for metric in (METRIC_WIRE_BYTES, METRIC_READ_TIME):
+        coordinator.metrics.set_unavailable(metric, reason)
+
+
+@callback
+def async_dispatch_frame(raw, routes, strings, wire_bytes=None, read_time=None, queue=None):
+    """Hand a raw frame to the coordinators subscribed to its route.
+
+    ``routes`` maps ``(platform, language)`` to coordinators. The frame is
+    decoded once, however many coordinators share its route. ``wire_bytes``
+    and ``read_time`` are what the frame cost to read from the socket. With a
+    ``queue`` the frame waits there for its turn rather than being processed
+    straight away.
+    """
+    subscribers = [coordinator for coordinators in routes.values() for coordinator in coordinators]
+    for coordinator in subscribers:
+        coordinator.async_frame_received(raw, wire_bytes, read_time)
+
+    message = None
+    decode_time = 0.0
+    header = peek_frame(raw)
+    if header is None:
+        start = time.perf_counter()
+        message = _decode_frame(raw)
+        decode_time = time.perf_counter() - start
+        if message is None:
+            # A malformed frame is dropped, the socket keeps reading
+            _LOGGER.debug("Dropped a WebSocket frame that is not a JSON object")
+            for coordinator in subscribers:
+                coordinator.metrics.increment(METRIC_FRAMES_DROPPED)
+            return
+        header = _decoded_header(message)
+
+    event, platform, language = header
+    route = (platform, language)
+    routed = routes.get(route, []) if event == EVENT_WORLDSTATE_UPDATE else []
+    if routed:
+        if queue is not None:
+            queue.async_put(route, raw, message, decode_time)
+        else:
+            async_process_frame(raw, message, routed, strings, route, decode_time)
+
+    for coordinator in subscribers:
+        if coordinator not in routed:
+            coordinator.metrics.increment(METRIC_FRAMES_DROPPED)
+
+
+@callback
+def async_process_frame(raw, message, routed, strings, route, decode_time=0.0):
+    """Decode a worldstate frame and hand its packet to the coordinators of its route."""
+    start = time.perf_counter()
+    if message is None:
+        message = _decode_frame(raw)
+    packet = message.get("packet") if message is not None else None
+    if not isinstance(packet, dict):
+        _LOGGER.debug("Dropped a worldstate frame without a packet")
+        for coordinator in routed:
+            coordinator.metrics.increment(METRIC_FRAMES_DROPPED)
+        return
+    world_state_data = strings.intern_packet(route, packet.get("data"))
+    decode_time += time.perf_counter() - start
+    for coordinator in routed:
+        coordinator.metrics.record_time(METRIC_DECODE_TIME, decode_time)
+        coordinator._handle_packet(world_state_data)
+
+
+class FrameQueue:
+    """Latest-wins queue between the socket and the coordinators.
+
+    Holds at most one frame per route. A frame arriving while an older one
+    of its route is still waiting replaces it undecoded, so a burst (the
+    replay after a reconnect, or every platform and language at once) is
+    cut down to its newest frame per route. A route is processed at most
+    once per the shortest ``frame_interval`` of its coordinators, and never
+    in the middle of reading a burst, so a slow consumer never builds up a
+    backlog.
+    """
+
+    def __init__(self, hass, routes, strings):
+        self.hass = hass
+        self.routes = routes
+        self.strings = strings
+        # route -> (raw, message, decode_time)
+        self._pending = {}
+        self._handles = {}
+        self._processed = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def _interval(self, route):
+        return min((coordinator.frame_interval for coordinator in self.routes.get(route, [])), default=0)
+
+    @callback
+    def async_put(self, route, raw, message=None, decode_time=0.0):
+        """Queue the frame of a route, replacing the one waiting."""
+        if route in self._pending:
+            for coordinator in self.routes.get(route, []):
+                coordinator.metrics.increment(METRIC_FRAMES_COALESCED)
+        self._pending[route] = (raw, message, decode_time)
+        if route in self._handles:
+            return
+        processed = self._processed.get(route)
+        now = self.hass.loop.time()
+        delay = 0.0 if processed is None else max(0.0, processed + self._interval(route) - now)
+        self._handles[route] = self.hass.loop.call_later(delay, self._async_process, route)
+
+    @callback
+    def _async_process(self, route):
+        self._handles.pop(route, None)
+        pending = self._pending.pop(route, None)
+        routed = self.routes.get(route, [])
+        if pending is None or not routed:
+            return
+        self._processed[route] = self.hass.loop.time()
+        async_process_frame(pending[0], pending[1], routed, self.strings, route, pending[2])
+
+    @callback
+    def async_discard(self, route=None):
+        """Drop the waiting frames of a route, or of every route."""
+        routes = set(self._pending) | set(self._processed) if route is None else {route}
+        for queued_route in routes:
+            handle = self._handles.pop(queued_route, None)
+            if handle is not None:
+                handle.cancel()
+            self._pending.pop(queued_route, None)
+            self._processed.pop(queued_route, None)
+
+
+@callback
+def async_get_worldstate_socket(hass, url, compress=True):
+    """Return the shared socket for ``url``, created on first use."""
+    sockets = hass.data.setdefault(DATA_WORLDSTATE_SOCKETS, {})
+    key = (url, compress)
+    worldstate_socket = sockets.get(key)
+    if worldstate_socket is None:
+        worldstate_socket = sockets[key] = WarframeWorldstateSocket(hass, url, compress)
+    return worldstate_socket
+
+
+class WarframeWorldstateSocket:
+    """A WebSocket connection shared by the worldstate coordinators.
+
+    Coordinators subscribe to a platform and language, and every frame is
+    routed to the coordinators of its route. Adding a platform or language
+    never opens another connection. The connection is closed once the last
+    coordinator unsubscribes. With ``compress`` permessage-deflate is offered
+    to the server, frames are only compressed when the server accepts it.
+    Frames wait in a :class:`FrameQueue` for their route's turn.
+    """
+
+    def __init__(self, hass, url, compress=True):
+        self.hass = hass
+        self.key = (url, compress)
+        self.url = URL(url)
+        self.compress = WEBSOCKET_COMPRESS if compress else 0
+        self.routes = {}
+        self.strings = StringTable()
+        self.queue = FrameQueue(hass, self.routes, self.strings)
+        self._client: aiohttp.ClientWebSocketResponse | None = None
+        self._wire: WireCounter | None = None
+        # Why the wire metrics are not measured, None while they are
+        self.wire_unavailable = None
+        self._task: asyncio.Task | None = None
+        self._unsub_stop = None
+
+    @property
+    def connected(self):
+        return self._client is not None and not self._client.closed
+
+    @property
+    def negotiated_compression(self):
+        """Return the window bits the server accepted, 0 when uncompressed."""
+        return self._client.compress if self.connected else 0
+
+    @callback
+    def async_subscribe(self, platform, language, coordinator):
+        """Route the frames of a platform and language to a coordinator."""
+        route = (platform, language)
+        self.routes.setdefault(route, []).append(coordinator)
+        _set_wire_metrics(coordinator, self.wire_unavailable)
+
+        @callback
+        def unsubscribe():
+            coordinators = self.routes.get(route, [])
+            if coordinator in coordinators:
+                coordinators.remove(coordinator)
+            if not coordinators:
+                self.routes.pop(route, None)
+                self.queue.async_discard(route)
+            if not self.routes:
+                self._async_close()
+
+        return unsubscribe
+
+    @callback
+    def async_ensure_connected(self):
+        """Start listening unless the socket is already connecting or listening."""
+        if self._task is not None or not self.routes:
+            return
+
+        async def close_websocket(_: Event) -> None:
+            """Close WebSocket connection."""
+            self._unsub_stop = None
+            await self._disconnect()
+
+        # Clean disconnect WebSocket on Home Assistant shutdown
+        if self._unsub_stop is None:
+            self._unsub_stop = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, close_websocket
+            )
+        self._task = self.hass.async_create_background_task(
+            self._listen_task(), "warframe-ws-listen"
+        )
+
+    @callback
+    def _async_close(self):
+        sockets = self.hass.data.get(DATA_WORLDSTATE_SOCKETS, {})
+        if sockets.get(self.key) is self:
+            del sockets[self.key]
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        self.queue.async_discard()
+        if self._task is not None:
+            # The task disconnects on its way out
+            self._task.cancel()
+
+    async def _listen_task(self):
+        try:
+            await self._connect()
+            if self.connected:
+                await self._listen()
+        except Exception as err:
+            for coordinator in self._subscribers():
+                coordinator.last_update_success = False
+            _LOGGER.error(err)
+        finally:
+            # Ensure we are disconnected
+            await self._disconnect()
+            self._task = None
+
+    def _subscribers(self):
+        return [coordinator for coordinators in self.routes.values() for coordinator in coordinators]
+
+    async def _connect(self):
+        try:
+            self._client = await async_get_session(self.hass).ws_connect(
+                url=self.url, heartbeat=30, compress=self.compress
+            )
+        except (
+            aiohttp.WSServerHandshakeError,
+            aiohttp.ClientConnectionError,
+            socket.gaierror,
+        ):
+            msg = (
+                "Error occurred while communicating with Warframe API"
+                f" on WebSocket at {self.url.host}"
+            )
+            _LOGGER.error(msg)
+            return
+        self._wire, self.wire_unavailable = WireCounter.install(self._client)
+        for coordinator in self._subscribers():
+            _set_wire_metrics(coordinator, self.wire_unavailable)
+
+    async def _listen(self):
+        _LOGGER.info("_listen")
+        while not self._client.closed:
+            message = await self._client.receive()
+
+            if message.type == aiohttp.WSMsgType.ERROR:
+                _LOGGER.error(self._client.exception())
+
+            if message.type == aiohttp.WSMsgType.TEXT:
+                wire_bytes, read_time = self._wire.take() if self._wire is not None else (None, None)
+                async_dispatch_frame(
+                    message.data, self.routes, self.strings, wire_bytes, read_time, self.queue
+                )
+
+            if message.type in (
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.CLOSING,
+            ):
+                msg = f"Connection to the Warframe WebSocket on {self.url.host} has been closed"
+                _LOGGER.error(self._client.exception())
+                _LOGGER.error(msg)
+
+    async def _disconnect(self):
+        _LOGGER.info("_disconnect")
+        for coordinator in self._subscribers():
+            await coordinator.async_flush_recorder()
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._wire = None